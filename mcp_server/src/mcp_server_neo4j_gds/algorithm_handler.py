@@ -2,13 +2,22 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any
 from graphdatascience import GraphDataScience
 
+from .dispatch_cache import dispatch_cache
+from .gds import is_session_gds
+from .job_control import current_job_id
+from .memory_estimate import admit_algorithm
+from .result_limits import pushed_down_ordering
 
-def clean_params(arguments: Dict[str, Any], forbidden):
-    if len(forbidden) == 0:
-        return arguments
+
+def clean_params(arguments: Dict[str, Any], forbidden, tag_job: bool = True):
     params = {
         k: v for k, v in arguments.items() if v is not None and k not in forbidden
     }
+    # Tag the algorithm run so a cancelled tool call can terminate it; model
+    # training configurations are left as given
+    job_id = current_job_id()
+    if tag_job and job_id is not None:
+        params.setdefault("jobId", job_id)
     return params
 
 
@@ -16,6 +25,37 @@ class AlgorithmHandler(ABC):
     def __init__(self, gds: GraphDataScience):
         self.gds = gds
 
+    def get_graph(self, graph_name: str):
+        """The catalog Graph named ``graph_name``, cached per connection."""
+        return dispatch_cache.graph(self.gds, graph_name)
+
+    def stream(self, algorithm, procedure, G, params, columns):
+        """Stream ``algorithm`` on ``G``, e.g. gds.pageRank as "gds.pageRank".
+
+        On a plugin a requested ``limit`` is pushed into the query as
+        ORDER BY ... LIMIT, so only those rows leave the database; sessions
+        stream every row and the selection happens on arrival.
+        """
+        ordering = pushed_down_ordering(columns)
+        if ordering is None or is_session_gds(self.gds):
+            return algorithm.stream(G, **params)
+        limit, order_by, ascending = ordering
+        yielded = ", ".join(columns)
+        order = ""
+        if order_by is not None:
+            order = f"ORDER BY {order_by} {'ASC' if ascending else 'DESC'}"
+        return self.gds.run_cypher(
+            f"""
+            CALL {procedure}.stream($graph_name, $config) YIELD {yielded}
+            RETURN {yielded} {order} LIMIT $limit
+            """,
+            params={"graph_name": G.name(), "config": params, "limit": limit},
+        )
+
+    def admit_memory(self, algorithm, G, mode, params):
+        """Check the memory estimate of the run the handler is about to start."""
+        admit_algorithm(self.gds, algorithm, G, mode, params)
+
     @abstractmethod
     def execute(self, arguments: Dict[str, Any]) -> Any:
         pass
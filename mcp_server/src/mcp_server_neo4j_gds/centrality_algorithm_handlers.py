@@ -4,10 +4,12 @@ from typing import Any, Dict
 from .algorithm_handler import AlgorithmHandler, clean_params
 
 from .node_translator import (
+    NodeNamePipeline,
     filter_identifiers,
     translate_ids_to_identifiers,
     translate_identifiers_to_ids,
 )
+from .result_summary import centrality_summary
 
 logger = logging.getLogger("mcp_server_neo4j_gds")
 
@@ -19,7 +21,7 @@ class ArticleRankHandler(AlgorithmHandler):
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
         source_nodes = kwargs.get("sourceNodes", None)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs,
             [
@@ -39,15 +41,20 @@ class ArticleRankHandler(AlgorithmHandler):
         )
 
         logger.info(f"ArticleRank parameters: {gds_params}")
+        self.admit_memory(self.gds.articleRank, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.articleRank.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.articleRank, G, gds_params)
         else:
             result = self.gds.articleRank.stream(G, **gds_params)
             logger.info(f"Filtering ArticleRank results for nodes: {node_names}")
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -71,7 +78,7 @@ class ArticulationPointsHandler(AlgorithmHandler):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -80,7 +87,9 @@ class ArticulationPointsHandler(AlgorithmHandler):
             result = self.gds.articulationPoints.mutate(G, **gds_params)
         else:
             result = self.gds.articulationPoints.stream(G)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -99,20 +108,34 @@ class BetweennessCentralityHandler(AlgorithmHandler):
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
         logger.info(f"Betweenness centrality parameters: {gds_params}")
+        self.admit_memory(self.gds.betweenness, G, mode, gds_params)
 
         if mode == "mutate":
             result = self.gds.betweenness.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.betweenness, G, gds_params)
         else:
-            result = self.gds.betweenness.stream(G, **gds_params)
+            if node_names is None:
+                result = self.stream(
+                    self.gds.betweenness,
+                    "gds.betweenness",
+                    G,
+                    gds_params,
+                    ["nodeId", "score"],
+                )
+            else:
+                result = self.gds.betweenness.stream(G, **gds_params)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -132,15 +155,14 @@ class BridgesHandler(AlgorithmHandler):
     def bridges(self, **kwargs):
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
 
         result = self.gds.bridges.stream(G)
-        translate_ids_to_identifiers(
-            self.gds, node_identifier_property, result, "from", "fromName"
-        )
-        translate_ids_to_identifiers(
-            self.gds, node_identifier_property, result, "to", "toName"
-        )
+        result = NodeNamePipeline(
+            self.gds,
+            node_identifier_property,
+            [("from", "fromName"), ("to", "toName")],
+        ).apply(result)
 
         return result
 
@@ -158,7 +180,7 @@ class CELFHandler(AlgorithmHandler):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -168,7 +190,9 @@ class CELFHandler(AlgorithmHandler):
             result = self.gds.influenceMaximization.celf.mutate(G, **gds_params)
         else:
             result = self.gds.influenceMaximization.celf.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -190,20 +214,25 @@ class ClosenessCentralityHandler(AlgorithmHandler):
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
         logger.info(f"Closeness centrality parameters: {gds_params}")
+        self.admit_memory(self.gds.closeness, G, mode, gds_params)
 
         if mode == "mutate":
             result = self.gds.closeness.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.closeness, G, gds_params)
         else:
             result = self.gds.closeness.stream(G, **gds_params)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -224,20 +253,25 @@ class DegreeCentralityHandler(AlgorithmHandler):
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
         logger.info(f"Degree centrality parameters: {gds_params}")
+        self.admit_memory(self.gds.degree, G, mode, gds_params)
 
         if mode == "mutate":
             result = self.gds.degree.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.degree, G, gds_params)
         else:
             result = self.gds.degree.stream(G, **gds_params)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -260,7 +294,7 @@ class EigenvectorCentralityHandler(AlgorithmHandler):
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
         source_nodes = kwargs.get("sourceNodes", None)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs,
             [
@@ -280,14 +314,19 @@ class EigenvectorCentralityHandler(AlgorithmHandler):
         )
 
         logger.info(f"Eigenvector centrality parameters: {gds_params}")
+        self.admit_memory(self.gds.eigenvector, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.eigenvector.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.eigenvector, G, gds_params)
         else:
             result = self.gds.eigenvector.stream(G, **gds_params)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -313,7 +352,7 @@ class PageRankHandler(AlgorithmHandler):
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
         source_nodes = kwargs.get("sourceNodes", None)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs,
             [
@@ -333,14 +372,28 @@ class PageRankHandler(AlgorithmHandler):
         )
 
         logger.info(f"Pagerank parameters: {gds_params}")
+        self.admit_memory(self.gds.pageRank, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.pageRank.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.pageRank, G, gds_params)
         else:
-            result = self.gds.pageRank.stream(G, **gds_params)
+            if node_names is None:
+                result = self.stream(
+                    self.gds.pageRank,
+                    "gds.pageRank",
+                    G,
+                    gds_params,
+                    ["nodeId", "score"],
+                )
+            else:
+                result = self.gds.pageRank.stream(G, **gds_params)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -364,19 +417,23 @@ class HarmonicCentralityHandler(AlgorithmHandler):
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
 
         if mode == "mutate":
             result = self.gds.closeness.harmonic.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = centrality_summary(self.gds.closeness.harmonic, G, gds_params)
         else:
             result = self.gds.closeness.harmonic.stream(G)
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -396,7 +453,7 @@ class HITSHandler(AlgorithmHandler):
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
@@ -411,7 +468,9 @@ class HITSHandler(AlgorithmHandler):
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -14,8 +14,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -100,8 +100,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -200,8 +200,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -236,8 +236,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -284,8 +284,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -339,8 +339,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -389,8 +389,8 @@ centrality_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only score percentiles instead of per-node scores. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
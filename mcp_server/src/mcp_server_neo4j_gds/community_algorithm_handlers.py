@@ -4,6 +4,7 @@ from .node_translator import (
     filter_identifiers,
     translate_ids_to_identifiers,
 )
+from .result_summary import community_summary
 
 from .algorithm_handler import AlgorithmHandler, clean_params
 
@@ -12,7 +13,7 @@ logger = logging.getLogger("mcp_server_neo4j_gds")
 
 class ConductanceHandler(AlgorithmHandler):
     def conductance(self, **kwargs):
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(kwargs, ["graphName"])
         logger.info(f"Conductance parameters: {gds_params}")
         result = self.gds.conductance.stream(G, **gds_params)
@@ -30,7 +31,7 @@ class HDBSCANHandler(AlgorithmHandler):
     def hdbscan(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -39,7 +40,9 @@ class HDBSCANHandler(AlgorithmHandler):
             result = self.gds.hdbscan.mutate(G, **gds_params)
         else:
             result = self.gds.hdbscan.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -60,7 +63,7 @@ class KCoreDecompositionHandler(AlgorithmHandler):
     def k_core_decomposition(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -69,7 +72,9 @@ class KCoreDecompositionHandler(AlgorithmHandler):
             result = self.gds.kcore.mutate(G, **gds_params)
         else:
             result = self.gds.kcore.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
         return result
 
     def execute(self, arguments: Dict[str, Any]) -> Any:
@@ -85,7 +90,7 @@ class K1ColoringHandler(AlgorithmHandler):
     def k_1_coloring(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -94,7 +99,9 @@ class K1ColoringHandler(AlgorithmHandler):
             result = self.gds.k1coloring.mutate(G, **gds_params)
         else:
             result = self.gds.k1coloring.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -113,7 +120,7 @@ class KMeansClusteringHandler(AlgorithmHandler):
     def k_means_clustering(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -122,7 +129,9 @@ class KMeansClusteringHandler(AlgorithmHandler):
             result = self.gds.kmeans.mutate(G, **gds_params)
         else:
             result = self.gds.kmeans.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -147,16 +156,27 @@ class LabelPropagationHandler(AlgorithmHandler):
     def label_propagation(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Label Propagation parameters: {gds_params}")
+        self.admit_memory(self.gds.labelPropagation, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.labelPropagation.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = community_summary(
+                self.gds,
+                self.gds.labelPropagation,
+                "gds.labelPropagation",
+                G,
+                gds_params,
+            )
         else:
             result = self.gds.labelPropagation.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -179,16 +199,27 @@ class LeidenHandler(AlgorithmHandler):
     def leiden(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Leiden parameters: {gds_params}")
+        self.admit_memory(self.gds.leiden, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.leiden.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = community_summary(
+                self.gds,
+                self.gds.leiden,
+                "gds.leiden",
+                G,
+                gds_params,
+            )
         else:
             result = self.gds.leiden.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -215,11 +246,12 @@ class LocalClusteringCoefficientHandler(AlgorithmHandler):
         mode = kwargs.get("mode", "stream")
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty", "nodes"]
         )
         logger.info(f"Local Clustering Coefficient parameters: {gds_params}")
+        self.admit_memory(self.gds.localClusteringCoefficient, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.localClusteringCoefficient.mutate(G, **gds_params)
         else:
@@ -230,7 +262,9 @@ class LocalClusteringCoefficientHandler(AlgorithmHandler):
                 node_names,
                 result,
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -249,16 +283,33 @@ class LouvainHandler(AlgorithmHandler):
     def louvain(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Louvain parameters: {gds_params}")
+        self.admit_memory(self.gds.louvain, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.louvain.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = community_summary(
+                self.gds,
+                self.gds.louvain,
+                "gds.louvain",
+                G,
+                gds_params,
+            )
         else:
-            result = self.gds.louvain.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = self.stream(
+                self.gds.louvain,
+                "gds.louvain",
+                G,
+                gds_params,
+                ["nodeId", "communityId", "intermediateCommunityIds"],
+            )
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -283,7 +334,7 @@ class LouvainHandler(AlgorithmHandler):
 
 class ModularityMetricHandler(AlgorithmHandler):
     def modularity_metric(self, **kwargs):
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty"])
         logger.info(f"Modularity Metric parameters: {gds_params}")
         result = self.gds.modularity.stream(G, **gds_params)
@@ -302,7 +353,7 @@ class ModularityOptimizationHandler(AlgorithmHandler):
     def modularity_optimization(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -311,7 +362,9 @@ class ModularityOptimizationHandler(AlgorithmHandler):
             result = self.gds.modularityOptimization.mutate(G, **gds_params)
         else:
             result = self.gds.modularityOptimization.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -334,16 +387,27 @@ class StronglyConnectedComponentsHandler(AlgorithmHandler):
     def strongly_connected_components(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Strongly Connected Components parameters: {gds_params}")
         if mode == "mutate":
             result = self.gds.scc.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = community_summary(
+                self.gds,
+                self.gds.scc,
+                "gds.scc",
+                G,
+                gds_params,
+                id_column="componentId",
+            )
         else:
             result = self.gds.scc.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -362,11 +426,12 @@ class TriangleCountHandler(AlgorithmHandler):
         mode = kwargs.get("mode", "stream")
         node_names = kwargs.get("nodes", None)
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodes", "nodeIdentifierProperty"]
         )
         logger.info(f"Triangle Count parameters: {gds_params}")
+        self.admit_memory(self.gds.triangleCount, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.triangleCount.mutate(G, **gds_params)
         else:
@@ -374,7 +439,9 @@ class TriangleCountHandler(AlgorithmHandler):
             result = filter_identifiers(
                 self.gds, node_identifier_property, node_names, result
             )
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -393,16 +460,28 @@ class WeaklyConnectedComponentsHandler(AlgorithmHandler):
     def weakly_connected_components(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Weakly Connected Components parameters: {gds_params}")
+        self.admit_memory(self.gds.wcc, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.wcc.mutate(G, **gds_params)
+        elif mode == "summary":
+            result = community_summary(
+                self.gds,
+                self.gds.wcc,
+                "gds.wcc",
+                G,
+                gds_params,
+                id_column="componentId",
+            )
         else:
             result = self.gds.wcc.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -424,7 +503,7 @@ class ApproximateMaximumKCutHandler(AlgorithmHandler):
     def approximate_maximum_k_cut(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -433,7 +512,9 @@ class ApproximateMaximumKCutHandler(AlgorithmHandler):
             result = self.gds.maxkcut.mutate(G, **gds_params)
         else:
             result = self.gds.maxkcut.stream(G, **gds_params)
-            translate_ids_to_identifiers(self.gds, node_identifier_property, result)
+            result = translate_ids_to_identifiers(
+                self.gds, node_identifier_property, result
+            )
 
         return result
 
@@ -455,7 +536,7 @@ class SpeakerListenerLabelPropagationHandler(AlgorithmHandler):
     def speaker_listener_label_propagation(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         node_identifier_property = kwargs.get("nodeIdentifierProperty")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
@@ -464,7 +545,7 @@ class SpeakerListenerLabelPropagationHandler(AlgorithmHandler):
             result = self.gds.sllpa.mutate(G, **gds_params)
         else:
             result = self.gds.sllpa.stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds,
                 node_identifier_property,
                 result,
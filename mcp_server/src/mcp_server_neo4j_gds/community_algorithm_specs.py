@@ -236,8 +236,8 @@ community_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only the community count, a community size histogram and the largest communities. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -292,8 +292,8 @@ community_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only the community count, a community size histogram and the largest communities. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -393,8 +393,8 @@ community_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only the community count, a community size histogram and the largest communities. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -532,8 +532,8 @@ community_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only the community count, a community size histogram and the largest communities. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
@@ -610,8 +610,8 @@ community_tool_definitions = [
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["stream", "mutate"],
-                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties. Default is 'stream'.",
+                    "enum": ["stream", "mutate", "summary"],
+                    "description": "Execution mode: 'stream' returns results as a table, 'mutate' writes results to the in-memory graph as node properties, 'summary' returns only the community count, a community size histogram and the largest communities. Default is 'stream'.",
                 },
                 "mutateProperty": {
                     "type": "string",
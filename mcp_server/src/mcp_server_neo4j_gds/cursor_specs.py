@@ -0,0 +1,48 @@
+from mcp import types
+
+cursor_tool_definitions = [
+    types.Tool(
+        name="fetch_page",
+        description="Read more rows of a truncated stream result. "
+        "Stream tools called with keepCursor=true keep their full result on the server when it exceeds the row limit "
+        "and return a cursor id with the first page; fetch_page reads any further page without running the algorithm again, "
+        "and can filter or group the full result. Cursors expire after a period without reads.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cursor": {
+                    "type": "string",
+                    "description": "The cursor id returned with the truncated result.",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "0-based index of the first row to return. Default is 0.",
+                },
+                "size": {
+                    "type": "integer",
+                    "description": "Number of rows to return, at most the server's result row limit. Defaults to that limit.",
+                },
+                "where": {
+                    "type": "object",
+                    "description": "Only read rows whose column equals a value or lies within a range, "
+                    "e.g. {'column': 'communityId', 'equals': 42} or {'column': 'score', 'min': 0.5}. "
+                    "offset and size then apply to the matching rows.",
+                    "properties": {
+                        "column": {"type": "string"},
+                        "equals": {},
+                        "min": {"type": "number"},
+                        "max": {"type": "number"},
+                    },
+                    "required": ["column"],
+                },
+                "groupBy": {
+                    "type": "string",
+                    "description": "Return one row per value of this column instead of result rows, "
+                    "with the number of rows and the min, mean and max of every floating point column, "
+                    "largest groups first. E.g. 'communityId' for community sizes.",
+                },
+            },
+            "required": ["cursor"],
+        },
+    ),
+]
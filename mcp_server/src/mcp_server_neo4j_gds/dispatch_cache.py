@@ -0,0 +1,76 @@
+import logging
+import threading
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+
+class DispatchCache:
+    """Handler instances and catalog Graph objects per GDS connection.
+
+    Handlers only hold their connection, so one instance per tool can serve
+    every call. Graph objects are kept by name so that running an algorithm on
+    an existing graph does not start with a catalog round-trip. Entries must be
+    invalidated whenever a graph is dropped or re-projected, and when a
+    connection is closed.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._graphs = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def handler(self, name, gds, create):
+        """The handler for tool ``name`` on ``gds``, built with ``create(name, gds)``."""
+        key = (id(gds), name)
+        with self._lock:
+            entry = self._handlers.get(key)
+            if entry is not None and entry[0] is gds:
+                return entry[1]
+        handler = create(name, gds)
+        with self._lock:
+            self._handlers[key] = (gds, handler)
+        return handler
+
+    def graph(self, gds, graph_name):
+        """``gds.graph.get(graph_name)``, reusing the Graph object of an earlier call."""
+        key = (id(gds), graph_name)
+        with self._lock:
+            entry = self._graphs.get(key)
+            if entry is not None and entry[0] is gds:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        G = gds.graph.get(graph_name)
+        with self._lock:
+            self._graphs[key] = (gds, G)
+        return G
+
+    def invalidate_graph(self, gds, graph_name):
+        """Forget the Graph object of one graph, e.g. after it was dropped."""
+        with self._lock:
+            self._graphs.pop((id(gds), graph_name), None)
+
+    def invalidate(self, gds=None):
+        """Forget everything cached for one connection, or for all connections."""
+        with self._lock:
+            for entries in (self._handlers, self._graphs):
+                if gds is None:
+                    entries.clear()
+                    continue
+                for key in [key for key, entry in entries.items() if entry[0] is gds]:
+                    del entries[key]
+        logger.debug("Invalidated cached handlers and graphs")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "handlers": len(self._handlers),
+                "graphs": len(self._graphs),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+dispatch_cache = DispatchCache()
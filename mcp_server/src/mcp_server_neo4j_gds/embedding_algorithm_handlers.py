@@ -12,16 +12,19 @@ logger = logging.getLogger("mcp_server_neo4j_gds")
 class FastRPHandler(AlgorithmHandler):
     def fast_rp(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"FastRP parameters: {gds_params}")
+        self.admit_memory(self.gds.fastRP, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.fastRP.mutate(G, **gds_params)
         else:
-            result = self.gds.fastRP.stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = self.stream(
+                self.gds.fastRP, "gds.fastRP", G, gds_params, ["nodeId", "embedding"]
+            )
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -46,16 +49,17 @@ class FastRPHandler(AlgorithmHandler):
 class Node2VecHandler(AlgorithmHandler):
     def node2vec(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"Node2Vec parameters: {gds_params}")
+        self.admit_memory(self.gds.node2vec, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.node2vec.mutate(G, **gds_params)
         else:
             result = self.gds.node2vec.stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -87,16 +91,17 @@ class Node2VecHandler(AlgorithmHandler):
 class HashGNNHandler(AlgorithmHandler):
     def hashgnn(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs, ["graphName", "mode", "nodeIdentifierProperty"]
         )
         logger.info(f"HashGNN parameters: {gds_params}")
+        self.admit_memory(self.gds.hashgnn, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.hashgnn.mutate(G, **gds_params)
         else:
             result = self.gds.hashgnn.stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -121,8 +126,8 @@ class HashGNNHandler(AlgorithmHandler):
 
 class GraphSageTrainHandler(AlgorithmHandler):
     def graph_sage_train(self, **kwargs):
-        G = self.gds.graph.get(kwargs.get("graphName"))
-        gds_params = clean_params(kwargs, ["graphName"])
+        G = self.get_graph(kwargs.get("graphName"))
+        gds_params = clean_params(kwargs, ["graphName"], tag_job=False)
         logger.info(f"GraphSAGE train parameters: {gds_params}")
         model, result = self.gds.beta.graphSage.train(G, **gds_params)
         return {"modelName": model.name(), "trainResult": result.to_dict()}
@@ -154,7 +159,7 @@ class GraphSagePredictHandler(AlgorithmHandler):
     def graph_sage_predict(self, **kwargs):
         mode = kwargs.get("mode", "stream")
         model_name = kwargs.get("modelName")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         model = self.gds.model.get(model_name)
         if not isinstance(model, GraphSageModel):
             raise ValueError(
@@ -169,7 +174,7 @@ class GraphSagePredictHandler(AlgorithmHandler):
             result = model.predict_mutate(G, **gds_params)
         else:
             result = model.predict_stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -4,6 +4,8 @@ import uuid
 from contextlib import contextmanager
 import logging
 
+from .schema_cache import load_graph_schema_async, schema_cache
+
 logger = logging.getLogger("mcp_server_neo4j_gds")
 
 
@@ -59,18 +61,12 @@ def projected_graph(gds, node_labels=None, relationship_types=None, undirected=F
     graph_name = f"temp_graph_{uuid.uuid4().hex[:8]}"
 
     try:
-        # Get relationship properties (non-string)
-        rel_properties = get_relationship_properties_keys(gds, relationship_types)
-        valid_rel_properties = validate_rel_properties(
-            gds, rel_properties, node_labels, relationship_types
+        # Find the numeric relationship and node properties GDS can project
+        valid_rel_properties, valid_node_projection_properties = (
+            get_projectable_properties(gds, node_labels, relationship_types)
         )
         rel_prop_map = ", ".join(f"{prop}: r.{prop}" for prop in valid_rel_properties)
 
-        # Get node properties and validate to see which are compatible with GDS
-        node_properties = get_node_properties_keys(gds, node_labels)
-        valid_node_projection_properties = validate_node_properties(
-            gds, node_properties
-        )
         node_prop_map_source = create_source_projection_properties(
             valid_node_projection_properties
         )
@@ -170,23 +166,83 @@ def projected_graph(gds, node_labels=None, relationship_types=None, undirected=F
         gds.graph.drop(graph_name)
 
 
-def get_node_labels(gds: GraphDataScience):
-    query = """
+def get_projectable_properties(gds: GraphDataScience, node_labels, relationship_types):
+    """
+    Return (relationship properties, node properties) that GDS can project.
+
+    Answered from the cached database schema; if the schema procedures are not
+    available, every property key is validated with its own scan instead.
+    """
+    try:
+        schema = schema_cache.get(gds)
+        return (
+            schema.projectable_relationship_properties(relationship_types, node_labels),
+            schema.projectable_node_properties(node_labels),
+        )
+    except Exception as e:
+        logger.warning(f"Schema procedures failed, scanning property values: {e}")
+
+    rel_properties = get_relationship_properties_keys(
+        gds, relationship_types, exact=True
+    )
+    valid_rel_properties = validate_rel_properties(
+        gds, rel_properties, node_labels, relationship_types
+    )
+    node_properties = get_node_properties_keys(gds, node_labels, exact=True)
+    valid_node_properties = validate_node_properties(gds, node_properties)
+    return valid_rel_properties, valid_node_properties
+
+
+NODE_LABELS_QUERY = "CALL db.labels() YIELD label RETURN label ORDER BY label"
+RELATIONSHIP_TYPES_QUERY = """
+        CALL db.relationshipTypes() YIELD relationshipType
+        RETURN relationshipType ORDER BY relationshipType
+        """
+SCAN_NODE_LABELS_QUERY = """
                 MATCH (n)
                 WITH DISTINCT labels(n) AS labels
                 UNWIND labels AS label
                 WITH DISTINCT label
                 RETURN COLLECT(label) AS labels
             """
-    df = gds.run_cypher(query)
+
+
+def _collected(df, column):
     if df.empty:
         return []
-    return df["labels"].iloc[0]
+    return sorted(df[column].iloc[0])
+
+
+def get_node_labels(gds: GraphDataScience, exact=False):
+    if not exact:
+        try:
+            return schema_cache.cached(gds, "labels", _catalog_node_labels)
+        except Exception as e:
+            logger.warning(f"db.labels() failed, scanning nodes: {e}")
+    return _scan_node_labels(gds)
+
+
+def _catalog_node_labels(gds: GraphDataScience):
+    return gds.run_cypher(NODE_LABELS_QUERY)["label"].tolist()
 
 
-def get_node_properties_keys(gds: GraphDataScience, node_labels=None):
+def _scan_node_labels(gds: GraphDataScience):
+    return _collected(gds.run_cypher(SCAN_NODE_LABELS_QUERY), "labels")
+
+
+def get_node_properties_keys(gds: GraphDataScience, node_labels=None, exact=False):
     if node_labels is None:
         node_labels = []
+    if not exact:
+        try:
+            schema = schema_cache.get(gds)
+            return sorted(schema.node_property_keys(node_labels))
+        except Exception as e:
+            logger.warning(f"Schema procedures failed, scanning nodes: {e}")
+    return _scan_node_properties_keys(gds, node_labels)
+
+
+def _scan_node_properties_keys_query(node_labels):
     nodelabels_query = create_node_cypher_match_query(node_labels)
     property_extractor = """
                             WITH keys(properties(n)) AS prop_keys_list
@@ -194,17 +250,29 @@ def get_node_properties_keys(gds: GraphDataScience, node_labels=None):
                             WITH DISTINCT prop_keys
                             RETURN COLLECT(prop_keys) AS properties_keys
                         """
+    return nodelabels_query + property_extractor
 
-    query = nodelabels_query + property_extractor
-    df = gds.run_cypher(query)
-    if df.empty:
-        return []
-    return df["properties_keys"].iloc[0]
+
+def _scan_node_properties_keys(gds: GraphDataScience, node_labels):
+    df = gds.run_cypher(_scan_node_properties_keys_query(node_labels))
+    return _collected(df, "properties_keys")
 
 
-def get_relationship_properties_keys(gds: GraphDataScience, relationshipTypes=None):
+def get_relationship_properties_keys(
+    gds: GraphDataScience, relationshipTypes=None, exact=False
+):
     if relationshipTypes is None:
         relationshipTypes = []
+    if not exact:
+        try:
+            schema = schema_cache.get(gds)
+            return sorted(schema.relationship_property_keys(relationshipTypes))
+        except Exception as e:
+            logger.warning(f"Schema procedures failed, scanning relationships: {e}")
+    return _scan_relationship_properties_keys(gds, relationshipTypes)
+
+
+def _scan_relationship_properties_keys_query(relationshipTypes):
     rel_query = create_relationship_cypher_match_query([], relationshipTypes)
     property_extractor = """
                             WITH keys(properties(r)) AS prop_keys_list
@@ -212,27 +280,91 @@ def get_relationship_properties_keys(gds: GraphDataScience, relationshipTypes=No
                             WITH DISTINCT prop_keys
                             RETURN COLLECT(prop_keys) AS properties_keys
                         """
-    query = rel_query + property_extractor
+    return rel_query + property_extractor
 
-    df = gds.run_cypher(query)
-    if df.empty:
-        return []
-    return df["properties_keys"].iloc[0]
+
+def _scan_relationship_properties_keys(gds: GraphDataScience, relationshipTypes):
+    df = gds.run_cypher(_scan_relationship_properties_keys_query(relationshipTypes))
+    return _collected(df, "properties_keys")
+
+
+def get_relationship_types(gds: GraphDataScience, exact=False):
+    if not exact:
+        try:
+            return schema_cache.cached(
+                gds, "relationship_types", _catalog_relationship_types
+            )
+        except Exception as e:
+            logger.warning(
+                f"db.relationshipTypes() failed, scanning relationships: {e}"
+            )
+    return _scan_relationship_types(gds)
 
 
-def get_relationship_types(gds: GraphDataScience):
-    node_labels = []
+def _catalog_relationship_types(gds: GraphDataScience):
+    return gds.run_cypher(RELATIONSHIP_TYPES_QUERY)["relationshipType"].tolist()
+
+
+def _scan_relationship_types_query():
     type_extractor = """
                      WITH type(r) AS type
                      WITH DISTINCT type
                      RETURN COLLECT(type) AS relationship_types
                      """
-    query = create_relationship_cypher_match_query(node_labels, []) + type_extractor
+    return create_relationship_cypher_match_query([], []) + type_extractor
 
-    df = gds.run_cypher(query)
-    if df.empty:
-        return []
-    return df["relationship_types"].iloc[0]
+
+def _scan_relationship_types(gds: GraphDataScience):
+    df = gds.run_cypher(_scan_relationship_types_query())
+    return _collected(df, "relationship_types")
+
+
+async def get_schema_tool_result_async(gds, cypher, tool_name: str, exact=False):
+    """Answer a schema tool over the async Cypher connection ``cypher``.
+
+    Mirrors get_node_labels, get_relationship_types, get_node_properties_keys
+    and get_relationship_properties_keys, sharing their schema_cache entries
+    for ``gds``, so metadata calls never occupy a worker thread.
+    """
+    if tool_name == "get_node_labels":
+        cache_name, column = "labels", "label"
+        catalog_query, scan_query = NODE_LABELS_QUERY, SCAN_NODE_LABELS_QUERY
+        scan_column = "labels"
+    elif tool_name == "get_relationship_types":
+        cache_name, column = "relationship_types", "relationshipType"
+        catalog_query, scan_query = (
+            RELATIONSHIP_TYPES_QUERY,
+            _scan_relationship_types_query(),
+        )
+        scan_column = "relationship_types"
+    elif tool_name == "get_node_properties_keys":
+        cache_name, column = "schema", None
+        scan_query = _scan_node_properties_keys_query([])
+        scan_column = "properties_keys"
+    elif tool_name == "get_relationship_properties_keys":
+        cache_name, column = "schema", None
+        scan_query = _scan_relationship_properties_keys_query([])
+        scan_column = "properties_keys"
+    else:
+        raise ValueError(f"Unknown schema tool: {tool_name}.")
+
+    if not exact:
+        try:
+            if cache_name == "schema":
+                schema = await schema_cache.cached_async(
+                    gds, "schema", lambda: load_graph_schema_async(cypher)
+                )
+                if tool_name == "get_node_properties_keys":
+                    return sorted(schema.node_property_keys())
+                return sorted(schema.relationship_property_keys())
+
+            async def load_catalog():
+                return (await cypher.run_cypher(catalog_query))[column].tolist()
+
+            return await schema_cache.cached_async(gds, cache_name, load_catalog)
+        except Exception as e:
+            logger.warning(f"Schema catalog query failed, scanning instead: {e}")
+    return _collected(await cypher.run_cypher(scan_query), scan_column)
 
 
 def create_projection_query(node_labels, rel_types):
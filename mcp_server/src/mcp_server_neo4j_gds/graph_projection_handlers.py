@@ -99,7 +99,7 @@ class ListGraphsHandler(AlgorithmHandler):
 
 class GraphInfoHandler(AlgorithmHandler):
     def graph_info(self, graph_name: str):
-        G = self.gds.graph.get(graph_name)
+        G = self.get_graph(graph_name)
         exists = G.exists()
         if not exists:
             return {"graphName": graph_name, "exists": False}
@@ -135,7 +135,7 @@ class StreamNodePropertiesHandler(AlgorithmHandler):
         node_labels=None,
         db_node_properties=None,
     ):
-        G = self.gds.graph.get(graph_name)
+        G = self.get_graph(graph_name)
         return self.gds.graph.nodeProperties.stream(
             G,
             node_properties=node_properties,
@@ -160,7 +160,7 @@ class StreamRelationshipPropertiesHandler(AlgorithmHandler):
         relationship_properties,
         relationship_types=None,
     ):
-        G = self.gds.graph.get(graph_name)
+        G = self.get_graph(graph_name)
         return self.gds.graph.relationshipProperties.stream(
             G,
             relationship_properties=_as_list(relationship_properties, []),
@@ -178,7 +178,7 @@ class StreamRelationshipPropertiesHandler(AlgorithmHandler):
 
 class StreamRelationshipsHandler(AlgorithmHandler):
     def stream_relationships(self, graph_name: str, relationship_types=None):
-        G = self.gds.graph.get(graph_name)
+        G = self.get_graph(graph_name)
         return self.gds.graph.relationships.stream(
             G,
             relationship_types=_as_list(relationship_types, ["*"]),
@@ -0,0 +1,71 @@
+import logging
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .gds import is_session_gds
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+_current_job_id = ContextVar("gds_agent_job_id", default=None)
+
+
+def current_job_id() -> str | None:
+    """Job id of the tool call running in this context, if any."""
+    return _current_job_id.get()
+
+
+@contextmanager
+def tagged_job(job_id: str | None = None):
+    """Tag the GDS calls made in this context with ``job_id``.
+
+    clean_params adds the id to algorithm configurations as ``jobId``, which
+    makes the running transactions of a tool call findable for termination.
+    """
+    job_id = job_id or str(uuid.uuid4())
+    token = _current_job_id.set(job_id)
+    try:
+        yield job_id
+    finally:
+        _current_job_id.reset(token)
+
+
+def terminate_job(gds, job_id: str) -> int:
+    """Terminate the transactions running GDS procedures tagged with ``job_id``.
+
+    Returns how many were terminated. Procedures called by the Python client
+    receive their configuration as the $config parameter.
+    """
+    if is_session_gds(gds):
+        # Cypher on a session connection reaches the database, not the session
+        logger.info(f"Cannot terminate job {job_id} in a session; abandoning it")
+        return 0
+    try:
+        rows = gds.run_cypher(
+            """
+            SHOW TRANSACTIONS YIELD transactionId, parameters
+            WHERE parameters.config.jobId = $job_id
+            RETURN transactionId
+            """,
+            params={"job_id": job_id},
+        )
+        transaction_ids = rows["transactionId"].tolist()
+        if transaction_ids:
+            gds.run_cypher(
+                "TERMINATE TRANSACTIONS $ids", params={"ids": transaction_ids}
+            )
+        terminated = len(transaction_ids)
+    except Exception as e:
+        logger.info(f"SHOW TRANSACTIONS failed, falling back to dbms.killQuery: {e}")
+        rows = gds.run_cypher(
+            """
+            CALL dbms.listQueries() YIELD queryId, parameters
+            WHERE parameters.config.jobId = $job_id
+            CALL dbms.killQuery(queryId) YIELD queryId AS killedQueryId
+            RETURN killedQueryId
+            """,
+            params={"job_id": job_id},
+        )
+        terminated = len(rows)
+    logger.info(f"Terminated {terminated} transactions of job {job_id}")
+    return terminated
@@ -0,0 +1,66 @@
+from mcp import types
+
+from .job_store import JOB_TOOLS
+
+job_tool_definitions = [
+    types.Tool(
+        name="submit_job",
+        description="Start a long-running tool in the background and return its jobId immediately. "
+        "Use it for heavy tools (all-pairs shortest paths, node similarity, GraphSAGE and ML pipeline training) on large graphs, "
+        "where a single blocking call may outlive the client's timeout. "
+        "Poll the job with job_status and read its result with job_result; other tools can be used in the meantime.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tool": {
+                    "type": "string",
+                    "enum": list(JOB_TOOLS),
+                    "description": "Name of the tool to run.",
+                },
+                "arguments": {
+                    "type": "object",
+                    "description": "Arguments of the tool, exactly as they would be passed to the tool itself.",
+                },
+            },
+            "required": ["tool", "arguments"],
+        },
+    ),
+    types.Tool(
+        name="job_status",
+        description="Get the status of a job started with submit_job: queued, running, finished or failed, "
+        "with elapsed time, progress of the running algorithm and the result row count once finished.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobId": {
+                    "type": "string",
+                    "description": "The jobId returned by submit_job.",
+                },
+            },
+            "required": ["jobId"],
+        },
+    ),
+    types.Tool(
+        name="job_result",
+        description="Read one page of the result of a finished job. "
+        "Results are kept for a limited time after the job finishes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobId": {
+                    "type": "string",
+                    "description": "The jobId returned by submit_job.",
+                },
+                "page": {
+                    "type": "integer",
+                    "description": "1-based page number. Default is 1.",
+                },
+                "pageSize": {
+                    "type": "integer",
+                    "description": "Rows per page, at most the server's result row limit. Defaults to that limit.",
+                },
+            },
+            "required": ["jobId"],
+        },
+    ),
+]
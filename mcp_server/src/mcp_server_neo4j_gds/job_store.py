@@ -0,0 +1,161 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_JOB_TTL = 3600
+DEFAULT_MAX_JOBS = 16
+JOB_TTL_ENV = "GDS_AGENT_JOB_TTL"
+MAX_JOBS_ENV = "GDS_AGENT_MAX_JOBS"
+
+# Tools worth running detached from the MCP request that started them
+JOB_TOOLS = (
+    "all_pairs_shortest_paths",
+    "node_similarity",
+    "graph_sage_train",
+    "train_node_classification_model",
+    "train_link_prediction_model",
+    "train_node_regression_model",
+)
+
+
+def _env_number(name, default, cast=int):
+    try:
+        value = cast(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def job_ttl() -> float:
+    """Seconds a finished job's result is kept."""
+    return _env_number(JOB_TTL_ENV, DEFAULT_JOB_TTL, float)
+
+
+def max_jobs() -> int:
+    return _env_number(MAX_JOBS_ENV, DEFAULT_MAX_JOBS)
+
+
+class Job:
+    """A tool call submitted with submit_job and its eventual result."""
+
+    def __init__(self, tool: str, arguments: dict):
+        self.job_id = str(uuid.uuid4())
+        self.tool = tool
+        self.arguments = arguments
+        self.status = "queued"
+        self.submitted_at = datetime.now(UTC)
+        self._submitted = time.monotonic()
+        self._started = None
+        self._finished = None
+        self.result = None
+        self.error = None
+        self.task = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("finished", "failed")
+
+    def start(self):
+        self.status = "running"
+        self._started = time.monotonic()
+
+    def finish(self, result):
+        self.result = result
+        self.status = "finished"
+        self._finished = time.monotonic()
+
+    def fail(self, error: Exception):
+        self.error = str(error)
+        self.status = "failed"
+        self._finished = time.monotonic()
+
+    def finished_for(self, now: float) -> float:
+        """Seconds since the job finished, 0 while it is still running."""
+        return 0 if self._finished is None else now - self._finished
+
+    def describe(self) -> dict:
+        now = time.monotonic()
+        description = {
+            "jobId": self.job_id,
+            "tool": self.tool,
+            "status": self.status,
+            "submittedAt": self.submitted_at.isoformat(),
+            "elapsedSeconds": round((self._finished or now) - self._submitted, 3),
+        }
+        if self._started is not None:
+            description["runningSeconds"] = round(
+                (self._finished or now) - self._started, 3
+            )
+        if self.error is not None:
+            description["error"] = self.error
+        if self.status == "finished" and hasattr(self.result, "__len__"):
+            description["rowCount"] = len(self.result)
+        return description
+
+
+class JobStore:
+    """Bounded in-process store of submitted jobs.
+
+    Finished jobs are evicted once their result is older than the TTL, or,
+    when the store is full, oldest first. Running jobs are never evicted, so a
+    store full of running jobs rejects new submissions.
+    """
+
+    def __init__(self, max_size: int | None = None, ttl: float | None = None):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return max_jobs() if self._max_size is None else self._max_size
+
+    @property
+    def ttl(self) -> float:
+        return job_ttl() if self._ttl is None else self._ttl
+
+    def _evict_expired(self, now):
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.done and job.finished_for(now) > self.ttl
+        ]:
+            del self._jobs[job_id]
+
+    def add(self, job: Job) -> Job:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            if len(self._jobs) >= self.max_size:
+                finished = [job for job in self._jobs.values() if job.done]
+                if not finished:
+                    raise ValueError(
+                        f"All {self.max_size} job slots are taken by running jobs. "
+                        "Wait for one to finish and try again."
+                    )
+                oldest = max(finished, key=lambda job: job.finished_for(now))
+                del self._jobs[oldest.job_id]
+            self._jobs[job.job_id] = job
+        logger.info(f"Submitted job {job.job_id} running {job.tool}")
+        return job
+
+    def get(self, job_id: str) -> Job:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(
+                f"Unknown job '{job_id}'. Finished jobs are kept for {self.ttl:g} seconds."
+            )
+        return job
+
+    def jobs(self) -> list:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            return list(self._jobs.values())
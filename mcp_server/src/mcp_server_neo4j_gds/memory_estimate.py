@@ -0,0 +1,191 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .gds import is_session_gds
+from .tool_executor import released_worker_slots
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+MEMORY_CHECK_ENV = "GDS_AGENT_MEMORY_CHECK"
+MEMORY_CHECK_POLICIES = ("off", "refuse", "queue")
+DEFAULT_MEMORY_CHECK = "off"
+MEMORY_WAIT_ENV = "GDS_AGENT_MEMORY_WAIT_TIMEOUT"
+DEFAULT_MEMORY_WAIT = 300
+
+
+def memory_check_policy() -> str:
+    """'off', 'refuse' (fail when the estimate does not fit) or 'queue'."""
+    policy = os.getenv(MEMORY_CHECK_ENV, DEFAULT_MEMORY_CHECK).strip().lower()
+    if policy not in MEMORY_CHECK_POLICIES:
+        logger.warning(
+            f"Ignoring unsupported {MEMORY_CHECK_ENV} '{policy}', "
+            f"using '{DEFAULT_MEMORY_CHECK}'"
+        )
+        return DEFAULT_MEMORY_CHECK
+    return policy
+
+
+def memory_wait_timeout() -> float:
+    try:
+        return max(float(os.getenv(MEMORY_WAIT_ENV, DEFAULT_MEMORY_WAIT)), 0)
+    except ValueError:
+        return DEFAULT_MEMORY_WAIT
+
+
+def free_heap(gds) -> int | None:
+    """Free heap of the GDS instance in bytes, None when it cannot be read."""
+    try:
+        if is_session_gds(gds):
+            # Cypher on a session connection reaches the database, not the session
+            monitor = gds.systemMonitor()
+        else:
+            monitor = gds.run_cypher(
+                "CALL gds.systemMonitor() YIELD freeHeap RETURN freeHeap"
+            ).iloc[0]
+        return int(monitor["freeHeap"])
+    except Exception as e:
+        logger.info(f"Could not read free heap: {e}")
+        return None
+
+
+class MemoryReservations:
+    """Bytes reserved by admitted tool calls that are still running.
+
+    A call is admitted when its estimate plus the reservations of running calls
+    fits in the heap that was free when the call arrived; running calls may
+    not have allocated their memory yet, so their reservations count as used.
+    """
+
+    def __init__(self):
+        self._reserved = 0
+        self._condition = threading.Condition()
+
+    @property
+    def reserved(self) -> int:
+        with self._condition:
+            return self._reserved
+
+    def _refusal(self, tool_name, estimate, heap):
+        return ValueError(
+            f"Not enough memory to run '{tool_name}': estimated "
+            f"{estimate['requiredMemory']} ({estimate['bytesMax']} bytes), but only "
+            f"{max(heap - self._reserved, 0)} bytes of heap are available "
+            f"({self._reserved} reserved by running tools). Use a smaller graph, "
+            "fewer concurrent calls or a larger instance."
+        )
+
+    def reserve(self, tool_name, estimate, heap, policy, timeout):
+        needed = estimate["bytesMax"]
+        with self._condition:
+            if needed + self._reserved <= heap:
+                self._reserved += needed
+                return
+            if policy != "queue" or needed > heap:
+                raise self._refusal(tool_name, estimate, heap)
+        # Waiting calls do not hold worker slots that running calls could use
+        with released_worker_slots():
+            self._wait_and_reserve(tool_name, estimate, heap, timeout)
+
+    def _wait_and_reserve(self, tool_name, estimate, heap, timeout):
+        needed = estimate["bytesMax"]
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while needed + self._reserved > heap:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise self._refusal(tool_name, estimate, heap)
+                logger.info(
+                    f"Waiting for memory to run '{tool_name}' "
+                    f"({needed} bytes, {self._reserved} reserved)"
+                )
+                self._condition.wait(remaining)
+            self._reserved += needed
+
+    def release(self, estimate):
+        with self._condition:
+            self._reserved -= estimate["bytesMax"]
+            self._condition.notify_all()
+
+
+memory_reservations = MemoryReservations()
+
+
+class MemoryAdmission:
+    """Memory check of one tool call.
+
+    The handler runs it through ``admit_algorithm`` with the GDS config of its
+    algorithm; ``report`` is the estimate, or why none could be made.
+    """
+
+    def __init__(self, tool_name: str, policy: str):
+        self.tool_name = tool_name
+        self.policy = policy
+        self.report = None
+        self.reserved = None
+
+    def skip(self, reason: str):
+        logger.warning(f"No memory estimate for '{self.tool_name}': {reason}")
+        self.report = {"unavailable": reason}
+
+
+_admission: ContextVar = ContextVar("gds_agent_memory_admission", default=None)
+
+
+@contextmanager
+def memory_admission(tool_name: str):
+    """Scope of a tool call whose handler admits its algorithm run with
+    ``admit_algorithm``; the reservation is held until the block exits.
+
+    Yields the MemoryAdmission, None when the check is off.
+    """
+    policy = memory_check_policy()
+    if policy == "off":
+        yield None
+        return
+    admission = MemoryAdmission(tool_name, policy)
+    token = _admission.set(admission)
+    try:
+        yield admission
+    finally:
+        _admission.reset(token)
+        if admission.reserved is not None:
+            memory_reservations.release(admission.reserved)
+
+
+def admit_algorithm(gds, algorithm, G, mode: str, params: dict):
+    """Admit running ``algorithm`` on ``G`` with the handler's GDS ``params``
+    only if its memory estimate fits the free heap.
+
+    Summaries are estimated as streams. Does nothing outside memory_admission.
+    """
+    admission = _admission.get()
+    if admission is None or admission.report is not None:
+        return
+    procedure = algorithm.mutate if mode == "mutate" else algorithm.stream
+    # Estimates are no jobs; the job id stays with the algorithm run
+    config = {key: value for key, value in params.items() if key != "jobId"}
+    try:
+        result = procedure.estimate(G, **config)
+    except Exception as e:
+        admission.skip(f"estimation failed: {e}")
+        return
+    heap = free_heap(gds)
+    if heap is None:
+        admission.skip("free heap could not be read")
+        return
+
+    estimate = {
+        "requiredMemory": str(result["requiredMemory"]),
+        "bytesMin": int(result["bytesMin"]),
+        "bytesMax": int(result["bytesMax"]),
+        "freeHeap": heap,
+    }
+    admission.report = estimate
+    memory_reservations.reserve(
+        admission.tool_name, estimate, heap, admission.policy, memory_wait_timeout()
+    )
+    admission.reserved = estimate
@@ -8,7 +8,8 @@ from graphdatascience.model.node_classification_model import NCModel
 from graphdatascience.model.node_regression_model import NRModel
 
 from .algorithm_handler import AlgorithmHandler, clean_params
-from .node_translator import translate_ids_to_identifiers
+from .dispatch_cache import dispatch_cache
+from .node_translator import NodeNamePipeline, translate_ids_to_identifiers
 
 logger = logging.getLogger("mcp_server_neo4j_gds")
 
@@ -53,8 +54,8 @@ def configure_pipeline(pipeline, kwargs, default_method, methods):
 
 
 def train_pipeline(gds, pipeline, kwargs, default_metrics):
-    G = gds.graph.get(kwargs.get("graphName"))
-    train_params = clean_params(kwargs, PIPELINE_CONFIG_KEYS)
+    G = dispatch_cache.graph(gds, kwargs.get("graphName"))
+    train_params = clean_params(kwargs, PIPELINE_CONFIG_KEYS, tag_job=False)
     train_params.setdefault("metrics", default_metrics)
     logger.info(f"Pipeline train parameters: {train_params}")
     model, result = pipeline.train(G, **train_params)
@@ -110,7 +111,7 @@ class NodeClassificationTrainHandler(AlgorithmHandler):
 class NodeClassificationPredictHandler(AlgorithmHandler):
     def predict_node_classification(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         model = get_model(
             self.gds,
             kwargs.get("modelName"),
@@ -125,7 +126,7 @@ class NodeClassificationPredictHandler(AlgorithmHandler):
             result = model.predict_mutate(G, **gds_params)
         else:
             result = model.predict_stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -189,7 +190,7 @@ class LinkPredictionTrainHandler(AlgorithmHandler):
 class LinkPredictionPredictHandler(AlgorithmHandler):
     def predict_link_prediction(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         model = get_model(
             self.gds, kwargs.get("modelName"), LPModel, "train_link_prediction_model"
         )
@@ -202,12 +203,11 @@ class LinkPredictionPredictHandler(AlgorithmHandler):
         else:
             result = model.predict_stream(G, **gds_params)
             node_identifier_property = kwargs.get("nodeIdentifierProperty")
-            translate_ids_to_identifiers(
-                self.gds, node_identifier_property, result, "node1", "node1Name"
-            )
-            translate_ids_to_identifiers(
-                self.gds, node_identifier_property, result, "node2", "node2Name"
-            )
+            result = NodeNamePipeline(
+                self.gds,
+                node_identifier_property,
+                [("node1", "node1Name"), ("node2", "node2Name")],
+            ).apply(result)
         return result
 
     def execute(self, arguments: Dict[str, Any]) -> Any:
@@ -266,7 +266,7 @@ class NodeRegressionTrainHandler(AlgorithmHandler):
 class NodeRegressionPredictHandler(AlgorithmHandler):
     def predict_node_regression(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         model = get_model(
             self.gds, kwargs.get("modelName"), NRModel, "train_node_regression_model"
         )
@@ -278,7 +278,7 @@ class NodeRegressionPredictHandler(AlgorithmHandler):
             result = model.predict_mutate(G, **gds_params)
         else:
             result = model.predict_stream(G, **gds_params)
-            translate_ids_to_identifiers(
+            result = translate_ids_to_identifiers(
                 self.gds, kwargs.get("nodeIdentifierProperty"), result
             )
         return result
@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_NODE_CACHE_SIZE = 100_000
+NODE_CACHE_SIZE_ENV = "GDS_AGENT_NODE_CACHE_SIZE"
+
+
+def node_cache_size() -> int:
+    """Maximum number of cached node property values; 0 disables the cache."""
+    try:
+        value = int(os.getenv(NODE_CACHE_SIZE_ENV, DEFAULT_NODE_CACHE_SIZE))
+    except ValueError:
+        return DEFAULT_NODE_CACHE_SIZE
+    return max(value, 0)
+
+
+def database_key(gds):
+    """Name of the database ``gds`` runs Cypher against, None for the default."""
+    database = getattr(gds, "database", None)
+    if not callable(database):
+        return None
+    try:
+        return database()
+    except Exception:
+        return None
+
+
+class NodePropertyCache:
+    """Process-wide LRU cache of node property values.
+
+    Entries are keyed by (database, property, node id) so that the same hub
+    nodes showing up in consecutive tool results are only fetched once.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return node_cache_size() if self._max_size is None else self._max_size
+
+    def get_many(self, database, node_property, node_ids):
+        """Return ({node id: value} for cached ids, [ids that are not cached])."""
+        found = {}
+        missing = []
+        with self._lock:
+            for node_id in dict.fromkeys(node_ids):
+                key = (database, node_property, node_id)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[node_id] = self._entries[key]
+                else:
+                    missing.append(node_id)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, database, node_property, values):
+        max_size = self.max_size
+        if max_size == 0:
+            return
+        with self._lock:
+            for node_id, value in values.items():
+                key = (database, node_property, node_id)
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, database=None):
+        """Drop the cached values of one database, or of all databases."""
+        with self._lock:
+            if database is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key in self._entries if key[0] == database]
+                for key in keys:
+                    del self._entries[key]
+                dropped = len(keys)
+        if dropped:
+            logger.info(f"Invalidated {dropped} cached node property values")
+            self.log_stats()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def log_stats(self):
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = f"{stats['hits'] / lookups:.0%}" if lookups else "n/a"
+        logger.info(
+            f"Node property cache: {stats['size']}/{stats['maxSize']} values, "
+            f"{stats['hits']} hits, {stats['misses']} misses ({hit_rate} hit rate), "
+            f"{stats['evictions']} evictions"
+        )
+
+
+node_property_cache = NodePropertyCache()
@@ -1,19 +1,406 @@
+import logging
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
 from graphdatascience import GraphDataScience
 
+from .node_cache import database_key, node_property_cache
+from .result_cursors import CURSOR_ID_ATTR, cursor_store
 from .result_limits import limit_dataframe_rows
+from .schema_cache import schema_cache
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+# Cypher identifiers that can be used without backtick quoting must match
+# this shape. We use it to reject node_identifier_property values that
+# would otherwise be interpolated as raw Cypher fragments into the
+# `n.<property>` accessor and could break out of the surrounding query.
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+DEFAULT_NODE_PROJECTION = "name"
+# Full-text hits read per name; exact matches rank first in the index
+FULLTEXT_LOOKUP_LIMIT = 100
+# Full-text analyzers that keep the case of the indexed values
+CASE_SENSITIVE_ANALYZERS = ("keyword", "whitespace", "unicode_whitespace")
+NODE_PROJECTION_ENV = "GDS_AGENT_NODE_PROJECTION"
+
+
+def _validate_property_name(name):
+    """Validate a Cypher property name supplied by the MCP client.
+
+    The ``nodeIdentifierProperty`` tool argument is interpolated directly
+    into Cypher queries (``n.<name>``). Without validation a crafted
+    value can break out of the property accessor and execute arbitrary
+    Cypher. Restricting it to unquoted-identifier shape preserves the
+    documented contract ("e.g. 'name', 'Name', 'title'") while making
+    injection impossible.
+    """
+    if not isinstance(name, str) or not _IDENTIFIER_RE.match(name):
+        raise ValueError(
+            "Invalid nodeIdentifierProperty: must match "
+            "[A-Za-z_][A-Za-z0-9_]* (e.g. 'name', 'Name', 'title')."
+        )
+    return name
+
+
+class NodeIndexCatalog:
+    """Online node indexes of a database, as reported by SHOW INDEXES."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def label_indexes(self, node_property):
+        """(index type, label) pairs of single-property RANGE/TEXT indexes."""
+        return [
+            (row["type"], row["labelsOrTypes"][0])
+            for row in self._rows
+            if row["type"] in ("RANGE", "TEXT")
+            and list(row["properties"]) == [node_property]
+        ]
+
+    def fulltext_index(self, node_property):
+        """(name, labels, case-insensitive) of a full-text index on the property."""
+        for row in self._rows:
+            if row["type"] == "FULLTEXT" and node_property in row["properties"]:
+                config = (row.get("options") or {}).get("indexConfig") or {}
+                analyzer = config.get("fulltext.analyzer", "standard-no-stop-words")
+                return (
+                    row["name"],
+                    list(row["labelsOrTypes"]),
+                    analyzer not in CASE_SENSITIVE_ANALYZERS,
+                )
+        return None
+
+
+def _load_node_index_catalog(gds: GraphDataScience) -> NodeIndexCatalog:
+    try:
+        df = gds.run_cypher(
+            """
+            SHOW INDEXES
+            YIELD name, type, entityType, labelsOrTypes, properties, state, options
+            WHERE entityType = 'NODE' AND state = 'ONLINE'
+            RETURN name, type, labelsOrTypes, properties, options
+            """
+        )
+        return NodeIndexCatalog(df.to_dict("records"))
+    except Exception as e:
+        logger.info(f"Could not inspect indexes, falling back to node scans: {e}")
+        return NodeIndexCatalog([])
+
+
+def node_index_catalog(gds: GraphDataScience) -> NodeIndexCatalog:
+    """Return the index catalog of ``gds``, cached with the database schema so
+    indexes created or dropped later are seen once the schema cache expires."""
+    return schema_cache.cached(gds, "node_indexes", _load_node_index_catalog)
+
+
+_lookup_plans: ContextVar = ContextVar("gds_agent_lookup_plans", default=None)
 
 
-def _replace_dataframe_contents(target, source):
-    if source is target:
-        return
+@contextmanager
+def collect_lookup_plans():
+    """Collect the lookup plans of all name resolutions run inside the block."""
+    plans = []
+    token = _lookup_plans.set(plans)
+    try:
+        yield plans
+    finally:
+        _lookup_plans.reset(token)
 
-    target.drop(target.index, inplace=True)
-    for column in list(target.columns):
-        if column not in source.columns:
-            target.drop(columns=[column], inplace=True)
-    for column in source.columns:
-        target[column] = source[column]
-    target.attrs.update(source.attrs)
+
+class NodeNameResolution:
+    """Node ids and matched property values for a batch of requested names."""
+
+    def __init__(self, names, matches, plan="none"):
+        self.names = list(names)
+        self._matches = matches
+        self.plan = plan
+
+    def node_id(self, name):
+        match = self._matches.get(name)
+        return None if match is None else match[0][0]
+
+    def matched_name(self, name):
+        match = self._matches.get(name)
+        return None if match is None else match[0][1]
+
+    @property
+    def node_ids(self):
+        return [self.node_id(name) for name in self.names if name in self._matches]
+
+    @property
+    def all_node_ids(self):
+        """Ids of every equally good match, e.g. all nodes sharing a name."""
+        return [
+            node_id
+            for name in dict.fromkeys(self.names)
+            for node_id, _ in self._matches.get(name, [])
+        ]
+
+    @property
+    def matched_names(self):
+        return [self.matched_name(name) for name in self.names if name in self._matches]
+
+    @property
+    def unmatched_names(self):
+        return [name for name in self.names if name not in self._matches]
+
+
+def _escape_label(label):
+    return "`" + label.replace("`", "``") + "`"
+
+
+def _fulltext_phrase(node_property, name):
+    escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'{node_property}:"{escaped}"'
+
+
+def _covers_property(gds, labels, node_property) -> bool:
+    """Whether every node carrying ``node_property`` has one of ``labels``."""
+    try:
+        label_sets = schema_cache.get(gds).property_label_sets(node_property)
+    except Exception as e:
+        logger.info(f"Could not read the schema to check index coverage: {e}")
+        return False
+    return all(any(label in labels for label in label_set) for label_set in label_sets)
+
+
+def _lookup_steps(
+    gds, catalog, node_identifier_property, substring_fallback, all_matches
+):
+    """Yield (description, query, params builder, exhaustive) in order of
+    preference; an exhaustive step finds every case-insensitive exact match,
+    which is only checked for ``all_matches`` lookups."""
+    prop = node_identifier_property
+    row_shape = f"RETURN name, id(n) AS node_id, n.{prop} AS matched_name"
+
+    label_indexes = catalog.label_indexes(prop)
+    if label_indexes:
+        seek = " UNION ALL ".join(
+            f"UNWIND $names AS name MATCH (n:{_escape_label(label)}) "
+            f"WHERE n.{prop} = name {row_shape}"
+            for _, label in label_indexes
+        )
+        labels = ", ".join(f":{label}({prop})" for _, label in label_indexes)
+        # Equality seeks are case-sensitive, so they never find every match
+        yield (
+            f"index seek on {labels}",
+            seek,
+            lambda names: {"names": names},
+            False,
+        )
+
+    fulltext = catalog.fulltext_index(prop)
+    if fulltext is not None:
+        fulltext_index, fulltext_labels, case_insensitive = fulltext
+        query = f"""
+            UNWIND $lookups AS lookup
+            CALL {{
+                WITH lookup
+                CALL db.index.fulltext.queryNodes($index_name, lookup.query)
+                YIELD node
+                RETURN node LIMIT $limit
+            }}
+            WITH lookup.name AS name, node AS n
+            RETURN name, id(n) AS node_id, n.{prop} AS matched_name
+            """
+        yield (
+            f"full-text index '{fulltext_index}'",
+            query,
+            lambda names: {
+                "index_name": fulltext_index,
+                "limit": FULLTEXT_LOOKUP_LIMIT,
+                "lookups": [
+                    {"name": name, "query": _fulltext_phrase(prop, name)}
+                    for name in names
+                ],
+            },
+            all_matches
+            and case_insensitive
+            and _covers_property(gds, fulltext_labels, prop),
+        )
+
+    match_condition = (
+        "value CONTAINS needle" if substring_fallback else "value = needle"
+    )
+    scan = f"""
+            MATCH (n)
+            WHERE n.{prop} IS NOT NULL
+            WITH n, toLower(n.{prop}) AS value
+            UNWIND $names AS name
+            WITH n, value, name, toLower(name) AS needle
+            WHERE {match_condition}
+            {row_shape}
+            """
+    yield "label-less node scan", scan, lambda names: {"names": names}, True
+
+
+def _rank_matches(df, substring_fallback, ranked=None):
+    """Group result rows by name, keeping the best-ranked nodes per name.
+
+    Returns {name: (rank, nodes)}, rank 0 for exact case-insensitive matches
+    and 1 for substring matches, merged into the ``ranked`` of earlier steps.
+    """
+    ranked = {} if ranked is None else ranked
+    for name, node_id, matched_name in zip(
+        df["name"], df["node_id"], df["matched_name"]
+    ):
+        value = str(matched_name).lower()
+        needle = str(name).lower()
+        if value == needle:
+            rank = 0
+        elif substring_fallback and needle in value:
+            rank = 1
+        else:
+            continue
+        best_rank, nodes = ranked.get(name, (rank, []))
+        if rank < best_rank:
+            best_rank, nodes = rank, []
+        if rank == best_rank:
+            nodes.append((int(node_id), matched_name))
+        ranked[name] = (best_rank, nodes)
+    return ranked
+
+
+def resolve_node_names(
+    gds: GraphDataScience,
+    names,
+    node_identifier_property,
+    substring_fallback=True,
+    all_matches=False,
+) -> NodeNameResolution:
+    """Resolve all node names of one tool call with as few scans as possible.
+
+    Every name is matched case-insensitively against ``node_identifier_property``.
+    An exact match always wins; with ``substring_fallback`` a name that has no
+    exact match resolves to a node whose property contains it. Ties are broken
+    by the lowest node id so repeated calls resolve to the same node.
+
+    Lookups first use label-scoped RANGE/TEXT index seeks for exact values,
+    then a full-text index, and only scan all nodes for names without an
+    exact match yet: index seeks compare case-sensitively, and full-text
+    hits may only contain the name. Callers that need ``all_matches``, e.g.
+    every node sharing a name, keep scanning unless a case-insensitive
+    full-text index covering every label with the property found the name.
+    The steps taken are reported as the resolution's ``plan``.
+    """
+    node_identifier_property = _validate_property_name(node_identifier_property)
+    names = list(names)
+    remaining = list(dict.fromkeys(name for name in names if name is not None))
+    if not remaining:
+        return NodeNameResolution(names, {})
+
+    catalog = node_index_catalog(gds)
+    ranked = {}
+    plan = []
+    for description, query, build_params, exhaustive in _lookup_steps(
+        gds, catalog, node_identifier_property, substring_fallback, all_matches
+    ):
+        if not remaining:
+            break
+        plan.append(description)
+        df = gds.run_cypher(query, params=build_params(remaining))
+        ranked = _rank_matches(df, substring_fallback, ranked)
+        if all_matches and not exhaustive:
+            continue
+        # A name with as many hits as the full-text limit may have lost some
+        hits = df["name"].value_counts()
+        remaining = [
+            name
+            for name in remaining
+            if ranked.get(name, (1,))[0] != 0
+            or (all_matches and hits.get(name, 0) >= FULLTEXT_LOOKUP_LIMIT)
+        ]
+
+    matches = {name: sorted(dict(nodes).items()) for name, (_, nodes) in ranked.items()}
+    resolution = NodeNameResolution(names, matches, " -> ".join(plan))
+    logger.info(f"Resolved node names with plan: {resolution.plan}")
+    collected_plans = _lookup_plans.get()
+    if collected_plans is not None:
+        collected_plans.append(resolution.plan)
+    return resolution
+
+
+def fetch_node_property(gds: GraphDataScience, node_ids, node_property) -> dict:
+    """Map node ids to one property value, fetching only ids not yet cached.
+
+    Misses are loaded in a single query that returns just ``node_property``
+    rather than whole nodes; ids of deleted nodes map to None.
+    """
+    node_property = _validate_property_name(node_property)
+    database = database_key(gds)
+    node_ids = [int(node_id) for node_id in node_ids]
+    values, missing = node_property_cache.get_many(database, node_property, node_ids)
+    if missing:
+        df = gds.run_cypher(
+            f"""
+            UNWIND $ids AS node_id
+            MATCH (n)
+            WHERE id(n) = node_id
+            RETURN node_id, n.{node_property} AS value
+            """,
+            params={"ids": missing},
+        )
+        found = dict(zip(df["node_id"].astype(int), df["value"]))
+        fetched = {node_id: found.get(node_id) for node_id in missing}
+        node_property_cache.put_many(database, node_property, fetched)
+        values.update(fetched)
+    return values
+
+
+def node_projection_properties() -> list:
+    """Properties returned for nodes when no identifier property is given."""
+    value = os.getenv(NODE_PROJECTION_ENV, DEFAULT_NODE_PROJECTION)
+    return [
+        _validate_property_name(name.strip())
+        for name in value.split(",")
+        if name.strip()
+    ]
+
+
+def fetch_node_projection(gds: GraphDataScience, node_ids, properties) -> dict:
+    """Map node ids to their labels plus a small set of properties.
+
+    Used where a tool has no identifier property to name nodes by; only the
+    listed properties are transferred, never the whole node.
+    """
+    properties = [_validate_property_name(name) for name in properties]
+    node_ids = list(dict.fromkeys(int(node_id) for node_id in node_ids))
+    if not node_ids:
+        return {}
+    projection = ", ".join(f".{name}" for name in properties)
+    df = gds.run_cypher(
+        f"""
+        UNWIND $ids AS node_id
+        MATCH (n)
+        WHERE id(n) = node_id
+        RETURN node_id, labels(n) AS labels, n {{{projection}}} AS properties
+        """,
+        params={"ids": node_ids},
+    )
+    found = {
+        int(node_id): {"labels": list(labels), **(node_properties or {})}
+        for node_id, labels, node_properties in zip(
+            df["node_id"], df["labels"], df["properties"]
+        )
+    }
+    return {node_id: found.get(node_id) for node_id in node_ids}
+
+
+def fetch_node_names(
+    gds: GraphDataScience, node_ids, node_identifier_property=None
+) -> dict:
+    """Map node ids to what a tool result shows for them.
+
+    That is the identifier property value when one is given, otherwise the
+    projection configured through GDS_AGENT_NODE_PROJECTION.
+    """
+    if node_identifier_property:
+        return fetch_node_property(gds, node_ids, node_identifier_property)
+    return fetch_node_projection(gds, node_ids, node_projection_properties())
 
 
 def translate_identifiers_to_ids(
@@ -27,40 +414,72 @@ def translate_identifiers_to_ids(
     if input_nodes is not None and node_identifier_property is not None:
         if isinstance(input_nodes, list):
             # Handle list of node names
-            query = f"""
-                    UNWIND $names AS name
-                    MATCH (s)
-                    WHERE toLower(s.{node_identifier_property}) = toLower(name)
-                    RETURN id(s) as node_id
-                    """
-            df = gds.run_cypher(
-                query,
-                params={
-                    "names": input_nodes,
-                },
+            resolution = resolve_node_names(
+                gds,
+                input_nodes,
+                node_identifier_property,
+                substring_fallback=False,
+                all_matches=True,
             )
-            input_node_ids = df["node_id"].tolist()
-            call_params[input_nodes_variable_name] = input_node_ids
+            call_params[input_nodes_variable_name] = resolution.all_node_ids
         else:
             # Handle single  node name
-            query = f"""
-                    MATCH (s)
-                    WHERE toLower(s.{node_identifier_property}) = toLower($name)
-                    RETURN id(s) as node_id
-                    """
-            df = gds.run_cypher(
-                query,
-                params={
-                    "name": input_nodes,
-                },
+            resolution = resolve_node_names(
+                gds, [input_nodes], node_identifier_property, substring_fallback=False
             )
-            if not df.empty:
-                call_params[input_nodes_variable_name] = int(df["node_id"].iloc[0])
+            if not resolution.unmatched_names:
+                call_params[input_nodes_variable_name] = resolution.node_id(input_nodes)
     elif input_nodes is not None:
         # If input_nodes provided but no nodeIdentifierProperty, pass through as-is
         call_params[input_nodes_variable_name] = input_nodes
 
 
+class NodeNamePipeline:
+    """Post-processing that names the nodes of a stream result's id columns.
+
+    The result is limited once, then the ids of every column (e.g. node1 and
+    node2 together) are resolved with a single batched lookup. ``apply``
+    returns the limited frame with name columns added instead of rewriting
+    the caller's frame; that is ``results`` itself when nothing was cut.
+    """
+
+    def __init__(
+        self,
+        gds: GraphDataScience,
+        node_identifier_property,
+        columns=(("nodeId", "nodeName"),),
+    ):
+        self.gds = gds
+        self.node_identifier_property = node_identifier_property
+        self.columns = list(columns)
+
+    def name_rows(self, rows):
+        """Return a copy of ``rows`` with the name columns added."""
+        node_ids = pd.unique(
+            pd.concat([rows[id_name] for id_name, _ in self.columns], ignore_index=True)
+        )
+        node_names = fetch_node_property(
+            self.gds, node_ids.tolist(), self.node_identifier_property
+        )
+        return rows.assign(
+            **{
+                output_name: rows[id_name].map(node_names)
+                for id_name, output_name in self.columns
+            }
+        )
+
+    def apply(self, results):
+        if self.node_identifier_property is None:
+            return results
+        named = self.name_rows(limit_dataframe_rows(results))
+
+        # A cursor keeps the unnamed rows; its pages are named as they are read
+        cursor_id = named.attrs.get(CURSOR_ID_ATTR)
+        if cursor_id is not None:
+            cursor_store.add_translation(cursor_id, self.name_rows)
+        return named
+
+
 def translate_ids_to_identifiers(
     gds: GraphDataScience,
     node_identifier_property,
@@ -68,13 +487,9 @@ def translate_ids_to_identifiers(
     id_name="nodeId",
     node_identifier_output_name="nodeName",
 ):
-    if node_identifier_property is not None:
-        limited_results = limit_dataframe_rows(results)
-        _replace_dataframe_contents(results, limited_results)
-
-        nodes = gds.util.asNodes(results[id_name].tolist())
-        node_name_values = [node.get(node_identifier_property) for node in nodes]
-        results[node_identifier_output_name] = node_name_values
+    return NodeNamePipeline(
+        gds, node_identifier_property, [(id_name, node_identifier_output_name)]
+    ).apply(results)
 
 
 def filter_identifiers(
@@ -90,18 +505,12 @@ def filter_identifiers(
         raise ValueError(
             "If 'nodes' is provided, 'nodeIdentifierProperty' must also be specified."
         )
-    query = f"""
-            UNWIND $names AS name
-            MATCH (s)
-            WHERE toLower(s.{node_identifier_property}) = toLower(name)
-            RETURN id(s) as node_id
-            """
-    df = gds.run_cypher(
-        query,
-        params={
-            "names": node_names,
-        },
+    resolution = resolve_node_names(
+        gds,
+        node_names,
+        node_identifier_property,
+        substring_fallback=False,
+        all_matches=True,
     )
-    node_ids = df["node_id"].tolist()
-    filtered_results = results[results[id_name].isin(node_ids)]
+    filtered_results = results[results[id_name].isin(resolution.all_node_ids)]
     return filtered_results
@@ -1,70 +1,84 @@
 import logging
-import re
 from typing import Dict, Any
 
+import numpy as np
+import pandas as pd
 
 from .algorithm_handler import AlgorithmHandler, clean_params
+from .node_translator import fetch_node_names, resolve_node_names
 
 logger = logging.getLogger("mcp_server_neo4j_gds")
 
-# Cypher identifiers that can be used without backtick quoting must match
-# this shape. We use it to reject node_identifier_property values that
-# would otherwise be interpolated as raw Cypher fragments into the
-# `n.<property>` accessor and could break out of the surrounding query.
-_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
+def _as_node_pairs(gds, node_id_pairs, node_identifier_property=None):
+    node_ids = [node_id for pair in node_id_pairs for node_id in pair]
+    if not node_ids:
+        return []
+    names = fetch_node_names(gds, node_ids, node_identifier_property)
+    return [(names[node_id], names[parent_id]) for node_id, parent_id in node_id_pairs]
 
-def _validate_property_name(name):
-    """Validate a Cypher property name supplied by the MCP client.
 
-    The ``nodeIdentifierProperty`` tool argument is interpolated directly
-    into Cypher queries (``n.<name>``). Without validation a crafted
-    value can break out of the property accessor and execute arbitrary
-    Cypher. Restricting it to unquoted-identifier shape preserves the
-    documented contract ("e.g. 'name', 'Name', 'title'") while making
-    injection impossible.
-    """
-    if not isinstance(name, str) or not _IDENTIFIER_RE.match(name):
-        raise ValueError(
-            "Invalid nodeIdentifierProperty: must match "
-            "[A-Za-z_][A-Za-z0-9_]* (e.g. 'name', 'Name', 'title')."
-        )
-    return name
+def _flatten_lists(column, dtype):
+    """Concatenate a column of per-row arrays, returning (values, row lengths)."""
+    lengths = column.map(len).to_numpy(np.int64)
+    if not lengths.sum():
+        return np.array([], dtype=dtype), lengths
+    values = np.concatenate([np.asarray(value, dtype=dtype) for value in column])
+    return values, lengths
 
 
-def _as_node_pairs(gds, node_id_pairs):
-    node_ids = [node_id for pair in node_id_pairs for node_id in pair]
-    if not node_ids:
+def _split_lists(values, lengths):
+    if not len(lengths):
         return []
-    nodes = iter(gds.util.asNodes(node_ids))
-    return list(zip(nodes, nodes))
+    return [part.tolist() for part in np.split(values, np.cumsum(lengths)[:-1])]
+
+
+def _with_path_node_names(
+    gds, path_data, node_identifier_property, endpoint_columns=()
+):
+    """Name the nodes of every path row with a single batched lookup.
+
+    The nodeIds of all rows and the ids in ``endpoint_columns`` are resolved
+    in one call; nodeIds, nodeNames and costs become plain lists and each
+    endpoint column gets a matching ``<column>Name`` column.
+    """
+    path_data = path_data.reset_index(drop=True)
+    node_ids, lengths = _flatten_lists(path_data["nodeIds"], np.int64)
+    endpoint_ids = [path_data[column].to_numpy(np.int64) for column in endpoint_columns]
+    names = fetch_node_names(
+        gds,
+        np.unique(np.concatenate([node_ids, *endpoint_ids])).tolist(),
+        node_identifier_property,
+    )
+
+    result = path_data.copy()
+    result["nodeIds"] = _split_lists(node_ids, lengths)
+    result["nodeNames"] = _split_lists(
+        pd.Series(node_ids, dtype=np.int64).map(names).to_numpy(object), lengths
+    )
+    if "costs" in path_data.columns:
+        result["costs"] = _split_lists(*_flatten_lists(path_data["costs"], np.float64))
+    for column in endpoint_columns:
+        result[f"{column}Name"] = path_data[column].map(names)
+    return result
 
 
 class DijkstraShortestPathHandler(AlgorithmHandler):
     def find_shortest_path(
         self, start_node: str, end_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (start)
-        WHERE toLower(start.{node_identifier_property}) CONTAINS toLower($start_name)
-        MATCH (end)
-        WHERE toLower(end.{node_identifier_property}) CONTAINS toLower($end_name)
-        RETURN id(start) as start_id, id(end) as end_id
-        """
-
-        df = self.gds.run_cypher(
-            query, params={"start_name": start_node, "end_name": end_node}
+        resolution = resolve_node_names(
+            self.gds, [start_node, end_node], node_identifier_property
         )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "One or both node names not found"}
 
-        start_node_id = int(df["start_id"].iloc[0])
-        end_node_id = int(df["end_id"].iloc[0])
+        start_node_id = resolution.node_id(start_node)
+        end_node_id = resolution.node_id(end_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Dijkstra single-source shortest path parameters: {params}")
 
@@ -93,8 +107,9 @@ class DijkstraShortestPathHandler(AlgorithmHandler):
             if hasattr(costs, "tolist"):
                 costs = costs.tolist()
 
-            # Get node names using GDS utility function
-            node_names = self.gds.util.asNodes(node_ids)
+            # Look up only the identifier property of the path nodes
+            names = fetch_node_names(self.gds, node_ids, node_identifier_property)
+            node_names = [names[node_id] for node_id in node_ids]
 
             return {
                 "totalCost": float(path_data["totalCost"].iloc[0]),
@@ -122,22 +137,17 @@ class DeltaSteppingShortestPathHandler(AlgorithmHandler):
     def delta_stepping_shortest_path(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        df = self.gds.run_cypher(query, params={"source_name": source_node})
+        resolution = resolve_node_names(
+            self.gds, [source_node], node_identifier_property
+        )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(df["source_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Delta-Stepping shortest path parameters: {params}")
 
@@ -156,43 +166,26 @@ class DeltaSteppingShortestPathHandler(AlgorithmHandler):
                     "message": "No paths found from the source node",
                 }
 
-            # Convert to native Python types as needed
-            result_data = []
-            for _, row in path_data.iterrows():
-                target_node_id = int(row["targetNode"])
-                total_cost = float(row["totalCost"])
-
-                # Get the path details
-                node_ids = row["nodeIds"]
-                costs = row["costs"]
-                path = row["path"]
-
-                # Convert to native Python types if needed
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-                if hasattr(costs, "tolist"):
-                    costs = costs.tolist()
-
-                # Get node names using GDS utility function
-                target_node_name = self.gds.util.asNode(target_node_id)
-                node_names = self.gds.util.asNodes(node_ids)
-
-                result_data.append(
-                    {
-                        "targetNode": target_node_id,
-                        "targetNodeName": target_node_name,
-                        "totalCost": total_cost,
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "costs": costs,
-                        "path": path,
-                    }
-                )
+            # Name the nodes of all paths in one batched lookup
+            path_data = _with_path_node_names(
+                self.gds, path_data, node_identifier_property, ["targetNode"]
+            )
+            result_data = path_data[
+                [
+                    "targetNode",
+                    "targetNodeName",
+                    "totalCost",
+                    "nodeIds",
+                    "nodeNames",
+                    "costs",
+                    "path",
+                ]
+            ].to_dict("records")
 
             return {
                 "found": True,
                 "sourceNodeId": source_node_id,
-                "sourceNodeName": self.gds.util.asNode(source_node_id),
+                "sourceNodeName": resolution.matched_name(source_node),
                 "results": result_data,
             }
 
@@ -214,22 +207,17 @@ class DijkstraSingleSourceShortestPathHandler(AlgorithmHandler):
     def dijkstra_single_source_shortest_path(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        df = self.gds.run_cypher(query, params={"source_name": source_node})
+        resolution = resolve_node_names(
+            self.gds, [source_node], node_identifier_property
+        )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(df["source_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Dijkstra single-source shortest path parameters: {params}")
 
@@ -248,43 +236,26 @@ class DijkstraSingleSourceShortestPathHandler(AlgorithmHandler):
                     "message": "No paths found from the source node",
                 }
 
-            # Convert to native Python types as needed
-            result_data = []
-            for _, row in path_data.iterrows():
-                target_node_id = int(row["targetNode"])
-                total_cost = float(row["totalCost"])
-
-                # Get the path details
-                node_ids = row["nodeIds"]
-                costs = row["costs"]
-                path = row["path"]
-
-                # Convert to native Python types if needed
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-                if hasattr(costs, "tolist"):
-                    costs = costs.tolist()
-
-                # Get node names using GDS utility function
-                target_node_name = self.gds.util.asNode(target_node_id)
-                node_names = self.gds.util.asNodes(node_ids)
-
-                result_data.append(
-                    {
-                        "targetNode": target_node_id,
-                        "targetNodeName": target_node_name,
-                        "totalCost": total_cost,
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "costs": costs,
-                        "path": path,
-                    }
-                )
+            # Name the nodes of all paths in one batched lookup
+            path_data = _with_path_node_names(
+                self.gds, path_data, node_identifier_property, ["targetNode"]
+            )
+            result_data = path_data[
+                [
+                    "targetNode",
+                    "targetNodeName",
+                    "totalCost",
+                    "nodeIds",
+                    "nodeNames",
+                    "costs",
+                    "path",
+                ]
+            ].to_dict("records")
 
             return {
                 "found": True,
                 "sourceNodeId": source_node_id,
-                "sourceNodeName": self.gds.util.asNode(source_node_id),
+                "sourceNodeName": resolution.matched_name(source_node),
                 "results": result_data,
             }
 
@@ -309,27 +280,18 @@ class AStarShortestPathHandler(AlgorithmHandler):
         node_identifier_property: str,
         **kwargs,
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        MATCH (target)
-        WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-        RETURN id(source) as source_id, id(target) as target_id
-        """
-
-        df = self.gds.run_cypher(
-            query, params={"source_name": source_node, "target_name": target_node}
+        resolution = resolve_node_names(
+            self.gds, [source_node, target_node], node_identifier_property
         )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "One or both node names not found"}
 
-        source_node_id = int(df["source_id"].iloc[0])
-        target_node_id = int(df["target_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
+        target_node_id = resolution.node_id(target_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"A* shortest path parameters: {params}")
 
@@ -358,8 +320,9 @@ class AStarShortestPathHandler(AlgorithmHandler):
             if hasattr(costs, "tolist"):
                 costs = costs.tolist()
 
-            # Get node names using GDS utility function
-            node_names = self.gds.util.asNodes(node_ids)
+            # Look up only the identifier property of the path nodes
+            names = fetch_node_names(self.gds, node_ids, node_identifier_property)
+            node_names = [names[node_id] for node_id in node_ids]
 
             return {
                 "totalCost": float(path_data["totalCost"].iloc[0]),
@@ -393,27 +356,18 @@ class YensShortestPathsHandler(AlgorithmHandler):
         node_identifier_property: str,
         **kwargs,
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        MATCH (target)
-        WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-        RETURN id(source) as source_id, id(target) as target_id
-        """
-
-        df = self.gds.run_cypher(
-            query, params={"source_name": source_node, "target_name": target_node}
+        resolution = resolve_node_names(
+            self.gds, [source_node, target_node], node_identifier_property
         )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "One or both node names not found"}
 
-        source_node_id = int(df["source_id"].iloc[0])
-        target_node_id = int(df["target_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
+        target_node_id = resolution.node_id(target_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Yen's shortest paths parameters: {params}")
 
@@ -432,39 +386,20 @@ class YensShortestPathsHandler(AlgorithmHandler):
                     "message": "No paths found between the specified nodes",
                 }
 
-            # Convert to native Python types as needed
-            result_data = []
-            for _, row in path_data.iterrows():
-                # Convert to native Python types as needed - handle both list and Series objects
-                node_ids = row["nodeIds"]
-                costs = row["costs"]
-
-                # Convert only if not already a list
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-                if hasattr(costs, "tolist"):
-                    costs = costs.tolist()
-
-                # Get node names using GDS utility function
-                node_names = self.gds.util.asNodes(node_ids)
-
-                result_data.append(
-                    {
-                        "index": int(row["index"]),
-                        "totalCost": float(row["totalCost"]),
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "path": row["path"],
-                        "costs": costs,
-                    }
-                )
+            # Name the nodes of all paths in one batched lookup
+            path_data = _with_path_node_names(
+                self.gds, path_data, node_identifier_property
+            )
+            result_data = path_data[
+                ["index", "totalCost", "nodeIds", "nodeNames", "path", "costs"]
+            ].to_dict("records")
 
             return {
                 "found": True,
                 "sourceNodeId": source_node_id,
-                "sourceNodeName": self.gds.util.asNode(source_node_id),
+                "sourceNodeName": resolution.matched_name(source_node),
                 "targetNodeId": target_node_id,
-                "targetNodeName": self.gds.util.asNode(target_node_id),
+                "targetNodeName": resolution.matched_name(target_node),
                 "results": result_data,
                 "totalResults": len(result_data),
             }
@@ -488,22 +423,17 @@ class MinimumWeightSpanningTreeHandler(AlgorithmHandler):
     def minimum_weight_spanning_tree(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        df = self.gds.run_cypher(query, params={"source_name": source_node})
+        resolution = resolve_node_names(
+            self.gds, [source_node], node_identifier_property
+        )
 
-        if df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(df["source_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Minimum Weight Spanning Tree parameters: {params}")
 
@@ -540,7 +470,9 @@ class MinimumWeightSpanningTreeHandler(AlgorithmHandler):
                 edge_rows.append((node_id, parent_id, weight))
 
             node_pairs = _as_node_pairs(
-                self.gds, [(node_id, parent_id) for node_id, parent_id, _ in edge_rows]
+                self.gds,
+                [(node_id, parent_id) for node_id, parent_id, _ in edge_rows],
+                node_identifier_property,
             )
 
             edges = []
@@ -586,56 +518,30 @@ class MinimumDirectedSteinerTreeHandler(AlgorithmHandler):
         node_identifier_property: str,
         **kwargs,
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
-        # Find source node ID
-        source_query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        source_df = self.gds.run_cypher(
-            source_query, params={"source_name": source_node}
+        # Resolve the source and all target nodes in one lookup
+        resolution = resolve_node_names(
+            self.gds, [source_node, *target_nodes], node_identifier_property
         )
 
-        if source_df.empty:
+        source_node_id = resolution.node_id(source_node)
+        if source_node_id is None:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(source_df["source_id"].iloc[0])
-
-        # Find target node IDs - ensure ALL target nodes are found
-        target_node_ids = []
-        target_node_names = []
-        unmatched_targets = []
-
-        for target_name in target_nodes:
-            target_query = f"""
-            MATCH (target)
-            WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-            RETURN id(target) as target_id, target.{node_identifier_property} as target_name
-            """
-
-            target_df = self.gds.run_cypher(
-                target_query, params={"target_name": target_name}
-            )
-
-            if not target_df.empty:
-                target_node_ids.append(int(target_df["target_id"].iloc[0]))
-                target_node_names.append(target_df["target_name"].iloc[0])
-            else:
-                unmatched_targets.append(target_name)
-
         # Check if all target nodes were found
+        unmatched_targets = [
+            name for name in target_nodes if resolution.node_id(name) is None
+        ]
         if unmatched_targets:
             return {
                 "found": False,
                 "message": f"The following target nodes were not found: {', '.join(unmatched_targets)}",
             }
 
+        target_node_ids = [resolution.node_id(name) for name in target_nodes]
         if not target_node_ids:
             return {"found": False, "message": "No target nodes found"}
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName"])
         logger.info(f"Minimum Directed Steiner Tree parameters: {params}")
 
@@ -668,7 +574,9 @@ class MinimumDirectedSteinerTreeHandler(AlgorithmHandler):
             edge_rows.append((node_id, parent_id, weight))
 
         node_pairs = _as_node_pairs(
-            self.gds, [(node_id, parent_id) for node_id, parent_id, _ in edge_rows]
+            self.gds,
+            [(node_id, parent_id) for node_id, parent_id, _ in edge_rows],
+            node_identifier_property,
         )
 
         edges = []
@@ -705,8 +613,9 @@ class MinimumDirectedSteinerTreeHandler(AlgorithmHandler):
 
 class PrizeCollectingSteinerTreeHandler(AlgorithmHandler):
     def prize_collecting_steiner_tree(self, **kwargs):
-        G = self.gds.graph.get(kwargs.get("graphName"))
-        params = clean_params(kwargs, ["graphName"])
+        node_identifier_property = kwargs.get("nodeIdentifierProperty")
+        G = self.get_graph(kwargs.get("graphName"))
+        params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty"])
         logger.info(f"Prize-Collecting Steiner Tree parameters: {params}")
 
         # Run the prize-collecting steiner tree algorithm
@@ -736,7 +645,9 @@ class PrizeCollectingSteinerTreeHandler(AlgorithmHandler):
             edge_rows.append((node_id, parent_id, weight))
 
         node_pairs = _as_node_pairs(
-            self.gds, [(node_id, parent_id) for node_id, parent_id, _ in edge_rows]
+            self.gds,
+            [(node_id, parent_id) for node_id, parent_id, _ in edge_rows],
+            node_identifier_property,
         )
 
         edges = []
@@ -762,6 +673,7 @@ class PrizeCollectingSteinerTreeHandler(AlgorithmHandler):
     def execute(self, arguments: Dict[str, Any]) -> Any:
         return self.prize_collecting_steiner_tree(
             graphName=arguments.get("graphName"),
+            nodeIdentifierProperty=arguments.get("nodeIdentifierProperty"),
             relationshipWeightProperty=arguments.get("relationshipWeightProperty"),
             prizeProperty=arguments.get("prizeProperty"),
         )
@@ -769,8 +681,9 @@ class PrizeCollectingSteinerTreeHandler(AlgorithmHandler):
 
 class AllPairsShortestPathsHandler(AlgorithmHandler):
     def all_pairs_shortest_paths(self, **kwargs):
-        G = self.gds.graph.get(kwargs.get("graphName"))
-        params = clean_params(kwargs, ["graphName"])
+        node_identifier_property = kwargs.get("nodeIdentifierProperty")
+        G = self.get_graph(kwargs.get("graphName"))
+        params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty"])
         logger.info(f"All Pairs Shortest Paths parameters: {params}")
 
         # Run the all pairs shortest paths algorithm
@@ -779,13 +692,14 @@ class AllPairsShortestPathsHandler(AlgorithmHandler):
         if apsp_data.empty:
             return {"found": False, "message": "No shortest paths found"}
 
-        # Get node names using GDS utility function (batch operation)
-        apsp_data["sourceNodeName"] = self.gds.util.asNodes(
-            apsp_data["sourceNodeId"].tolist()
-        )
-        apsp_data["targetNodeName"] = self.gds.util.asNodes(
-            apsp_data["targetNodeId"].tolist()
+        # Look up only the identifier property of all endpoints in one batch
+        names = fetch_node_names(
+            self.gds,
+            [*apsp_data["sourceNodeId"], *apsp_data["targetNodeId"]],
+            node_identifier_property,
         )
+        apsp_data["sourceNodeName"] = apsp_data["sourceNodeId"].map(names)
+        apsp_data["targetNodeName"] = apsp_data["targetNodeId"].map(names)
 
         # Convert to list of dictionaries
         paths = apsp_data[
@@ -806,6 +720,7 @@ class AllPairsShortestPathsHandler(AlgorithmHandler):
     def execute(self, arguments: Dict[str, Any]) -> Any:
         return self.all_pairs_shortest_paths(
             graphName=arguments.get("graphName"),
+            nodeIdentifierProperty=arguments.get("nodeIdentifierProperty"),
             relationshipWeightProperty=arguments.get("relationshipWeightProperty"),
         )
 
@@ -813,32 +728,20 @@ class AllPairsShortestPathsHandler(AlgorithmHandler):
 class RandomWalkHandler(AlgorithmHandler):
     def random_walk(self, **kwargs):
         mode = kwargs.get("mode", "stream")
+        node_identifier_property = kwargs.get("nodeIdentifierProperty")
         # Process source nodes if provided
         source_node_ids = []
         if "sourceNodes" in kwargs and kwargs["sourceNodes"]:
-            node_identifier_property = kwargs.get("nodeIdentifierProperty")
             if not node_identifier_property:
                 return {
                     "found": False,
                     "message": "nodeIdentifierProperty is required when sourceNodes are provided",
                 }
-            node_identifier_property = _validate_property_name(node_identifier_property)
-
-            for source_name in kwargs["sourceNodes"]:
-                source_query = f"""
-                MATCH (source)
-                WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-                RETURN id(source) as source_id
-                """
-
-                source_df = self.gds.run_cypher(
-                    source_query, params={"source_name": source_name}
-                )
+            source_node_ids = resolve_node_names(
+                self.gds, kwargs["sourceNodes"], node_identifier_property
+            ).node_ids
 
-                if not source_df.empty:
-                    source_node_ids.append(int(source_df["source_id"].iloc[0]))
-
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty", "mode"])
         logger.info(f"Random Walk parameters: {params}")
 
@@ -857,25 +760,12 @@ class RandomWalkHandler(AlgorithmHandler):
             if walk_data.empty:
                 return {"found": False, "message": "No random walks generated"}
 
-            # Convert to native Python types as needed
-            walks = []
-
-            for _, row in walk_data.iterrows():
-                node_ids = row["nodeIds"]
-                # Convert node_ids to list if it's not already
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-
-                # Get node names using GDS utility function
-                node_names = self.gds.util.asNodes(node_ids)
-
-                walks.append(
-                    {
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "walkLength": len(node_ids),
-                    }
-                )
+            # Name the nodes of all walks in one batched lookup
+            walk_data = _with_path_node_names(
+                self.gds, walk_data, node_identifier_property
+            )
+            walk_data["walkLength"] = walk_data["nodeIds"].map(len)
+            walks = walk_data[["nodeIds", "nodeNames", "walkLength"]].to_dict("records")
 
             return {
                 "found": True,
@@ -904,42 +794,24 @@ class BreadthFirstSearchHandler(AlgorithmHandler):
     def breadth_first_search(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        # Find source node ID
-        source_query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        source_df = self.gds.run_cypher(
-            source_query, params={"source_name": source_node}
+        # Resolve the source and any target nodes in one lookup
+        target_nodes = kwargs.get("targetNodes") or []
+        resolution = resolve_node_names(
+            self.gds, [source_node, *target_nodes], node_identifier_property
         )
 
-        if source_df.empty:
+        source_node_id = resolution.node_id(source_node)
+        if source_node_id is None:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(source_df["source_id"].iloc[0])
+        target_node_ids = [
+            resolution.node_id(name)
+            for name in target_nodes
+            if resolution.node_id(name) is not None
+        ]
 
-        # Process target nodes if provided
-        target_node_ids = []
-        if "targetNodes" in kwargs and kwargs["targetNodes"]:
-            for target_name in kwargs["targetNodes"]:
-                target_query = f"""
-                MATCH (target)
-                WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-                RETURN id(target) as target_id
-                """
-
-                target_df = self.gds.run_cypher(
-                    target_query, params={"target_name": target_name}
-                )
-
-                if not target_df.empty:
-                    target_node_ids.append(int(target_df["target_id"].iloc[0]))
-
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty", "mode"])
 
         # Add target nodes if found
@@ -960,28 +832,14 @@ class BreadthFirstSearchHandler(AlgorithmHandler):
                     "message": "No nodes visited in breadth first search",
                 }
 
-            # Convert to native Python types as needed
-            traversals = []
-
-            for _, row in bfs_data.iterrows():
-                source_node = int(row["sourceNode"])
-                node_ids = row["nodeIds"]
-
-                # Convert node_ids to list if it's not already
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-
-                # Get node names using GDS utility function
-                node_names = self.gds.util.asNodes(node_ids)
-
-                traversals.append(
-                    {
-                        "sourceNode": source_node,
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "visitedNodes": len(node_ids),
-                    }
-                )
+            # Name the visited nodes of all traversals in one batched lookup
+            bfs_data = _with_path_node_names(
+                self.gds, bfs_data, node_identifier_property
+            )
+            bfs_data["visitedNodes"] = bfs_data["nodeIds"].map(len)
+            traversals = bfs_data[
+                ["sourceNode", "nodeIds", "nodeNames", "visitedNodes"]
+            ].to_dict("records")
 
             return {
                 "found": True,
@@ -1006,42 +864,24 @@ class DepthFirstSearchHandler(AlgorithmHandler):
     def depth_first_search(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        # Find source node ID
-        source_query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        source_df = self.gds.run_cypher(
-            source_query, params={"source_name": source_node}
+        # Resolve the source and any target nodes in one lookup
+        target_nodes = kwargs.get("targetNodes") or []
+        resolution = resolve_node_names(
+            self.gds, [source_node, *target_nodes], node_identifier_property
         )
 
-        if source_df.empty:
+        source_node_id = resolution.node_id(source_node)
+        if source_node_id is None:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(source_df["source_id"].iloc[0])
+        target_node_ids = [
+            resolution.node_id(name)
+            for name in target_nodes
+            if resolution.node_id(name) is not None
+        ]
 
-        # Process target nodes if provided
-        target_node_ids = []
-        if "targetNodes" in kwargs and kwargs["targetNodes"]:
-            for target_name in kwargs["targetNodes"]:
-                target_query = f"""
-                MATCH (target)
-                WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-                RETURN id(target) as target_id
-                """
-
-                target_df = self.gds.run_cypher(
-                    target_query, params={"target_name": target_name}
-                )
-
-                if not target_df.empty:
-                    target_node_ids.append(int(target_df["target_id"].iloc[0]))
-
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty", "mode"])
         # Add target nodes if found
         if target_node_ids:
@@ -1061,28 +901,14 @@ class DepthFirstSearchHandler(AlgorithmHandler):
                     "message": "No nodes visited in depth first search",
                 }
 
-            # Convert to native Python types as needed
-            traversals = []
-
-            for _, row in dfs_data.iterrows():
-                source_node = int(row["sourceNode"])
-                node_ids = row["nodeIds"]
-
-                # Convert node_ids to list if it's not already
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-
-                # Get node names using GDS utility function
-                node_names = self.gds.util.asNodes(node_ids)
-
-                traversals.append(
-                    {
-                        "sourceNode": source_node,
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "visitedNodes": len(node_ids),
-                    }
-                )
+            # Name the visited nodes of all traversals in one batched lookup
+            dfs_data = _with_path_node_names(
+                self.gds, dfs_data, node_identifier_property
+            )
+            dfs_data["visitedNodes"] = dfs_data["nodeIds"].map(len)
+            traversals = dfs_data[
+                ["sourceNode", "nodeIds", "nodeNames", "visitedNodes"]
+            ].to_dict("records")
 
             return {
                 "found": True,
@@ -1107,25 +933,18 @@ class BellmanFordSingleSourceShortestPathHandler(AlgorithmHandler):
     def bellman_ford_single_source_shortest_path(
         self, source_node: str, node_identifier_property: str, **kwargs
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
         # Find source node ID
-        source_query = f"""
-        MATCH (source)
-        WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-        RETURN id(source) as source_id
-        """
-
-        source_df = self.gds.run_cypher(
-            source_query, params={"source_name": source_node}
+        resolution = resolve_node_names(
+            self.gds, [source_node], node_identifier_property
         )
 
-        if source_df.empty:
+        if resolution.unmatched_names:
             return {"found": False, "message": "Source node name not found"}
 
-        source_node_id = int(source_df["source_id"].iloc[0])
+        source_node_id = resolution.node_id(source_node)
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "nodeIdentifierProperty", "mode"])
         logger.info(f"Bellman-Ford Single-Source Shortest Path parameters: {params}")
 
@@ -1143,39 +962,25 @@ class BellmanFordSingleSourceShortestPathHandler(AlgorithmHandler):
                     "message": "No paths found from the source node",
                 }
 
-            # Convert to native Python types as needed
-            paths = []
-
-            for _, row in bellman_ford_data.iterrows():
-                index = int(row["index"])
-                source_node = int(row["sourceNode"])
-                target_node = int(row["targetNode"])
-                total_cost = float(row["totalCost"])
-                node_ids = row["nodeIds"]
-                costs = row["costs"]
-                is_negative_cycle = bool(row["isNegativeCycle"])
-
-                # Convert arrays to lists if needed
-                if hasattr(node_ids, "tolist"):
-                    node_ids = node_ids.tolist()
-                if hasattr(costs, "tolist"):
-                    costs = costs.tolist()
-
-                # Get node names using GDS utility function
-                node_names = self.gds.util.asNodes(node_ids)
-
-                paths.append(
-                    {
-                        "index": index,
-                        "sourceNode": source_node,
-                        "targetNode": target_node,
-                        "totalCost": total_cost,
-                        "nodeIds": node_ids,
-                        "nodeNames": node_names,
-                        "costs": costs,
-                        "isNegativeCycle": is_negative_cycle,
-                    }
-                )
+            # Name the nodes of all paths in one batched lookup
+            bellman_ford_data = _with_path_node_names(
+                self.gds, bellman_ford_data, node_identifier_property
+            )
+            bellman_ford_data["isNegativeCycle"] = bellman_ford_data[
+                "isNegativeCycle"
+            ].astype(bool)
+            paths = bellman_ford_data[
+                [
+                    "index",
+                    "sourceNode",
+                    "targetNode",
+                    "totalCost",
+                    "nodeIds",
+                    "nodeNames",
+                    "costs",
+                    "isNegativeCycle",
+                ]
+            ].to_dict("records")
 
             return {
                 "found": True,
@@ -1197,29 +1002,19 @@ class BellmanFordSingleSourceShortestPathHandler(AlgorithmHandler):
 
 class LongestPathHandler(AlgorithmHandler):
     def longest_path(self, **kwargs):
+        node_identifier_property = kwargs.get("nodeIdentifierProperty")
         # Process target nodes if provided
         target_node_ids = []
         if "targetNodes" in kwargs and kwargs["targetNodes"]:
-            node_identifier_property = kwargs.get("nodeIdentifierProperty")
             if not node_identifier_property:
                 return {
                     "found": False,
                     "message": "nodeIdentifierProperty is required when targetNodes are provided",
                 }
-            node_identifier_property = _validate_property_name(node_identifier_property)
-
-            for target_name in kwargs["targetNodes"]:
-                target_query = f"""
-                MATCH (target)
-                WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-                RETURN id(target) as target_id
-                """
-                target_df = self.gds.run_cypher(
-                    target_query, params={"target_name": target_name}
-                )
-                if not target_df.empty:
-                    target_node_ids.append(int(target_df["target_id"].iloc[0]))
-        G = self.gds.graph.get(kwargs.get("graphName"))
+            target_node_ids = resolve_node_names(
+                self.gds, kwargs["targetNodes"], node_identifier_property
+            ).node_ids
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(
             kwargs,
             ["graphName", "nodeIdentifierProperty", "targetNodes"],
@@ -1235,41 +1030,27 @@ class LongestPathHandler(AlgorithmHandler):
                 "message": "No longest paths found. The graph may contain cycles or be empty.",
             }
 
-        # Convert to native Python types as needed
-        paths = []
-
-        for _, row in longest_path_data.iterrows():
-            index = int(row["index"])
-            source_node = int(row["sourceNode"])
-            target_node = int(row["targetNode"])
-            total_cost = float(row["totalCost"])
-            node_ids = row["nodeIds"]
-            costs = row["costs"]
-
-            # Filter by target nodes if specified
-            if target_node_ids and target_node not in target_node_ids:
-                continue
-
-            # Convert arrays to lists if needed
-            if hasattr(node_ids, "tolist"):
-                node_ids = node_ids.tolist()
-            if hasattr(costs, "tolist"):
-                costs = costs.tolist()
-
-            # Get node names using GDS utility function
-            node_names = self.gds.util.asNodes(node_ids)
+        # Filter by target nodes if specified, before naming any nodes
+        if target_node_ids:
+            longest_path_data = longest_path_data[
+                longest_path_data["targetNode"].isin(target_node_ids)
+            ]
 
-            paths.append(
-                {
-                    "index": index,
-                    "sourceNode": source_node,
-                    "targetNode": target_node,
-                    "totalCost": total_cost,
-                    "nodeIds": node_ids,
-                    "nodeNames": node_names,
-                    "costs": costs,
-                }
-            )
+        # Name the nodes of all paths in one batched lookup
+        longest_path_data = _with_path_node_names(
+            self.gds, longest_path_data, node_identifier_property
+        )
+        paths = longest_path_data[
+            [
+                "index",
+                "sourceNode",
+                "targetNode",
+                "totalCost",
+                "nodeIds",
+                "nodeNames",
+                "costs",
+            ]
+        ].to_dict("records")
 
         return {
             "found": True,
@@ -1293,72 +1074,41 @@ class MaxFlowHandler(AlgorithmHandler):
         node_identifier_property: str,
         **kwargs,
     ):
-        node_identifier_property = _validate_property_name(node_identifier_property)
         mode = kwargs.get("mode", "stream")
-        source_node_ids = []
-        source_node_names = []
-        unmatched_sources = []
-
-        for source_name in source_nodes:
-            source_query = f"""
-            MATCH (source)
-            WHERE toLower(source.{node_identifier_property}) CONTAINS toLower($source_name)
-            RETURN id(source) as source_id, source.{node_identifier_property} as source_name
-            """
-
-            source_df = self.gds.run_cypher(
-                source_query, params={"source_name": source_name}
-            )
-
-            if not source_df.empty:
-                source_node_ids.append(int(source_df["source_id"].iloc[0]))
-                source_node_names.append(source_df["source_name"].iloc[0])
-            else:
-                unmatched_sources.append(source_name)
+        # Resolve all source and target nodes in one lookup
+        resolution = resolve_node_names(
+            self.gds, [*source_nodes, *target_nodes], node_identifier_property
+        )
 
         # Check if all source nodes were found
+        unmatched_sources = [
+            name for name in source_nodes if resolution.node_id(name) is None
+        ]
         if unmatched_sources:
             return {
                 "found": False,
                 "message": f"The following source nodes were not found: {', '.join(unmatched_sources)}",
             }
 
+        source_node_ids = [resolution.node_id(name) for name in source_nodes]
         if not source_node_ids:
             return {"found": False, "message": "No source nodes found"}
 
-        # Find target node IDs
-        target_node_ids = []
-        target_node_names = []
-        unmatched_targets = []
-
-        for target_name in target_nodes:
-            target_query = f"""
-            MATCH (target)
-            WHERE toLower(target.{node_identifier_property}) CONTAINS toLower($target_name)
-            RETURN id(target) as target_id, target.{node_identifier_property} as target_name
-            """
-
-            target_df = self.gds.run_cypher(
-                target_query, params={"target_name": target_name}
-            )
-
-            if not target_df.empty:
-                target_node_ids.append(int(target_df["target_id"].iloc[0]))
-                target_node_names.append(target_df["target_name"].iloc[0])
-            else:
-                unmatched_targets.append(target_name)
-
         # Check if all target nodes were found
+        unmatched_targets = [
+            name for name in target_nodes if resolution.node_id(name) is None
+        ]
         if unmatched_targets:
             return {
                 "found": False,
                 "message": f"The following target nodes were not found: {', '.join(unmatched_targets)}",
             }
 
+        target_node_ids = [resolution.node_id(name) for name in target_nodes]
         if not target_node_ids:
             return {"found": False, "message": "No target nodes found"}
 
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         params = clean_params(kwargs, ["graphName", "mode"])
         logger.info(f"Max Flow parameters: {params}")
 
@@ -1371,13 +1121,14 @@ class MaxFlowHandler(AlgorithmHandler):
                 G, sourceNodes=source_node_ids, targetNodes=target_node_ids, **params
             )
 
-            # Get node names using GDS utility function (batch operation)
-            max_flow_data["sourceNodeName"] = self.gds.util.asNodes(
-                max_flow_data["source"].tolist()
-            )
-            max_flow_data["targetNodeName"] = self.gds.util.asNodes(
-                max_flow_data["target"].tolist()
+            # Look up only the identifier property of all endpoints in one batch
+            names = fetch_node_names(
+                self.gds,
+                [*max_flow_data["source"], *max_flow_data["target"]],
+                node_identifier_property,
             )
+            max_flow_data["sourceNodeName"] = max_flow_data["source"].map(names)
+            max_flow_data["targetNodeName"] = max_flow_data["target"].map(names)
 
             # Convert to list of dictionaries
             flows = max_flow_data[
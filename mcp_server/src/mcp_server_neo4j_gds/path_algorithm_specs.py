@@ -377,6 +377,10 @@ path_tool_definitions = [
                     "type": "string",
                     "description": "The name of node property that denotes a node's prize.",
                 },
+                "nodeIdentifierProperty": {
+                    "type": "string",
+                    "description": "Property name used to name the nodes in the result (e.g., 'name', 'Name', 'title'). If unspecified, nodes are shown as their labels and a small set of properties.",
+                },
             },
             "required": ["graphName", "prizeProperty"],
         },
@@ -400,6 +404,10 @@ path_tool_definitions = [
                     "type": "string",
                     "description": "Name of the relationship property to use as weights. If unspecified, the algorithm runs unweighted.",
                 },
+                "nodeIdentifierProperty": {
+                    "type": "string",
+                    "description": "Property name used to name the nodes in the result (e.g., 'name', 'Name', 'title'). If unspecified, nodes are shown as their labels and a small set of properties.",
+                },
             },
             "required": ["graphName"],
         },
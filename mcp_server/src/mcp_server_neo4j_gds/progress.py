@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import os
+
+from .gds import is_session_gds
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_PROGRESS_INTERVAL = 2.0
+PROGRESS_INTERVAL_ENV = "GDS_AGENT_PROGRESS_INTERVAL"
+
+
+def progress_interval() -> float:
+    """Seconds between progress polls; 0 disables progress notifications."""
+    try:
+        value = float(os.getenv(PROGRESS_INTERVAL_ENV, DEFAULT_PROGRESS_INTERVAL))
+    except ValueError:
+        return DEFAULT_PROGRESS_INTERVAL
+    return max(value, 0)
+
+
+def _percent(progress):
+    # gds.listProgress reports e.g. '42.5%', or 'n/a' for tasks without volume
+    try:
+        return float(str(progress).strip().rstrip("%"))
+    except ValueError:
+        return None
+
+
+def job_progress(gds, job_id: str) -> tuple[float, str] | None:
+    """(percent done, message) of the root task of a GDS job, None if unknown."""
+    if is_session_gds(gds):
+        # Cypher on a session connection reaches the database, not the session
+        rows = gds.listProgress(job_id)
+    else:
+        rows = gds.run_cypher(
+            """
+            CALL gds.listProgress($job_id) YIELD taskName, progress, status
+            RETURN taskName, progress, status
+            """,
+            params={"job_id": job_id},
+        )
+    if rows is None or len(rows) == 0:
+        return None
+    root = rows.iloc[0]
+    percent = _percent(root["progress"])
+    if percent is None:
+        return None
+    return percent, f"{str(root['taskName']).strip()}: {root['status']}"
+
+
+async def report_progress(send, poll, interval: float):
+    """Poll a running job every ``interval`` seconds until cancelled.
+
+    ``poll()`` blocks and returns job_progress; every increase is passed to
+    ``send(percent, message)``. Progress values never go backwards, as MCP
+    requires, even when a job moves on to a task that starts at 0%.
+    """
+    last = None
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            progress = await asyncio.to_thread(poll)
+        except Exception as e:
+            logger.debug(f"Progress poll failed: {e}")
+            continue
+        if progress is None:
+            continue
+        percent, message = progress
+        if last is not None and percent <= last:
+            continue
+        last = percent
+        await send(percent, message)
@@ -0,0 +1,307 @@
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_CURSOR_TTL = 900
+DEFAULT_CURSOR_MAX_MB = 512
+CURSOR_TTL_ENV = "GDS_AGENT_CURSOR_TTL"
+CURSOR_MAX_MB_ENV = "GDS_AGENT_CURSOR_MAX_MB"
+SCRATCH_DIR_ENV = "GDS_AGENT_SCRATCH_DIR"
+
+CURSOR_ID_ATTR = "gds_agent_cursor_id"
+
+# Rows per record batch of a spilled result
+SPILL_BATCH_ROWS = 65_536
+
+# Set while a tool call that asked for a cursor is executed
+_cursor_requested = ContextVar("gds_agent_cursor_requested", default=False)
+
+
+def _env_number(name, default, cast=int):
+    try:
+        value = cast(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def cursor_ttl() -> float:
+    """Seconds a cursor is kept after it was last read."""
+    return _env_number(CURSOR_TTL_ENV, DEFAULT_CURSOR_TTL, float)
+
+
+def cursor_max_bytes() -> int:
+    return _env_number(CURSOR_MAX_MB_ENV, DEFAULT_CURSOR_MAX_MB) * 1024 * 1024
+
+
+_scratch_dir = None
+_scratch_dir_lock = threading.Lock()
+
+
+def scratch_dir() -> str:
+    """Directory spilled results are written to, created on first use.
+
+    GDS_AGENT_SCRATCH_DIR selects the parent directory; the server's own
+    subdirectory is removed when the process exits.
+    """
+    global _scratch_dir
+    with _scratch_dir_lock:
+        if _scratch_dir is None:
+            parent = os.getenv(SCRATCH_DIR_ENV) or None
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            _scratch_dir = tempfile.mkdtemp(prefix="gds-agent-", dir=parent)
+            atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+        return _scratch_dir
+
+
+@contextmanager
+def result_cursor(enabled: bool = True):
+    """Keep results truncated inside the block as cursors for fetch_page."""
+    if not enabled:
+        yield
+        return
+    token = _cursor_requested.set(True)
+    try:
+        yield
+    finally:
+        _cursor_requested.reset(token)
+
+
+def _where_mask(table, where: dict):
+    column = where.get("column")
+    if column not in table.column_names:
+        columns = ", ".join(table.column_names)
+        raise ValueError(f"Cannot filter on '{column}'. Available columns: {columns}")
+    values = table[column]
+    conditions = []
+    if "equals" in where:
+        conditions.append(pc.equal(values, where["equals"]))
+    if "min" in where:
+        conditions.append(pc.greater_equal(values, where["min"]))
+    if "max" in where:
+        conditions.append(pc.less_equal(values, where["max"]))
+    if not conditions:
+        raise ValueError("where needs at least one of equals, min or max")
+    mask = conditions[0]
+    for condition in conditions[1:]:
+        mask = pc.and_(mask, condition)
+    return mask
+
+
+def _group_rows(table, column: str):
+    """One row per value of ``column``: its row count and, for every
+    floating point column, the min, mean and max, largest groups first."""
+    if column not in table.column_names:
+        columns = ", ".join(table.column_names)
+        raise ValueError(f"Cannot group by '{column}'. Available columns: {columns}")
+    aggregations = [(column, "count")]
+    for field in table.schema:
+        if field.name != column and pa.types.is_floating(field.type):
+            aggregations += [(field.name, name) for name in ("min", "mean", "max")]
+    grouped = table.group_by(column).aggregate(aggregations)
+    grouped = grouped.rename_columns(
+        ["rows" if name == f"{column}_count" else name for name in grouped.column_names]
+    )
+    return grouped.sort_by([("rows", "descending"), (column, "ascending")])
+
+
+class Cursor:
+    """A full stream result spilled to an Arrow IPC file, read one page at a time.
+
+    Pages are sliced out of a memory map of the file, so a cursor costs disk
+    space but no memory between reads, whatever the size of the result.
+    """
+
+    def __init__(self, path: str, num_rows: int):
+        self.cursor_id = os.path.splitext(os.path.basename(path))[0]
+        self.path = path
+        self.num_rows = num_rows
+        self.nbytes = os.path.getsize(path)
+        # Name translations applied to the first page, replayed on every page
+        self.translations = []
+        self.last_used = time.monotonic()
+
+    @classmethod
+    def spill(cls, frame, directory: str) -> "Cursor":
+        path = os.path.join(directory, f"{uuid.uuid4()}.arrow")
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        try:
+            with (
+                pa.OSFile(path, "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table, max_chunksize=SPILL_BATCH_ROWS)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(path)
+            raise
+        return cls(path, table.num_rows)
+
+    def table(self):
+        # Zero-copy: the table's buffers point into the memory map
+        return pa.ipc.open_file(pa.memory_map(self.path)).read_all()
+
+    def remove(self):
+        with suppress(OSError):
+            os.remove(self.path)
+
+    def __len__(self):
+        return self.num_rows
+
+
+class CursorStore:
+    """Cursors of truncated results, bounded by idle time and total size.
+
+    Cursors idle for longer than the TTL are dropped; when the spilled files
+    exceed the size cap, the least recently read cursors go first.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        directory: str | None = None,
+    ):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._directory = directory
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return cursor_max_bytes() if self._max_bytes is None else self._max_bytes
+
+    @property
+    def ttl(self) -> float:
+        return cursor_ttl() if self._ttl is None else self._ttl
+
+    @property
+    def directory(self) -> str:
+        return scratch_dir() if self._directory is None else self._directory
+
+    def _evict(self, now, needed=0):
+        evicted = [
+            cursor
+            for cursor in self._cursors.values()
+            if now - cursor.last_used > self.ttl
+        ]
+        size = sum(cursor.nbytes for cursor in self._cursors.values())
+        size -= sum(cursor.nbytes for cursor in evicted)
+        for cursor in sorted(self._cursors.values(), key=lambda c: c.last_used):
+            if size + needed <= self.max_bytes:
+                break
+            if cursor not in evicted:
+                size -= cursor.nbytes
+                evicted.append(cursor)
+                logger.info(f"Evicted result cursor {cursor.cursor_id}")
+        for cursor in evicted:
+            del self._cursors[cursor.cursor_id]
+        return evicted
+
+    def open(self, frame) -> Cursor | None:
+        """Spill ``frame`` as a new cursor, None if it cannot be kept."""
+        try:
+            cursor = Cursor.spill(frame, self.directory)
+        except (pa.ArrowException, OSError) as e:
+            logger.info(f"Could not spill result for a cursor: {e}")
+            return None
+        if cursor.nbytes > self.max_bytes:
+            logger.info(
+                f"Result of {cursor.nbytes} bytes exceeds the cursor size cap, not kept"
+            )
+            cursor.remove()
+            return None
+        with self._lock:
+            evicted = self._evict(cursor.last_used, cursor.nbytes)
+            self._cursors[cursor.cursor_id] = cursor
+        for old in evicted:
+            old.remove()
+        return cursor
+
+    def get(self, cursor_id: str) -> Cursor:
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._evict(now)
+            cursor = self._cursors.get(cursor_id)
+            if cursor is not None:
+                cursor.last_used = now
+        for old in evicted:
+            old.remove()
+        if cursor is None:
+            raise ValueError(
+                f"Unknown or expired cursor '{cursor_id}'. Cursors are kept for "
+                f"{self.ttl:g} seconds after their last read; run the tool again."
+            )
+        return cursor
+
+    def add_translation(self, cursor_id: str, translate):
+        """Replace every page read from the cursor by ``translate(page)``."""
+        with self._lock:
+            cursor = self._cursors.get(cursor_id)
+            if cursor is not None:
+                cursor.translations.append(translate)
+
+    def page(
+        self,
+        cursor_id: str,
+        offset: int,
+        size: int,
+        where: dict | None = None,
+        group_by: str | None = None,
+    ):
+        """(rows offset..offset+size, total rows) of the cursor's result.
+
+        ``where`` keeps rows whose column equals a value or lies within
+        min/max; ``group_by`` pages through per-group aggregates instead of
+        rows. Name translations are applied to result rows, not to groups.
+        """
+        cursor = self.get(cursor_id)
+        table = cursor.table()
+        if where:
+            table = table.filter(_where_mask(table, where))
+        if group_by:
+            table = _group_rows(table, group_by)
+        rows = table.slice(offset, size).to_pandas()
+        if not group_by:
+            for translate in cursor.translations:
+                rows = translate(rows)
+        return rows, table.num_rows
+
+    def invalidate(self):
+        with self._lock:
+            cursors = list(self._cursors.values())
+            self._cursors.clear()
+        for cursor in cursors:
+            cursor.remove()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "cursors": len(self._cursors),
+                "bytes": sum(cursor.nbytes for cursor in self._cursors.values()),
+                "maxBytes": self.max_bytes,
+            }
+
+
+cursor_store = CursorStore()
+
+
+def open_result_cursor(frame) -> Cursor | None:
+    """Keep a truncated result as a cursor if the current tool call asked for one."""
+    if not _cursor_requested.get():
+        return None
+    return cursor_store.open(frame)
@@ -0,0 +1,201 @@
+import csv
+import io
+import json
+import logging
+import os
+
+import pandas as pd
+
+from .result_limits import (
+    dataframe_limit_warning,
+    limit_dataframe_rows,
+    limit_text,
+    max_cell_chars,
+    max_result_chars,
+)
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+OUTPUT_FORMATS = ("table", "csv", "json", "markdown")
+DEFAULT_OUTPUT_FORMAT = "table"
+OUTPUT_FORMAT_ENV = "GDS_AGENT_OUTPUT_FORMAT"
+
+OUTPUT_FORMAT_PROPERTY = {
+    "type": "string",
+    "enum": list(OUTPUT_FORMATS),
+    "description": "Encoding of tabular results: 'table' (aligned text), 'csv', "
+    "'json' (column-oriented) or 'markdown'. Defaults to the server setting.",
+}
+
+
+def resolve_output_format(requested: str | None = None) -> str:
+    """The requested format, else the server default from GDS_AGENT_OUTPUT_FORMAT."""
+    if requested:
+        output_format = requested.strip().lower()
+        if output_format not in OUTPUT_FORMATS:
+            supported = ", ".join(OUTPUT_FORMATS)
+            raise ValueError(
+                f"Unsupported output format '{requested}'. Supported formats: {supported}"
+            )
+        return output_format
+
+    output_format = os.getenv(OUTPUT_FORMAT_ENV, DEFAULT_OUTPUT_FORMAT).strip().lower()
+    if output_format not in OUTPUT_FORMATS:
+        logger.warning(
+            f"Ignoring unsupported {OUTPUT_FORMAT_ENV} '{output_format}', "
+            f"using '{DEFAULT_OUTPUT_FORMAT}'"
+        )
+        return DEFAULT_OUTPUT_FORMAT
+    return output_format
+
+
+def _truncate(text, cell_limit):
+    if len(text) <= cell_limit:
+        return text
+    return text[: max(cell_limit - 3, 0)] + "..."
+
+
+def _plain(value):
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if not isinstance(value, (list, dict, str)) and pd.isna(value):
+        return None
+    return value
+
+
+def _text_cell(value, cell_limit):
+    value = _plain(value)
+    if value is None:
+        text = ""
+    elif isinstance(value, str):
+        text = value
+    elif isinstance(value, (list, dict)):
+        text = json.dumps(value, default=str)
+    else:
+        text = str(value)
+    return _truncate(text, cell_limit)
+
+
+def _json_cell(value, cell_limit):
+    text = json.dumps(_plain(value), default=str)
+    if len(text) > cell_limit:
+        return json.dumps(_truncate(text, cell_limit))
+    return text
+
+
+def _char_limit_note(written, total_rows, char_limit):
+    return (
+        f"[truncated to {written} of {total_rows} rows to stay within "
+        f"{char_limit} characters]"
+    )
+
+
+def _csv_lines(columns, rows, cell_limit):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="")
+
+    def line(cells):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(cells)
+        return buffer.getvalue()
+
+    yield line(columns)
+    for row in rows:
+        yield line(_text_cell(value, cell_limit) for value in row)
+
+
+def _markdown_lines(columns, rows, cell_limit):
+    def line(cells):
+        escaped = (cell.replace("|", "\\|").replace("\n", " ") for cell in cells)
+        return "| " + " | ".join(escaped) + " |"
+
+    yield line(columns)
+    yield "|" + "|".join(" --- " for _ in columns) + "|"
+    for row in rows:
+        yield line(_text_cell(value, cell_limit) for value in row)
+
+
+def _encode_lines(lines, header_count, total_rows, warning):
+    """Join encoded lines until the character budget is spent.
+
+    Lines are produced lazily, so rows past the budget are never encoded.
+    """
+    char_limit = max_result_chars()
+    parts = [warning, ""] if warning else []
+    size = sum(len(part) + 1 for part in parts)
+    written = -header_count
+    for line in lines:
+        if written >= 0 and size + len(line) + 1 > char_limit:
+            parts.append(_char_limit_note(written, total_rows, char_limit))
+            break
+        parts.append(line)
+        size += len(line) + 1
+        written += 1
+    return "\n".join(parts)
+
+
+def _encode_json(columns, rows, total_rows, warning, cell_limit):
+    char_limit = max_result_chars()
+    cells = [[] for _ in columns]
+    size = sum(len(json.dumps(column)) + 6 for column in columns) + 64
+    if warning:
+        size += len(json.dumps(warning))
+    written = 0
+    for row in rows:
+        encoded = [_json_cell(value, cell_limit) for value in row]
+        row_size = sum(len(cell) + 2 for cell in encoded)
+        if size + row_size > char_limit:
+            note = _char_limit_note(written, total_rows, char_limit)
+            warning = f"{warning} {note}" if warning else note
+            break
+        for column_cells, cell in zip(cells, encoded):
+            column_cells.append(cell)
+        size += row_size
+        written += 1
+
+    encoded_columns = ", ".join(
+        f"{json.dumps(column)}: [{', '.join(column_cells)}]"
+        for column, column_cells in zip(columns, cells)
+    )
+    text = f'{{"rowCount": {written}, "columns": {{{encoded_columns}}}'
+    if warning:
+        text += f', "warning": {json.dumps(warning)}'
+    return text + "}"
+
+
+def encode_dataframe(dataframe, output_format: str | None = None) -> str:
+    """Encode a result DataFrame, applying row, cell and character limits."""
+    output_format = resolve_output_format(output_format)
+    dataframe = limit_dataframe_rows(dataframe)
+    warning = dataframe_limit_warning(dataframe)
+    cell_limit = max_cell_chars()
+
+    if output_format == "table":
+        with pd.option_context(
+            "display.max_rows",
+            None,
+            "display.max_columns",
+            None,
+            "display.width",
+            None,
+            "display.max_colwidth",
+            cell_limit,
+        ):
+            text = dataframe.to_string(index=True)
+        if warning:
+            text = f"{warning}\n\n{text}"
+        return limit_text(text)
+
+    columns = [str(column) for column in dataframe.columns]
+    rows = zip(*(dataframe[column].tolist() for column in dataframe.columns))
+    total_rows = len(dataframe)
+    if output_format == "json":
+        return _encode_json(columns, rows, total_rows, warning, cell_limit)
+    if output_format == "csv":
+        return _encode_lines(
+            _csv_lines(columns, rows, cell_limit), 1, total_rows, warning
+        )
+    return _encode_lines(
+        _markdown_lines(columns, rows, cell_limit), 2, total_rows, warning
+    )
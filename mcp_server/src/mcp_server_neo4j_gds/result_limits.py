@@ -1,4 +1,10 @@
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+
+from .result_cursors import CURSOR_ID_ATTR, cursor_ttl, open_result_cursor
 
 DEFAULT_MAX_RESULT_ROWS = 500
 DEFAULT_MAX_RESULT_CHARS = 100_000
@@ -10,6 +16,11 @@ MAX_CELL_CHARS_ENV = "GDS_AGENT_MAX_CELL_CHARS"
 
 SOURCE_ROW_COUNT_ATTR = "gds_agent_source_row_count"
 
+# (limit, order_by, ascending) requested for the tool call being executed
+_result_ordering = ContextVar("result_ordering", default=None)
+# Set while a background job runs; its result is paged instead of truncated
+_full_results = ContextVar("full_results", default=False)
+
 
 def _env_int(name: str, default: int) -> int:
     try:
@@ -31,14 +42,88 @@ def max_cell_chars() -> int:
     return _env_int(MAX_CELL_CHARS_ENV, DEFAULT_MAX_CELL_CHARS)
 
 
+@contextmanager
+def result_ordering(limit=None, order_by=None, ascending=None):
+    """Keep only the top ``limit`` rows by ``order_by`` wherever results are
+    limited while the block runs, so name lookups and serialization only
+    see the selected rows."""
+    if limit is None and order_by is None:
+        yield
+        return
+    if limit is not None and (
+        isinstance(limit, bool) or not isinstance(limit, int) or limit < 1
+    ):
+        raise ValueError(f"limit must be a positive integer, got {limit!r}")
+    token = _result_ordering.set((limit, order_by, bool(ascending)))
+    try:
+        yield
+    finally:
+        _result_ordering.reset(token)
+
+
+@contextmanager
+def full_results():
+    """Keep every result row while the block runs, e.g. for paged job results."""
+    token = _full_results.set(True)
+    try:
+        yield
+    finally:
+        _full_results.reset(token)
+
+
+def pushed_down_ordering(columns):
+    """(limit, order_by, ascending) to select inside the query streaming
+    ``columns``, or None when the whole stream is needed."""
+    ordering = _result_ordering.get()
+    if ordering is None or _full_results.get():
+        return None
+    limit, order_by, ascending = ordering
+    if limit is None:
+        return None
+    if order_by is None and "score" in columns:
+        order_by = "score"
+    if order_by is not None and order_by not in columns:
+        # Left to order_dataframe_rows, which reports the available columns
+        return None
+    return limit, order_by, ascending
+
+
+def order_dataframe_rows(dataframe):
+    ordering = _result_ordering.get()
+    if ordering is None:
+        return dataframe
+    limit, order_by, ascending = ordering
+    if order_by is None and "score" in dataframe.columns:
+        order_by = "score"
+    if order_by is None:
+        return dataframe if limit is None else dataframe.head(limit)
+    if order_by not in dataframe.columns:
+        columns = ", ".join(str(column) for column in dataframe.columns)
+        raise ValueError(
+            f"Cannot order results by '{order_by}'. Available columns: {columns}"
+        )
+
+    if limit is not None and pd.api.types.is_numeric_dtype(dataframe[order_by]):
+        # Partial selection instead of a full sort
+        if ascending:
+            return dataframe.nsmallest(limit, order_by)
+        return dataframe.nlargest(limit, order_by)
+    ordered = dataframe.sort_values(order_by, ascending=ascending, kind="stable")
+    return ordered if limit is None else ordered.head(limit)
+
+
 def limit_dataframe_rows(dataframe):
+    dataframe = order_dataframe_rows(dataframe)
     row_limit = max_result_rows()
     total_rows = len(dataframe)
-    if total_rows <= row_limit:
+    if total_rows <= row_limit or _full_results.get():
         return dataframe
 
     limited = dataframe.head(row_limit).copy()
     limited.attrs[SOURCE_ROW_COUNT_ATTR] = total_rows
+    cursor = open_result_cursor(dataframe)
+    if cursor is not None:
+        limited.attrs[CURSOR_ID_ATTR] = cursor.cursor_id
     return limited
 
 
@@ -47,6 +132,14 @@ def dataframe_limit_warning(dataframe) -> str | None:
     if total_rows is None:
         return None
 
+    cursor_id = dataframe.attrs.get(CURSOR_ID_ATTR)
+    if cursor_id is not None:
+        return (
+            f"Warning: output truncated to the first {len(dataframe)} of {total_rows} rows. "
+            f"The full result is kept as cursor '{cursor_id}' for {cursor_ttl():g} seconds "
+            f"after its last read: call fetch_page with cursor '{cursor_id}' and "
+            f"offset {len(dataframe)} for the next rows."
+        )
     return (
         f"Warning: output truncated to the first {len(dataframe)} of {total_rows} rows "
         "to keep the MCP server responsive. For full graph-scale results, prefer running "
@@ -0,0 +1,160 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .gds import is_session_gds
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+LARGEST_COMMUNITIES = 10
+
+# Parameters only the stream/write modes accept; they filter the returned rows
+STREAM_ONLY_PARAMETERS = ("mutateProperty", "minCommunitySize", "minComponentSize")
+
+
+def _plain(value):
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def stats_summary(stats) -> dict:
+    """The single stats row of an algorithm as a dict, without its configuration."""
+    if isinstance(stats, pd.DataFrame):
+        stats = stats.iloc[0]
+    summary = {key: _plain(value) for key, value in dict(stats).items()}
+    summary.pop("configuration", None)
+    return summary
+
+
+def _stats_params(params):
+    return {
+        key: value for key, value in params.items() if key not in STREAM_ONLY_PARAMETERS
+    }
+
+
+def _histogram_bucket(bucket, communities):
+    return {
+        "minSize": 2**bucket,
+        "maxSize": 2 ** (bucket + 1) - 1,
+        "communities": communities,
+    }
+
+
+def _size_totals(id_column, communities, nodes, min_size, max_size) -> dict:
+    """Community count and size distribution, named like the stats mode
+    fields, e.g. communityCount or componentCount."""
+    prefix = id_column.removesuffix("Id")
+    return {
+        f"{prefix}Count": communities,
+        "nodeCount": nodes,
+        f"{prefix}Distribution": {
+            "min": min_size,
+            "max": max_size,
+            "mean": nodes / communities if communities else 0,
+        },
+    }
+
+
+def _local_size_histogram(sizes, largest):
+    """Histogram of the community sizes in a Series of {community id: size}."""
+    sizes = sizes.sort_values(ascending=False, kind="stable")
+    # frexp is exact for integers, unlike floor(log2(size))
+    buckets = pd.Series(np.frexp(sizes.to_numpy(dtype=float))[1] - 1, index=sizes.index)
+    histogram = [
+        _histogram_bucket(int(bucket), int(count))
+        for bucket, count in buckets.value_counts().sort_index().items()
+    ]
+    largest_communities = [
+        {"communityId": _plain(community_id), "size": int(size)}
+        for community_id, size in sizes.head(largest).items()
+    ]
+    return histogram, largest_communities
+
+
+def _grouped_size_histogram(gds, procedure, id_column, G, params, largest):
+    """Group community sizes into power-of-two buckets inside the database.
+
+    Only one row per bucket crosses the wire, carrying the largest communities
+    of that bucket.
+    """
+    query = f"""
+    CALL {procedure}.stream($graph_name, $config) YIELD {id_column} AS communityId
+    WITH communityId, count(*) AS size
+    ORDER BY size DESC
+    WITH toInteger(floor(log(size) / log(2) + 1e-12)) AS bucket,
+         collect({{communityId: communityId, size: size}}) AS members,
+         sum(size) AS nodes, min(size) AS minSize, max(size) AS maxSize
+    RETURN bucket, size(members) AS communities, members[..$largest] AS largest,
+           nodes, minSize, maxSize
+    ORDER BY bucket DESC
+    """
+    rows = gds.run_cypher(
+        query,
+        params={"graph_name": G.name(), "config": params, "largest": largest},
+    )
+
+    histogram = []
+    largest_communities = []
+    records = rows.to_dict("records")
+    for row in records:
+        histogram.append(_histogram_bucket(int(row["bucket"]), int(row["communities"])))
+        # Buckets arrive largest first, so the first members are the largest overall
+        largest_communities.extend(_plain(row["largest"]))
+    histogram.reverse()
+    totals = _size_totals(
+        id_column,
+        sum(int(row["communities"]) for row in records),
+        sum(int(row["nodes"]) for row in records),
+        min((int(row["minSize"]) for row in records), default=0),
+        max((int(row["maxSize"]) for row in records), default=0),
+    )
+    return totals, histogram, largest_communities[:largest]
+
+
+def community_summary(
+    gds,
+    algorithm,
+    procedure: str,
+    G,
+    params: dict,
+    id_column: str = "communityId",
+    largest: int = LARGEST_COMMUNITIES,
+) -> dict:
+    """Community count, size distribution and largest communities.
+
+    Every field comes from one run of the algorithm, whose community sizes
+    are grouped into a histogram, so per-node rows are never returned to the
+    client and randomized algorithms report one consistent result.
+    """
+    stream_params = {
+        key: value for key, value in params.items() if key != "mutateProperty"
+    }
+    if is_session_gds(gds):
+        # Sessions run Cypher against the database, not the session's graphs
+        sizes = algorithm.stream(G, **stream_params)[id_column].value_counts()
+        histogram, largest_communities = _local_size_histogram(sizes, largest)
+        summary = _size_totals(
+            id_column,
+            len(sizes),
+            int(sizes.sum()),
+            int(sizes.min()) if len(sizes) else 0,
+            int(sizes.max()) if len(sizes) else 0,
+        )
+    else:
+        summary, histogram, largest_communities = _grouped_size_histogram(
+            gds, procedure, id_column, G, stream_params, largest
+        )
+    summary["sizeHistogram"] = histogram
+    summary["largestCommunities"] = largest_communities
+    return summary
+
+
+def centrality_summary(algorithm, G, params: dict) -> dict:
+    """Stats-mode result of a centrality algorithm, including score percentiles."""
+    return stats_summary(algorithm.stats(G, **_stats_params(params)))
@@ -0,0 +1,251 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import suppress
+
+import pandas as pd
+
+from .node_cache import database_key
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_SCHEMA_CACHE_TTL = 300
+SCHEMA_CACHE_TTL_ENV = "GDS_AGENT_SCHEMA_CACHE_TTL"
+
+# Property type names reported by db.schema.*TypeProperties, grouped by how
+# they can be projected into GDS.
+INTEGER_TYPES = frozenset({"Long", "Integer", "Short", "Byte", "INTEGER"})
+FLOAT_TYPES = frozenset({"Double", "Float", "FLOAT"})
+INTEGER_LIST_TYPES = frozenset(
+    {"LongArray", "IntegerArray", "ShortArray", "ByteArray", "LIST<INTEGER NOT NULL>"}
+)
+FLOAT_LIST_TYPES = frozenset({"DoubleArray", "FloatArray", "LIST<FLOAT NOT NULL>"})
+
+
+def schema_cache_ttl() -> float:
+    """Seconds a cached schema stays valid; 0 disables the cache."""
+    try:
+        value = float(os.getenv(SCHEMA_CACHE_TTL_ENV, DEFAULT_SCHEMA_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_SCHEMA_CACHE_TTL
+    return max(value, 0)
+
+
+def _names(value):
+    if value is None or isinstance(value, float):
+        return ()
+    return tuple(value)
+
+
+def _relationship_type(rel_type):
+    # relTypeProperties reports types as :`TYPE`
+    if rel_type.startswith(":`") and rel_type.endswith("`"):
+        return rel_type[2:-1].replace("``", "`")
+    return rel_type.lstrip(":")
+
+
+def _projectable_type(property_types):
+    if not property_types:
+        return None
+    if property_types <= INTEGER_TYPES:
+        return "INTEGER"
+    if property_types <= INTEGER_TYPES | FLOAT_TYPES:
+        return "FLOAT"
+    if property_types <= INTEGER_LIST_TYPES:
+        return "INTEGER_LIST"
+    if property_types <= INTEGER_LIST_TYPES | FLOAT_LIST_TYPES:
+        return "FLOAT_LIST"
+    return None
+
+
+class GraphSchema:
+    """Labels, relationship types and property types of a database.
+
+    Built from the rows of db.schema.nodeTypeProperties() and
+    db.schema.relTypeProperties(), so one pass answers the questions that
+    otherwise take a full scan per property key.
+    """
+
+    def __init__(self, node_type_properties, rel_type_properties):
+        self._nodes = []
+        for row in node_type_properties.to_dict("records"):
+            self._nodes.append(
+                (
+                    _names(row.get("nodeLabels")),
+                    None if pd.isna(row.get("propertyName")) else row["propertyName"],
+                    frozenset(_names(row.get("propertyTypes"))),
+                )
+            )
+        self._relationships = []
+        for row in rel_type_properties.to_dict("records"):
+            self._relationships.append(
+                (
+                    _relationship_type(row["relType"]),
+                    _names(row.get("sourceNodeLabels")),
+                    _names(row.get("targetNodeLabels")),
+                    None if pd.isna(row.get("propertyName")) else row["propertyName"],
+                    frozenset(_names(row.get("propertyTypes"))),
+                )
+            )
+
+    def _node_rows(self, node_labels=None):
+        for labels, prop, types in self._nodes:
+            if not node_labels or any(label in node_labels for label in labels):
+                yield prop, types
+
+    def _relationship_rows(self, relationship_types=None, node_labels=None):
+        for rel_type, sources, targets, prop, types in self._relationships:
+            if relationship_types and rel_type not in relationship_types:
+                continue
+            # Older servers do not report endpoint labels; keep those rows
+            if node_labels and sources and targets:
+                if not any(label in node_labels for label in sources) or not any(
+                    label in node_labels for label in targets
+                ):
+                    continue
+            yield prop, types
+
+    def node_labels(self):
+        return list(
+            dict.fromkeys(label for labels, _, _ in self._nodes for label in labels)
+        )
+
+    def relationship_types(self):
+        return list(dict.fromkeys(rel_type for rel_type, *_ in self._relationships))
+
+    def property_label_sets(self, node_property):
+        """Label combinations of the nodes that carry ``node_property``."""
+        return [labels for labels, prop, _ in self._nodes if prop == node_property]
+
+    def node_property_keys(self, node_labels=None):
+        return list(
+            dict.fromkeys(
+                prop for prop, _ in self._node_rows(node_labels) if prop is not None
+            )
+        )
+
+    def relationship_property_keys(self, relationship_types=None, node_labels=None):
+        return list(
+            dict.fromkeys(
+                prop
+                for prop, _ in self._relationship_rows(relationship_types, node_labels)
+                if prop is not None
+            )
+        )
+
+    def projectable_node_properties(self, node_labels=None):
+        """Same shape as gds.validate_node_properties: {property: type name}."""
+        property_types = {}
+        for prop, types in self._node_rows(node_labels):
+            if prop is not None:
+                property_types[prop] = property_types.get(prop, frozenset()) | types
+        projectable = {}
+        for prop, types in property_types.items():
+            projectable_type = _projectable_type(types)
+            if projectable_type is not None:
+                projectable[prop] = projectable_type
+        return projectable
+
+    def projectable_relationship_properties(
+        self, relationship_types=None, node_labels=None
+    ):
+        """Same shape as gds.validate_rel_properties: {property: expression}."""
+        property_types = {}
+        for prop, types in self._relationship_rows(relationship_types, node_labels):
+            if prop is not None:
+                property_types[prop] = property_types.get(prop, frozenset()) | types
+        return {
+            prop: f"toFloat(r.{prop})"
+            for prop, types in property_types.items()
+            if _projectable_type(types) in ("INTEGER", "FLOAT")
+        }
+
+
+NODE_TYPE_PROPERTIES_QUERY = "CALL db.schema.nodeTypeProperties()"
+REL_TYPE_PROPERTIES_QUERY = "CALL db.schema.relTypeProperties()"
+
+
+def load_graph_schema(gds) -> GraphSchema:
+    logger.info("Loading graph schema from db.schema procedures")
+    node_type_properties = gds.run_cypher(NODE_TYPE_PROPERTIES_QUERY)
+    rel_type_properties = gds.run_cypher(REL_TYPE_PROPERTIES_QUERY)
+    return GraphSchema(node_type_properties, rel_type_properties)
+
+
+async def load_graph_schema_async(cypher) -> GraphSchema:
+    """load_graph_schema over an async Cypher connection."""
+    logger.info("Loading graph schema from db.schema procedures")
+    node_type_properties = await cypher.run_cypher(NODE_TYPE_PROPERTIES_QUERY)
+    rel_type_properties = await cypher.run_cypher(REL_TYPE_PROPERTIES_QUERY)
+    return GraphSchema(node_type_properties, rel_type_properties)
+
+
+class SchemaCache:
+    """Per-connection, per-database cache of schema answers with a time-to-live.
+
+    Holds the GraphSchema as well as the catalog procedure results behind the
+    schema tools, so repeated calls within the TTL do not touch the database.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self._ttl = ttl
+        self._entries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        return schema_cache_ttl() if self._ttl is None else self._ttl
+
+    def _lookup(self, gds, key, now):
+        with self._lock, suppress(TypeError):
+            entry = self._entries.get(gds, {}).get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                return entry
+        return None
+
+    def _store(self, gds, key, now, value):
+        if self.ttl > 0:
+            with self._lock, suppress(TypeError):
+                self._entries.setdefault(gds, {})[key] = (now, value)
+
+    def cached(self, gds, name, load, refresh: bool = False):
+        """Return ``load(gds)``, reusing a result younger than the TTL."""
+        key = (database_key(gds), name)
+        now = time.monotonic()
+        entry = None if refresh else self._lookup(gds, key, now)
+        if entry is not None:
+            return entry[1]
+
+        value = load(gds)
+        self._store(gds, key, now, value)
+        return value
+
+    async def cached_async(self, gds, name, load, refresh: bool = False):
+        """Like cached, but awaits ``load()``; entries are shared with cached."""
+        key = (database_key(gds), name)
+        now = time.monotonic()
+        entry = None if refresh else self._lookup(gds, key, now)
+        if entry is not None:
+            return entry[1]
+
+        value = await load()
+        self._store(gds, key, now, value)
+        return value
+
+    def get(self, gds, refresh: bool = False) -> GraphSchema:
+        return self.cached(gds, "schema", load_graph_schema, refresh)
+
+    def invalidate(self, database=None):
+        """Drop the cached answers of one database, or of all databases."""
+        with self._lock:
+            if database is None:
+                self._entries.clear()
+                return
+            for entries in self._entries.values():
+                for key in [key for key in entries if key[0] == database]:
+                    del entries[key]
+
+
+schema_cache = SchemaCache()
@@ -2,6 +2,7 @@
 import asyncio
 import contextlib
 import logging
+import os
 from importlib.metadata import PackageNotFoundError, version
 from anyio import BrokenResourceError
 from mcp.server import NotificationOptions, Server
@@ -13,7 +14,8 @@ import mcp.server.stdio
 import pandas as pd
 import json
 from graphdatascience import GraphDataScience
-from neo4j import GraphDatabase
+from graphdatascience.session import AlgorithmCategory
+from neo4j import AsyncGraphDatabase, GraphDatabase
 
 from .similarity_algorithm_specs import similarity_tool_definitions
 from .centrality_algorithm_specs import centrality_tool_definitions
@@ -22,12 +24,16 @@ from .path_algorithm_specs import path_tool_definitions
 from .graph_projection_specs import graph_projection_tool_definitions
 from .embedding_algorithm_specs import embedding_tool_definitions
 from .ml_pipeline_specs import ml_pipeline_tool_definitions
+from .job_specs import job_tool_definitions
+from .cursor_specs import cursor_tool_definitions
+from .status_specs import status_tool_definitions
 from .registry import AlgorithmRegistry
 from .gds import (
     get_node_properties_keys,
     get_relationship_properties_keys,
     get_node_labels,
     get_relationship_types,
+    get_schema_tool_result_async,
 )
 from .graph_projection_handlers import (
     ProjectGraphCypherHandler,
@@ -39,12 +45,28 @@ from .graph_projection_handlers import (
     StreamRelationshipsHandler,
 )
 from .ml_pipeline_handlers import ListModelsHandler, DropModelHandler
+from .dispatch_cache import dispatch_cache
+from .memory_estimate import memory_admission, memory_reservations
+from .tool_executor import ServerBusyError, ToolExecutor, ToolTimeoutError
+from .job_control import tagged_job, terminate_job
+from .job_store import JOB_TOOLS, Job, JobStore
+from .progress import job_progress, progress_interval, report_progress
+from .node_cache import database_key, node_property_cache
+from .node_translator import collect_lookup_plans
 from .session_manager import SessionManager, GdsMode, ensure_mcp_session_name
+from .session_sizing import algorithm_categories, projection_counts
+from .session_state import session_state_file
+from .result_encoding import (
+    OUTPUT_FORMAT_PROPERTY,
+    encode_dataframe,
+    resolve_output_format,
+)
+from .result_cursors import cursor_store, result_cursor
 from .result_limits import (
-    dataframe_limit_warning,
-    limit_dataframe_rows,
+    full_results,
     limit_text,
-    max_cell_chars,
+    max_result_rows,
+    result_ordering,
 )
 
 logger = logging.getLogger("mcp_server_neo4j_gds")
@@ -74,14 +96,58 @@ class Neo4jDriverConnection:
         self, query: str, params: dict[str, Any] = None, database: str = None
     ) -> pd.DataFrame:
         with self._driver.session(database=database or self._database) as session:
-            result = session.run(query, params or {})
-            keys = result.keys()
-            return pd.DataFrame([record.data() for record in result], columns=keys)
+            return session.run(query, params or {}).to_df()
 
     def close(self):
         self._driver.close()
 
 
+class AsyncNeo4jDriverConnection:
+    """Cypher over the neo4j AsyncDriver, for queries that run on the event loop.
+
+    The driver is created on first use in the running event loop, since async
+    drivers cannot be shared between loops.
+    """
+
+    def __init__(self, db_url: str, username: str, password: str, database: str = None):
+        self._db_url = db_url
+        self._auth = (username, password)
+        self._database = database
+        self._driver = None
+        self._loop = None
+
+    async def _get_driver(self):
+        loop = asyncio.get_running_loop()
+        if self._driver is not None and self._loop is not loop:
+            await self._close_driver()
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(self._db_url, auth=self._auth)
+            self._loop = loop
+        return self._driver
+
+    async def _close_driver(self):
+        driver, loop = self._driver, self._loop
+        self._driver = self._loop = None
+        if loop is not asyncio.get_running_loop() and loop.is_running():
+            # The driver's connections belong to the loop it was created in
+            asyncio.run_coroutine_threadsafe(driver.close(), loop)
+            return
+        with contextlib.suppress(Exception):
+            await driver.close()
+
+    async def run_cypher(
+        self, query: str, params: dict[str, Any] = None, database: str = None
+    ) -> pd.DataFrame:
+        driver = await self._get_driver()
+        async with driver.session(database=database or self._database) as session:
+            result = await session.run(query, params or {})
+            return await result.to_df()
+
+    async def close(self):
+        if self._driver is not None:
+            await self._close_driver()
+
+
 def is_aura_graph_analytics_versionless_error(error: Exception) -> bool:
     return "Aura Graph Analytics is versionless" in str(error)
 
@@ -103,25 +169,10 @@ def create_base_gds(db_url: str, username: str, password: str, database: str = N
         raise
 
 
-def serialize_result(result: Any) -> str:
-    """Serialize results to string without truncation, handling DataFrames specially"""
+def serialize_result(result: Any, output_format: str | None = None) -> str:
+    """Serialize results to string, encoding DataFrames in the requested output format"""
     if isinstance(result, pd.DataFrame):
-        result = limit_dataframe_rows(result)
-        warning = dataframe_limit_warning(result)
-        with pd.option_context(
-            "display.max_rows",
-            None,
-            "display.max_columns",
-            None,
-            "display.width",
-            None,
-            "display.max_colwidth",
-            max_cell_chars(),
-        ):
-            text = result.to_string(index=True)
-        if warning:
-            text = f"{warning}\n\n{text}"
-        return limit_text(text)
+        return encode_dataframe(result, output_format)
     elif isinstance(result, (list, dict)):
         # Use JSON for better formatting of complex data structures
         return limit_text(json.dumps(result, indent=2, default=str))
@@ -130,6 +181,102 @@ def serialize_result(result: Any) -> str:
         return limit_text(str(result))
 
 
+def encode_page(
+    rows: pd.DataFrame, position: dict, description: str, output_format: str
+) -> str:
+    """Encode one page of a larger result, led by where it sits in the result"""
+    encoded = encode_dataframe(rows, output_format)
+    if output_format == "json":
+        fields = "".join(
+            f"{json.dumps(key)}: {json.dumps(value)}, "
+            for key, value in position.items()
+        )
+        return f'{{{fields}"rows": {encoded}}}'
+    return f"{description}\n\n{encoded}"
+
+
+def fetch_cursor_page(arguments: dict[str, Any], output_format: str) -> str:
+    row_limit = max_result_rows()
+    offset = arguments.get("offset") or 0
+    size = min(arguments.get("size") or row_limit, row_limit)
+    if offset < 0 or size < 1:
+        raise ValueError("offset must not be negative and size must be positive")
+    group_by = arguments.get("groupBy")
+    rows, total_rows = cursor_store.page(
+        arguments.get("cursor"),
+        offset,
+        size,
+        where=arguments.get("where"),
+        group_by=group_by,
+    )
+    end = offset + len(rows)
+    next_offset = end if end < total_rows else None
+    unit = f"groups by {group_by}" if group_by else "rows"
+    if len(rows):
+        description = f"{unit[0].upper()}{unit[1:]} {offset + 1}-{end} of {total_rows}"
+    else:
+        description = f"Nothing at offset {offset}: there are {total_rows} {unit}"
+    if next_offset is not None:
+        description += f"; the next page starts at offset {next_offset}"
+    return encode_page(
+        rows,
+        {"offset": offset, "totalRows": total_rows, "nextOffset": next_offset},
+        description,
+        output_format,
+    )
+
+
+SCHEMA_TOOLS = (
+    "get_node_labels",
+    "get_relationship_types",
+    "get_node_properties_keys",
+    "get_relationship_properties_keys",
+)
+
+JOB_API_TOOLS = ("submit_job", "job_status", "job_result")
+
+RESULT_SHAPING_ARGUMENTS = (
+    "outputFormat",
+    "limit",
+    "orderBy",
+    "ascending",
+    "keepCursor",
+)
+
+RESULT_ORDERING_PROPERTIES = {
+    "limit": {
+        "type": "integer",
+        "description": "Only return this many result rows, taken after ordering by orderBy. "
+        "Use it to get e.g. the top 10 nodes by score without streaming every row.",
+    },
+    "orderBy": {
+        "type": "string",
+        "description": "Result column to order rows by before limiting (e.g. 'score', 'communityId'). "
+        "Defaults to 'score' when the result has one.",
+    },
+    "ascending": {
+        "type": "boolean",
+        "description": "Order rows ascending instead of descending. Default is false.",
+    },
+    "keepCursor": {
+        "type": "boolean",
+        "description": "When the result exceeds the row limit, keep it on the server and return a cursor id "
+        "with the first rows; read further rows with fetch_page. Default is false.",
+    },
+}
+
+
+def with_result_arguments(tool: types.Tool, ordering: bool = False) -> types.Tool:
+    """Add the per-call outputFormat (and, for stream results, ordering)
+    arguments to a tool's input schema."""
+    properties = {"outputFormat": OUTPUT_FORMAT_PROPERTY}
+    if ordering:
+        properties.update(RESULT_ORDERING_PROPERTIES)
+    input_schema = dict(tool.inputSchema)
+    input_schema["properties"] = {**input_schema.get("properties", {}), **properties}
+    return tool.model_copy(update={"inputSchema": input_schema})
+
+
 def normalize_transport(transport: str) -> str:
     normalized_transport = (transport or STDIO_TRANSPORT).strip().lower()
     if normalized_transport not in TRANSPORT_ALIASES:
@@ -150,7 +297,13 @@ def normalize_http_path(path: str) -> str:
 
 def create_mcp_server(
     db_url: str, username: str, password: str, database: str = None
-) -> tuple[Server, SessionManager, GraphDataScience | Neo4jDriverConnection]:
+) -> tuple[
+    Server,
+    SessionManager,
+    GraphDataScience | Neo4jDriverConnection,
+    AsyncNeo4jDriverConnection,
+    ToolExecutor,
+]:
     logger.info(f"Starting MCP Server for {db_url} with username {username}")
     if database:
         logger.info(f"Connecting to database: {database}")
@@ -161,9 +314,27 @@ def create_mcp_server(
     base_gds = create_base_gds(db_url, username, password, database)
     logger.info("Successfully connected to Neo4j database")
 
-    session_manager = SessionManager()
+    session_manager = SessionManager(state_file=session_state_file())
+    session_manager.set_connection(db_url, (username, password), database)
     mode = session_manager.detect_mode(base_gds)
     logger.info(f"Detected GDS mode: {mode}")
+    if mode == GdsMode.SESSION:
+        # Attaching recorded sessions can take a while; tools attach them
+        # lazily if they are called before this has finished
+        session_manager.resume_in_background()
+        try:
+            session_manager.start_warm_pool()
+        except ValueError as e:
+            logger.warning(f"Not keeping warm sessions: {e}")
+
+    # Metadata queries run on the event loop instead of a worker thread
+    async_cypher = AsyncNeo4jDriverConnection(db_url, username, password, database)
+    tool_executor = ToolExecutor()
+    job_store = JobStore()
+    logger.info(
+        f"Running tools on {tool_executor.workers} workers "
+        f"(queue size {tool_executor.queue_size})"
+    )
 
     def get_gds_for_graph(graph_name: str = None) -> GraphDataScience:
         # Tools without a graphName only query the database and run on the base connection
@@ -182,6 +353,34 @@ def create_mcp_server(
             )
         return session_gds
 
+    def size_new_session(arguments: dict) -> tuple[int | None, dict | None]:
+        """Memory for a new session: memoryGB, the SESSION_MEMORY_GB default,
+        or else the smallest size estimated to fit the planned projection."""
+        if arguments.get("memoryGB") is not None or os.getenv("SESSION_MEMORY_GB"):
+            return arguments.get("memoryGB"), None
+        categories = algorithm_categories(arguments.get("algorithmCategories"))
+        try:
+            counts = projection_counts(
+                base_gds,
+                arguments.get("nodeLabels"),
+                arguments.get("relationshipTypes"),
+            )
+            memory_gb = session_manager.recommend_memory_gb(counts, categories)
+        except Exception as e:
+            logger.warning(f"Could not estimate the session size, using default: {e}")
+            return None, None
+        logger.info(f"Estimated {memory_gb}GB for {counts}")
+        return memory_gb, counts
+
+    def reproject_graph(gds: GraphDataScience, graph_name: str, projection: dict):
+        ProjectGraphCypherHandler(gds).execute({"graphName": graph_name, **projection})
+        node_property_cache.invalidate(database_key(gds))
+
+    def record_trained_model(gds: GraphDataScience, result: Any):
+        # Training tools return the new model's name with its train result
+        if isinstance(result, dict) and "trainResult" in result:
+            session_manager.record_model(result["modelName"], gds)
+
     @server.list_tools()
     async def handle_list_tools() -> list[types.Tool]:
         """List available tools"""
@@ -216,7 +415,8 @@ def create_mcp_server(
 
 Sessions are never created implicitly: create one with this tool before projecting graphs with project_graph_cypher (its sessionName parameter picks the target session). All other tools locate a graph's session automatically from graphName.
 Most workflows need a single session holding all projected graphs; create additional sessions only to isolate graphs on separate compute, e.g. to run independent analyses in parallel.
-To resize an existing session (e.g. after an OOM), delete it with delete_session and create it again with a larger memoryGB; this drops all graphs projected into it.
+Without memoryGB (and without a SESSION_MEMORY_GB default), the session gets the smallest memory size estimated to fit the graph you plan to project: pass its nodeLabels and relationshipTypes (default: the whole database) and the algorithmCategories you intend to run.
+To grow an existing session (e.g. after an OOM), use resize_session, which keeps its graphs.
 Session names are prefixed with 'mcp_' if not already; the returned sessionName is the actual name.""",
                         inputSchema={
                             "type": "object",
@@ -227,7 +427,48 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                                 },
                                 "memoryGB": {
                                     "type": "integer",
-                                    "description": "Optional memory size in GB (defaults to SESSION_MEMORY_GB or 8)",
+                                    "description": "Optional memory size in GB (defaults to SESSION_MEMORY_GB, or else to an estimate for the planned projection)",
+                                },
+                                "nodeLabels": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Node labels of the graph you plan to project, used to size the session. Default: all labels.",
+                                },
+                                "relationshipTypes": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Relationship types of the graph you plan to project, used to size the session. Default: all types.",
+                                },
+                                "algorithmCategories": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "string",
+                                        "enum": [
+                                            category.value
+                                            for category in AlgorithmCategory
+                                        ],
+                                    },
+                                    "description": "Categories of the algorithms you plan to run, used to size the session.",
+                                },
+                            },
+                            "required": ["sessionName"],
+                        },
+                    ),
+                    types.Tool(
+                        name="resize_session",
+                        description="""Move a GDS session to a larger memory size, e.g. after an out-of-memory error.
+
+A new session is created and every graph projected with project_graph_cypher is projected into it again; the session keeps its name and the old one is deleted. If a re-projection fails, the session is left unchanged. Trained models are not carried over.""",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "sessionName": {
+                                    "type": "string",
+                                    "description": "Name of the session to resize",
+                                },
+                                "memoryGB": {
+                                    "type": "integer",
+                                    "description": "Optional new memory size in GB, rounded up to an available size. Default: the next larger size.",
                                 },
                             },
                             "required": ["sessionName"],
@@ -242,6 +483,12 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                         description="""Get all node properties keys in the database""",
                         inputSchema={
                             "type": "object",
+                            "properties": {
+                                "exact": {
+                                    "type": "boolean",
+                                    "description": "Scan all nodes instead of reading the cached database catalog. Slower, but reflects writes made within the last few minutes. Default is false.",
+                                },
+                            },
                         },
                     ),
                     types.Tool(
@@ -249,6 +496,12 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                         description="""Get all relationship properties keys in the database""",
                         inputSchema={
                             "type": "object",
+                            "properties": {
+                                "exact": {
+                                    "type": "boolean",
+                                    "description": "Scan all relationships instead of reading the cached database catalog. Slower, but reflects writes made within the last few minutes. Default is false.",
+                                },
+                            },
                         },
                     ),
                     types.Tool(
@@ -256,6 +509,12 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                         description="""Get all node labels in the database""",
                         inputSchema={
                             "type": "object",
+                            "properties": {
+                                "exact": {
+                                    "type": "boolean",
+                                    "description": "Scan all nodes instead of reading the cached database catalog. Slower, but reflects writes made within the last few minutes. Default is false.",
+                                },
+                            },
                         },
                     ),
                     types.Tool(
@@ -263,6 +522,12 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                         description="""Get relationship types in the database.""",
                         inputSchema={
                             "type": "object",
+                            "properties": {
+                                "exact": {
+                                    "type": "boolean",
+                                    "description": "Scan all relationships instead of reading the cached database catalog. Slower, but reflects writes made within the last few minutes. Default is false.",
+                                },
+                            },
                         },
                     ),
                 ]
@@ -274,7 +539,21 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                 + similarity_tool_definitions
                 + embedding_tool_definitions
                 + ml_pipeline_tool_definitions
+                + job_tool_definitions
+                + cursor_tool_definitions
+                + status_tool_definitions
             )
+            ordered_tools = {
+                tool.name
+                for tool in centrality_tool_definitions
+                + community_tool_definitions
+                + similarity_tool_definitions
+                + embedding_tool_definitions
+            }
+            tools = [
+                with_result_arguments(tool, tool.name in ordered_tools)
+                for tool in tools
+            ]
             logger.info(f"Returning {len(tools)} tools")
             return tools
         except Exception as e:
@@ -284,11 +563,32 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
     def execute_tool(
         name: str, arguments: dict[str, Any] | None
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        # Result shaping arguments apply to any tool and are not passed to handlers
+        output_format = None
+        ordering = {}
+        cursor = False
+        if arguments and any(key in arguments for key in RESULT_SHAPING_ARGUMENTS):
+            arguments = dict(arguments)
+            output_format = arguments.pop("outputFormat", None)
+            ordering = {
+                "limit": arguments.pop("limit", None),
+                "order_by": arguments.pop("orderBy", None),
+                "ascending": arguments.pop("ascending", None),
+            }
+            cursor = bool(arguments.pop("keepCursor", None))
+
+        def serialize(result):
+            return serialize_result(result, output_format)
+
+        active_gds = None
         try:
+            # Reject an unknown outputFormat before running the tool
+            output_format = resolve_output_format(output_format)
             session_tool_names = {
                 "list_sessions",
                 "delete_session",
                 "create_session",
+                "resize_session",
             }
             if name in session_tool_names:
                 if mode != GdsMode.SESSION:
@@ -301,31 +601,46 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
 
                 if name == "list_sessions":
                     result = session_manager.list_sessions()
-                    return [
-                        types.TextContent(type="text", text=serialize_result(result))
-                    ]
+                    return [types.TextContent(type="text", text=serialize(result))]
 
                 if name == "delete_session":
                     session_name = arguments.get("sessionName") if arguments else None
                     result = session_manager.delete_session(session_name)
-                    return [
-                        types.TextContent(type="text", text=serialize_result(result))
-                    ]
+                    return [types.TextContent(type="text", text=serialize(result))]
 
-                # create_session
                 arguments = arguments or {}
+                if name == "resize_session":
+                    result = session_manager.resize_session(
+                        arguments.get("sessionName"),
+                        reproject_graph,
+                        memory_gb=arguments.get("memoryGB"),
+                    )
+                    return [types.TextContent(type="text", text=serialize(result))]
+
+                # create_session
                 session_name = ensure_mcp_session_name(arguments.get("sessionName"))
+                memory_gb, estimate = size_new_session(arguments)
                 session_manager.create_or_get_session(
                     db_url,
                     (username, password),
                     database,
                     session_name=session_name,
-                    memory_gb=arguments.get("memoryGB"),
+                    memory_gb=memory_gb,
                 )
                 result = {"sessionName": session_name, "status": "ready"}
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                if estimate is not None:
+                    result["memoryGB"] = memory_gb
+                    result["memoryEstimate"] = estimate
+                return [types.TextContent(type="text", text=serialize(result))]
 
             arguments = arguments or {}
+            if name == "fetch_page":
+                return [
+                    types.TextContent(
+                        type="text", text=fetch_cursor_page(arguments, output_format)
+                    )
+                ]
+
             graph_name = arguments.get("graphName")
 
             if name == "project_graph_cypher":
@@ -361,86 +676,120 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                     project_gds = base_gds
                 handler = ProjectGraphCypherHandler(project_gds)
                 result = handler.execute(arguments)
+                # A re-projection may reflect changed data; refetch node names
+                node_property_cache.invalidate(database_key(project_gds))
+                dispatch_cache.invalidate_graph(project_gds, result["graphName"])
                 if mode == GdsMode.SESSION:
-                    session_manager.record_graph(result["graphName"], target_session)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                    session_manager.record_graph(
+                        result["graphName"],
+                        target_session,
+                        projection={
+                            "cypherQuery": arguments.get("cypherQuery"),
+                            "undirectedRelationshipTypes": arguments.get(
+                                "undirectedRelationshipTypes"
+                            ),
+                        },
+                    )
+                return [types.TextContent(type="text", text=serialize(result))]
 
             active_gds = get_gds_for_graph(graph_name)
 
             if name == "get_node_properties_keys":
-                result = get_node_properties_keys(active_gds)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                result = get_node_properties_keys(
+                    active_gds, exact=bool(arguments.get("exact"))
+                )
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "get_relationship_properties_keys":
-                result = get_relationship_properties_keys(active_gds)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                result = get_relationship_properties_keys(
+                    active_gds, exact=bool(arguments.get("exact"))
+                )
+                return [types.TextContent(type="text", text=serialize(result))]
             elif name == "get_node_labels":
-                result = get_node_labels(active_gds)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                result = get_node_labels(active_gds, exact=bool(arguments.get("exact")))
+                return [types.TextContent(type="text", text=serialize(result))]
             elif name == "get_relationship_types":
-                result = get_relationship_types(active_gds)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                result = get_relationship_types(
+                    active_gds, exact=bool(arguments.get("exact"))
+                )
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "drop_graph":
                 handler = DropGraphHandler(active_gds)
                 result = handler.execute(arguments)
+                node_property_cache.invalidate(database_key(active_gds))
+                dispatch_cache.invalidate_graph(active_gds, graph_name)
                 if mode == GdsMode.SESSION:
                     session_manager.forget_graph(graph_name)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "list_graphs":
                 if mode == GdsMode.SESSION:
+                    session_manager.attach_recorded_sessions()
+                    sessions = session_manager.active_sessions()
+                    listings = session_manager.fan_out(
+                        lambda s_gds: ListGraphsHandler(s_gds).execute({}), sessions
+                    )
                     graphs = []
-                    for s_name, s_gds in session_manager.active_sessions():
-                        listing = ListGraphsHandler(s_gds).execute({})
+                    for s_name, listing in listings.items():
                         for graph in listing["graphs"]:
                             graph["sessionName"] = s_name
                         graphs.extend(listing["graphs"])
                     result = {"graphs": graphs, "count": len(graphs)}
+                    unavailable = [s for s, _ in sessions if s not in listings]
+                    if unavailable:
+                        result["unavailableSessions"] = unavailable
                 else:
                     result = ListGraphsHandler(active_gds).execute(arguments)
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "get_graph_info":
                 handler = GraphInfoHandler(active_gds)
                 result = handler.execute(arguments or {})
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "stream_node_properties":
                 handler = StreamNodePropertiesHandler(active_gds)
                 result = handler.execute(arguments or {})
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "stream_relationship_properties":
                 handler = StreamRelationshipPropertiesHandler(active_gds)
                 result = handler.execute(arguments or {})
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "stream_relationships":
                 handler = StreamRelationshipsHandler(active_gds)
                 result = handler.execute(arguments or {})
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                return [types.TextContent(type="text", text=serialize(result))]
 
             # Model catalog tools carry no graphName; in session mode they span all sessions
             elif name == "list_models" and mode == GdsMode.SESSION:
+                session_manager.attach_recorded_sessions()
+                sessions = session_manager.active_sessions()
+                listings = session_manager.fan_out(
+                    lambda s_gds: ListModelsHandler(s_gds).execute({}), sessions
+                )
                 models = []
-                for s_name, s_gds in session_manager.active_sessions():
-                    listing = ListModelsHandler(s_gds).execute({})
+                for s_name, listing in listings.items():
                     for model in listing["models"]:
                         model["sessionName"] = s_name
                     models.extend(listing["models"])
                 result = {"models": models, "count": len(models)}
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                unavailable = [s for s, _ in sessions if s not in listings]
+                if unavailable:
+                    result["unavailableSessions"] = unavailable
+                return [types.TextContent(type="text", text=serialize(result))]
 
             elif name == "drop_model" and mode == GdsMode.SESSION:
-                for _, s_gds in session_manager.active_sessions():
+                model_name = arguments.get("modelName")
+                for _, s_gds in session_manager.sessions_for_model(model_name):
                     try:
                         result = DropModelHandler(s_gds).execute(arguments)
                     except Exception:
                         continue
-                    return [
-                        types.TextContent(type="text", text=serialize_result(result))
-                    ]
+                    session_manager.forget_model(model_name)
+                    return [types.TextContent(type="text", text=serialize(result))]
                 return [
                     types.TextContent(
                         type="text",
@@ -449,22 +798,241 @@ Session names are prefixed with 'mcp_' if not already; the returned sessionName
                 ]
 
             else:
-                handler = AlgorithmRegistry.get_handler(name, active_gds)
-                result = handler.execute(arguments or {})
-                return [types.TextContent(type="text", text=serialize_result(result))]
+                handler = dispatch_cache.handler(
+                    name, active_gds, AlgorithmRegistry.get_handler
+                )
+                with (
+                    collect_lookup_plans() as lookup_plans,
+                    result_ordering(**ordering),
+                    result_cursor(cursor),
+                    memory_admission(name) as admission,
+                ):
+                    result = handler.execute(arguments or {})
+                    if lookup_plans and isinstance(result, dict):
+                        result["nodeLookupPlan"] = "; ".join(lookup_plans)
+                    if admission and admission.report and isinstance(result, dict):
+                        result["memoryEstimate"] = admission.report
+                    if mode == GdsMode.SESSION:
+                        record_trained_model(active_gds, result)
+                    return [types.TextContent(type="text", text=serialize(result))]
 
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            message = str(e)
+            if mode == GdsMode.SESSION and active_gds is not None:
+                session_manager.report_error(active_gds, e)
+                hint = session_manager.resize_hint(active_gds, e)
+                if hint:
+                    message = f"{message}\n{hint}"
+            return [types.TextContent(type="text", text=f"Error: {message}")]
+
+    async def execute_schema_tool(
+        name: str, arguments: dict[str, Any] | None
+    ) -> list[types.TextContent]:
+        arguments = arguments or {}
+        output_format = resolve_output_format(arguments.get("outputFormat"))
+        result = await get_schema_tool_result_async(
+            base_gds, async_cypher, name, exact=bool(arguments.get("exact"))
+        )
+        return [
+            types.TextContent(type="text", text=serialize_result(result, output_format))
+        ]
+
+    def start_progress_reports(arguments: dict[str, Any] | None, job_id: str):
+        """Report the job's progress if the client sent a progress token."""
+        interval = progress_interval()
+        try:
+            context = server.request_context
+        except LookupError:
+            return None
+        token = context.meta.progressToken if context.meta else None
+        if token is None or interval == 0:
+            return None
+
+        graph_name = (arguments or {}).get("graphName")
+        job_gds = []
+
+        def poll():
+            if not job_gds:
+                job_gds.append(get_gds_for_graph(graph_name))
+            return job_progress(job_gds[0], job_id)
+
+        async def send(percent, message):
+            await context.session.send_progress_notification(
+                token,
+                percent,
+                total=100,
+                message=message,
+                related_request_id=str(context.request_id),
+            )
+
+        return asyncio.create_task(report_progress(send, poll, interval))
+
+    def job_canceller(job_id: str):
+        """Callback terminating a job's algorithm runs, None where that is impossible."""
+        if mode == GdsMode.SESSION:
+            return None
+
+        def on_cancel():
+            with contextlib.suppress(Exception):
+                terminate_job(base_gds, job_id)
+
+        return on_cancel
+
+    def run_job_tool(job: Job):
+        job.start()
+        arguments = {
+            key: value
+            for key, value in job.arguments.items()
+            if key not in RESULT_SHAPING_ARGUMENTS
+        }
+        active_gds = get_gds_for_graph(arguments.get("graphName"))
+        handler = dispatch_cache.handler(
+            job.tool, active_gds, AlgorithmRegistry.get_handler
+        )
+        # The result is paged by job_result, so every row is kept
+        with full_results(), memory_admission(job.tool):
+            try:
+                result = handler.execute(arguments)
+            except Exception as e:
+                if mode == GdsMode.SESSION:
+                    session_manager.report_error(active_gds, e)
+                    hint = session_manager.resize_hint(active_gds, e)
+                    if hint:
+                        raise ValueError(f"{e}\n{hint}") from e
+                raise
+        if mode == GdsMode.SESSION:
+            record_trained_model(active_gds, result)
+        return result
+
+    async def run_job(job: Job):
+        with tagged_job(job.job_id):
+            try:
+                result = await tool_executor.run(
+                    job.tool,
+                    run_job_tool,
+                    job,
+                    on_cancel=job_canceller(job.job_id),
+                )
+            except Exception as e:
+                logger.warning(f"Job {job.job_id} ({job.tool}) failed: {e}")
+                job.fail(e)
+            else:
+                logger.info(f"Job {job.job_id} ({job.tool}) finished")
+                job.finish(result)
+
+    def page_job_result(job: Job, arguments: dict[str, Any]) -> str:
+        output_format = resolve_output_format(arguments.get("outputFormat"))
+        result = job.result
+        if not isinstance(result, pd.DataFrame):
+            return serialize_result(result, output_format)
+
+        row_limit = max_result_rows()
+        page = arguments.get("page") or 1
+        page_size = min(arguments.get("pageSize") or row_limit, row_limit)
+        if page < 1 or page_size < 1:
+            raise ValueError("page and pageSize must be positive")
+        total_rows = len(result)
+        page_count = max(-(-total_rows // page_size), 1)
+        if page > page_count:
+            raise ValueError(
+                f"Page {page} is out of range: the result has {page_count} pages "
+                f"of {page_size} rows."
+            )
+        start = (page - 1) * page_size
+        rows = result.iloc[start : start + page_size]
+        return encode_page(
+            rows,
+            {"page": page, "pageCount": page_count, "totalRows": total_rows},
+            f"Page {page} of {page_count} "
+            f"(rows {start + 1}-{start + len(rows)} of {total_rows})",
+            output_format,
+        )
+
+    async def execute_job_api_tool(name: str, arguments: dict[str, Any]) -> str:
+        if name == "submit_job":
+            tool = arguments.get("tool")
+            if tool not in JOB_TOOLS:
+                raise ValueError(
+                    f"Tool '{tool}' cannot be submitted as a job. "
+                    f"Supported tools: {', '.join(JOB_TOOLS)}"
+                )
+            job_arguments = arguments.get("arguments") or {}
+            if not isinstance(job_arguments, dict):
+                raise ValueError("arguments must be an object")
+            job = job_store.add(Job(tool, job_arguments))
+            job.task = asyncio.create_task(run_job(job))
+            return serialize_result({"jobId": job.job_id, "status": job.status})
+
+        job = job_store.get(arguments.get("jobId"))
+        if name == "job_status":
+            status = job.describe()
+            if job.status == "running":
+                graph_name = job.arguments.get("graphName")
+                with contextlib.suppress(Exception):
+                    progress = await asyncio.to_thread(
+                        lambda: job_progress(get_gds_for_graph(graph_name), job.job_id)
+                    )
+                    if progress is not None:
+                        status["progress"], status["progressMessage"] = progress
+            return serialize_result(status)
+
+        # job_result
+        if job.status == "failed":
+            raise ValueError(f"Job '{job.job_id}' failed: {job.error}")
+        if not job.done:
+            raise ValueError(
+                f"Job '{job.job_id}' is {job.status}. Poll job_status until it has finished."
+            )
+        return page_job_result(job, arguments)
+
+    def server_status() -> dict:
+        return {
+            "toolExecutor": tool_executor.stats(),
+            "memoryReservedBytes": memory_reservations.reserved,
+            "nodeCache": node_property_cache.stats(),
+        }
 
     @server.call_tool()
     async def handle_call_tool(
         name: str, arguments: dict[str, Any] | None
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
         """Handle tool execution requests"""
-        # Run blocking GDS calls off the event loop so tool calls can execute in parallel
-        return await asyncio.to_thread(execute_tool, name, arguments)
+        if name == "server_status":
+            # Not queued behind the calls it reports on
+            return [
+                types.TextContent(type="text", text=serialize_result(server_status()))
+            ]
+        if name in JOB_API_TOOLS:
+            try:
+                text = await execute_job_api_tool(name, arguments or {})
+            except Exception as e:
+                text = f"Error: {str(e)}"
+            return [types.TextContent(type="text", text=text)]
+        if name in SCHEMA_TOOLS:
+            try:
+                return await execute_schema_tool(name, arguments)
+            except Exception as e:
+                logger.warning(f"Async schema query failed, using a worker: {e}")
+        # Run blocking GDS calls off the event loop, admitting heavy tools sparingly.
+        # The job id tags the call's algorithm runs so an abandoned call can be
+        # terminated server-side.
+        with tagged_job() as job_id:
+            progress_reports = start_progress_reports(arguments, job_id)
+            try:
+                return await tool_executor.run(
+                    name,
+                    execute_tool,
+                    name,
+                    arguments,
+                    on_cancel=job_canceller(job_id),
+                )
+            except (ServerBusyError, ToolTimeoutError) as e:
+                return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            finally:
+                if progress_reports is not None:
+                    progress_reports.cancel()
 
-    return server, session_manager, base_gds
+    return server, session_manager, base_gds, async_cypher, tool_executor
 
 
 def initialization_options(server: Server) -> InitializationOptions:
@@ -560,7 +1128,7 @@ async def main(
     path: str = DEFAULT_HTTP_PATH,
 ):
     transport_mode = normalize_transport(transport)
-    server, session_manager, base_gds = create_mcp_server(
+    server, session_manager, base_gds, async_cypher, tool_executor = create_mcp_server(
         db_url, username, password, database
     )
     try:
@@ -578,9 +1146,14 @@ async def main(
             logger.info(f"Server shutdown with error: {e}")
             raise
     finally:
+        logger.info(f"Tool executor: {tool_executor.stats()}")
+        tool_executor.shutdown()
+        node_property_cache.log_stats()
         with contextlib.suppress(Exception):
             session_manager.close()
             base_gds.close()
+        with contextlib.suppress(Exception):
+            await async_cypher.close()
 
 
 if __name__ == "__main__":
@@ -1,16 +1,40 @@
 import logging
 import os
 import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import suppress
 from datetime import timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from graphdatascience import GraphDataScience
 from graphdatascience.session import GdsSessions, AuraAPICredentials, SessionMemory
 from graphdatascience.session.dbms_connection_info import DbmsConnectionInfo
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
+from .dispatch_cache import dispatch_cache
+from .session_pool import WARM_POOL_ENV, WarmSessionPool, warm_pool_sizes
+from .session_sizing import (
+    SESSION_MEMORY_TIERS,
+    default_session_memory_gb,
+    is_out_of_memory_error,
+    next_tier,
+    recommend_memory_gb,
+    smallest_tier,
+)
+from .session_state import STATE_FILE_ENV, SessionStateFile
 
 logger = logging.getLogger("mcp_server_neo4j_gds")
 SESSION_NAME_PREFIX = "mcp_"
 
+DEFAULT_SESSION_STATUS_TTL = 30
+SESSION_STATUS_TTL_ENV = "GDS_AGENT_SESSION_STATUS_TTL"
+INACTIVE_SESSION_STATUSES = {"deleted", "deleting", "failed", "terminated"}
+
+DEFAULT_SESSION_CALL_TIMEOUT = 10
+SESSION_CALL_TIMEOUT_ENV = "GDS_AGENT_SESSION_CALL_TIMEOUT"
+MAX_FAN_OUT_WORKERS = 8
+
 
 def ensure_mcp_session_name(session_name: str) -> str:
     if not session_name:
@@ -20,18 +44,169 @@ def ensure_mcp_session_name(session_name: str) -> str:
     return f"{SESSION_NAME_PREFIX}{session_name}"
 
 
+def session_ttl() -> timedelta:
+    """Idle time after which Aura deletes a session, from SESSION_TTL_HOURS."""
+    return timedelta(hours=int(os.getenv("SESSION_TTL_HOURS") or "24"))
+
+
+def session_status_ttl() -> float:
+    """Seconds a listing of the Aura sessions is trusted before it is refreshed."""
+    try:
+        value = float(os.getenv(SESSION_STATUS_TTL_ENV, DEFAULT_SESSION_STATUS_TTL))
+    except ValueError:
+        return DEFAULT_SESSION_STATUS_TTL
+    return max(value, 0)
+
+
+def session_call_timeout() -> float:
+    """Seconds each session gets to answer a call fanned out to all sessions."""
+    try:
+        value = float(os.getenv(SESSION_CALL_TIMEOUT_ENV, DEFAULT_SESSION_CALL_TIMEOUT))
+    except ValueError:
+        return DEFAULT_SESSION_CALL_TIMEOUT
+    return value if value > 0 else DEFAULT_SESSION_CALL_TIMEOUT
+
+
+def is_dead_session_error(error: Exception) -> bool:
+    """Whether a failed call suggests its session is gone, e.g. expired or deleted."""
+    if isinstance(error, (ServiceUnavailable, SessionExpired)):
+        return True
+    message = str(error).lower()
+    return "session" in message and any(
+        word in message for word in ("not found", "expired", "terminated", "deleted")
+    )
+
+
+class SessionStatusCache:
+    """Statuses of the Aura sessions from one listing, reused for a short TTL.
+
+    Lookups on a stale listing answer from it and refresh it in the
+    background, so only the first lookup, or the first after an
+    invalidation, waits for the Aura API.
+    """
+
+    def __init__(self, list_sessions, ttl: float | None = None, clock=time.monotonic):
+        self._list_sessions = list_sessions
+        self._ttl = ttl
+        self._clock = clock
+        self._statuses: Optional[Dict[str, str]] = None
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        return session_status_ttl() if self._ttl is None else self._ttl
+
+    def store(self, sessions):
+        """Replace the statuses by those of a fresh listing."""
+        statuses = {session.name: str(session.status).lower() for session in sessions}
+        with self._lock:
+            self._statuses = statuses
+            self._refreshed_at = self._clock()
+        return statuses
+
+    def refresh(self) -> Optional[Dict[str, str]]:
+        try:
+            return self.store(self._list_sessions())
+        except Exception as e:
+            logger.warning(f"Failed to list Aura sessions: {e}")
+            with self._lock:
+                return self._statuses
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(
+            target=refresh, name="gds-agent-session-status", daemon=True
+        ).start()
+
+    def exists(self, session_name: str) -> bool:
+        with self._lock:
+            statuses, refreshed_at = self._statuses, self._refreshed_at
+        if refreshed_at is None:
+            statuses = self.refresh()
+        elif self._clock() - refreshed_at > self.ttl:
+            self._refresh_in_background()
+        if statuses is None:
+            # Sessions could not be listed; assume the cached session still works
+            return True
+        status = statuses.get(session_name)
+        return status is not None and status not in INACTIVE_SESSION_STATUSES
+
+    def mark(self, session_name: str, status: str):
+        """Record a status change made by this server, e.g. a created session."""
+        with self._lock:
+            if self._statuses is not None:
+                self._statuses[session_name] = status.lower()
+
+    def invalidate(self):
+        """Distrust the current listing; the next lookup lists sessions again."""
+        with self._lock:
+            self._refreshed_at = None
+
+
 class GdsMode:
     PLUGIN = "plugin"
     SESSION = "session"
 
 
 class SessionManager:
-    def __init__(self):
+    def __init__(self, state_file: Optional[SessionStateFile] = None):
         self.mode: Optional[str] = None
         self._sessions: Dict[str, GraphDataScience] = {}
         self.graph_sessions: Dict[str, str] = {}
+        self.model_sessions: Dict[str, str] = {}
+        # Arguments of project_graph_cypher per graph, to re-project on resizes
+        self.graph_projections: Dict[str, dict] = {}
         self._lock = threading.Lock()
         self._sessions_client: Optional[GdsSessions] = None
+        self._statuses = SessionStatusCache(lambda: self._sessions_client.list())
+        # Sessions this server attached, including those recorded in the
+        # state file by an earlier run and not re-attached yet
+        self._known_sessions: Dict[str, dict] = {}
+        self._connection: Optional[Tuple[str, Tuple[str, str], Optional[str]]] = None
+        self._state_file = state_file
+        self._warm_pool: Optional[WarmSessionPool] = None
+        if state_file is not None:
+            state = state_file.load()
+            self._known_sessions = state["sessions"]
+            self.graph_sessions = dict(state["graphs"])
+            self.model_sessions = dict(state["models"])
+            self.graph_projections = dict(state["projections"])
+            logger.info(
+                f"Resumed {len(self._known_sessions)} sessions, "
+                f"{len(self.graph_sessions)} graphs and {len(self.model_sessions)} "
+                f"models from {state_file.path}"
+            )
+
+    def set_connection(
+        self, db_url: str, auth: Tuple[str, str], database: Optional[str] = None
+    ):
+        """Database connection used to re-attach sessions recorded in the state file."""
+        self._connection = (db_url, auth, database)
+
+    def _save_state(self):
+        if self._state_file is None:
+            return
+        with self._lock:
+            state = {
+                "sessions": dict(self._known_sessions),
+                "graphs": dict(self.graph_sessions),
+                "models": dict(self.model_sessions),
+                "projections": dict(self.graph_projections),
+            }
+        self._state_file.save(state)
 
     def detect_mode(self, gds: GraphDataScience) -> str:
         if self.mode is not None:
@@ -65,29 +240,192 @@ class SessionManager:
         )
         logger.info("Aura API credentials initialized")
 
+    def _aura_name(self, session_name: str) -> str:
+        """Name of the Aura session behind ``session_name``, which differs for
+        sessions claimed from the warm pool."""
+        with self._lock:
+            known = self._known_sessions.get(session_name, {})
+        return known.get("auraName", session_name)
+
     def _cached_session_exists(self, session_name: str) -> bool:
         self._ensure_sessions_client()
-        try:
-            inactive_statuses = {"deleted", "deleting", "failed", "terminated"}
-            for session in self._sessions_client.list():
-                if session.name != session_name:
-                    continue
-                return str(session.status).lower() not in inactive_statuses
-            return False
-        except Exception as e:
-            logger.warning(f"Failed to validate cached session '{session_name}': {e}")
-            return True
+        return self._statuses.exists(self._aura_name(session_name))
+
+    def _create_aura_session(
+        self, aura_name: str, memory_gb: int, connection=None
+    ) -> GraphDataScience:
+        db_url, auth, database = connection or self._connection
+        memory = getattr(SessionMemory, f"m_{memory_gb}GB")
+        ttl = session_ttl()
+        logger.info(
+            f"Creating or getting session '{aura_name}' with {memory_gb}GB memory "
+            f"and {ttl.total_seconds() / 3600:g}h TTL"
+        )
+        db_connection = DbmsConnectionInfo(
+            uri=db_url, username=auth[0], password=auth[1], database=database
+        )
+        return self._sessions_client.get_or_create(
+            session_name=aura_name,
+            memory=memory,
+            ttl=ttl,
+            db_connection=db_connection,
+        )
+
+    def recommend_memory_gb(self, counts: dict, categories=None) -> int:
+        """Smallest session memory size estimated to fit a projection of ``counts``."""
+        self._ensure_sessions_client()
+        return recommend_memory_gb(self._sessions_client, counts, categories)
+
+    def _unclaimed_session_names(self) -> List[str]:
+        """Aura sessions not claimed under another name by this server."""
+        sessions = self._sessions_client.list()
+        with self._lock:
+            claimed = {
+                known["auraName"]
+                for known in self._known_sessions.values()
+                if "auraName" in known
+            }
+        return [
+            session.name
+            for session in sessions
+            if session.name not in claimed
+            and str(session.status).lower() not in INACTIVE_SESSION_STATUSES
+        ]
+
+    def start_warm_pool(self, sizes: Optional[Dict[int, int]] = None):
+        """Keep sessions of the sizes in GDS_AGENT_WARM_POOL ready to be claimed."""
+        sizes = warm_pool_sizes() if sizes is None else sizes
+        if not sizes or self._connection is None or self._warm_pool is not None:
+            return
+        if self._state_file is None:
+            # Claims of an earlier run would look like leftovers and be deleted
+            logger.warning(
+                f"{WARM_POOL_ENV} needs {STATE_FILE_ENV} to record claimed "
+                "sessions across restarts; not keeping warm sessions"
+            )
+            return
+        self._ensure_sessions_client()
+        for memory_gb in list(sizes):
+            if not hasattr(SessionMemory, f"m_{memory_gb}GB"):
+                logger.warning(f"Ignoring warm sessions of unknown size {memory_gb}GB")
+                del sizes[memory_gb]
+        if not sizes:
+            return
+        self._warm_pool = WarmSessionPool(
+            create=self._create_aura_session,
+            delete=lambda name: self._sessions_client.delete(session_name=name),
+            list_names=self._unclaimed_session_names,
+            sizes=sizes,
+            ttl_seconds=session_ttl().total_seconds(),
+        )
+        self._warm_pool.start()
+
+    def _claim_warm_session(
+        self, session_name: str, memory_gb: int, connection
+    ) -> Optional[GraphDataScience]:
+        """Serve a new session from the warm pool, mapping ``session_name``
+        to the pooled Aura session since sessions cannot be renamed."""
+        if self._warm_pool is None or connection != self._connection:
+            return None
+        with self._lock:
+            recorded = session_name in self._known_sessions
+        # An existing Aura session of that name is attached, not replaced
+        if recorded or self._statuses.exists(session_name):
+            return None
+        claimed = self._warm_pool.claim(memory_gb)
+        if claimed is None:
+            return None
+        aura_name, session_gds = claimed
+        with self._lock:
+            self._sessions[session_name] = session_gds
+            self._known_sessions[session_name] = {
+                "memoryGB": memory_gb,
+                "auraName": aura_name,
+            }
+        self._save_state()
+        logger.info(f"Session '{session_name}' is warm session '{aura_name}'")
+        return session_gds
+
+    def report_error(self, gds: GraphDataScience, error: Exception):
+        """Re-check the sessions before reusing them when a call on ``gds``
+        failed in a way that suggests its session is gone."""
+        if not is_dead_session_error(error):
+            return
+        with self._lock:
+            names = [name for name, cached in self._sessions.items() if cached is gds]
+        if names:
+            logger.info(f"Session '{names[0]}' may be gone: {error}")
+            self._statuses.invalidate()
+
+    def resize_hint(self, gds: GraphDataScience, error: Exception) -> Optional[str]:
+        """How to move on when a call on ``gds`` ran out of session memory."""
+        if not is_out_of_memory_error(error):
+            return None
+        with self._lock:
+            names = [name for name, cached in self._sessions.items() if cached is gds]
+            if not names:
+                return None
+            memory_gb = self._known_sessions.get(names[0], {}).get("memoryGB")
+        larger = next_tier(memory_gb or default_session_memory_gb())
+        if larger is None:
+            return None
+        return (
+            f"Session '{names[0]}' ran out of memory. Call resize_session to move "
+            f"it and its graphs to a {larger}GB session."
+        )
 
     def _evict(self, session_name: str):
         cached = self._sessions.pop(session_name, None)
         if cached is not None:
+            dispatch_cache.invalidate(cached)
             with suppress(Exception):
                 cached.close()
+        self._known_sessions.pop(session_name, None)
         self.graph_sessions = {
             graph: session
             for graph, session in self.graph_sessions.items()
             if session != session_name
         }
+        self.graph_projections = {
+            graph: projection
+            for graph, projection in self.graph_projections.items()
+            if graph in self.graph_sessions
+        }
+        self.model_sessions = {
+            model: session
+            for model, session in self.model_sessions.items()
+            if session != session_name
+        }
+
+    def _reattach(self, session_name: str) -> Optional[GraphDataScience]:
+        """Attach a session recorded by an earlier run, if it is still alive."""
+        if self._connection is None:
+            return None
+        if not self._cached_session_exists(session_name):
+            logger.info(f"Recorded session '{session_name}' is no longer available")
+            with self._lock:
+                self._evict(session_name)
+            self._save_state()
+            return None
+        db_url, auth, database = self._connection
+        with self._lock:
+            memory_gb = self._known_sessions.get(session_name, {}).get("memoryGB")
+        try:
+            return self.create_or_get_session(
+                db_url, auth, database, session_name=session_name, memory_gb=memory_gb
+            )
+        except Exception as e:
+            logger.warning(f"Failed to re-attach session '{session_name}': {e}")
+            return None
+
+    def attach_recorded_sessions(self):
+        """Re-attach every session recorded by an earlier run."""
+        with self._lock:
+            recorded = [
+                name for name in self._known_sessions if name not in self._sessions
+            ]
+        for session_name in recorded:
+            self._reattach(session_name)
 
     def create_or_get_session(
         self,
@@ -108,28 +446,19 @@ class SessionManager:
             logger.info(f"Cached session '{resolved_name}' is no longer available")
             with self._lock:
                 self._evict(resolved_name)
+            self._save_state()
 
         self._ensure_sessions_client()
 
         if memory_gb is None:
-            memory_gb = int(os.getenv("SESSION_MEMORY_GB") or "8")
-        memory = getattr(SessionMemory, f"m_{memory_gb}GB")
-        ttl_hours = int(os.getenv("SESSION_TTL_HOURS") or "24")
-
-        logger.info(
-            f"Creating or getting session '{resolved_name}' with {memory_gb}GB memory and {ttl_hours}h TTL"
-        )
-
-        db_connection = DbmsConnectionInfo(
-            uri=db_url, username=auth[0], password=auth[1], database=database
-        )
-
-        session_gds = self._sessions_client.get_or_create(
-            session_name=resolved_name,
-            memory=memory,
-            ttl=timedelta(hours=ttl_hours),
-            db_connection=db_connection,
-        )
+            memory_gb = default_session_memory_gb()
+        connection = (db_url, auth, database)
+        claimed = self._claim_warm_session(resolved_name, memory_gb, connection)
+        if claimed is not None:
+            return claimed
+
+        aura_name = self._aura_name(resolved_name)
+        session_gds = self._create_aura_session(aura_name, memory_gb, connection)
         with self._lock:
             # Another thread may have created this session concurrently
             existing = self._sessions.get(resolved_name)
@@ -138,6 +467,11 @@ class SessionManager:
                     session_gds.close()
                 return existing
             self._sessions[resolved_name] = session_gds
+            self._known_sessions[resolved_name] = {"memoryGB": memory_gb}
+            if aura_name != resolved_name:
+                self._known_sessions[resolved_name]["auraName"] = aura_name
+        self._statuses.mark(aura_name, "ready")
+        self._save_state()
         logger.info(f"Session '{resolved_name}' created/retrieved successfully")
         return session_gds
 
@@ -145,12 +479,14 @@ class SessionManager:
         resolved_name = ensure_mcp_session_name(session_name)
         with self._lock:
             cached = self._sessions.get(resolved_name)
+            recorded = resolved_name in self._known_sessions
         if cached is None:
-            return None
+            return self._reattach(resolved_name) if recorded else None
         if self._cached_session_exists(resolved_name):
             return cached
         with self._lock:
             self._evict(resolved_name)
+        self._save_state()
         return None
 
     def active_sessions(self) -> List[Tuple[str, GraphDataScience]]:
@@ -160,69 +496,275 @@ class SessionManager:
     def assert_graph_unmapped(self, graph_name: str, target_session: str):
         with self._lock:
             mapped = self.graph_sessions.get(graph_name)
-            if mapped and mapped != target_session and mapped in self._sessions:
+            if (
+                mapped
+                and mapped != target_session
+                and (mapped in self._sessions or mapped in self._known_sessions)
+            ):
                 raise ValueError(
                     f"Graph '{graph_name}' already exists in session '{mapped}'. "
                     f"Drop it first or choose a different graph name."
                 )
 
-    def record_graph(self, graph_name: str, session_name: str):
+    def record_graph(
+        self, graph_name: str, session_name: str, projection: Optional[dict] = None
+    ):
         with self._lock:
             self.graph_sessions[graph_name] = session_name
+            if projection is not None:
+                self.graph_projections[graph_name] = projection
+        self._save_state()
 
     def forget_graph(self, graph_name: str):
         with self._lock:
             self.graph_sessions.pop(graph_name, None)
+            self.graph_projections.pop(graph_name, None)
+        self._save_state()
+
+    def record_model(self, model_name: str, gds: GraphDataScience):
+        """Remember the session a model was trained in."""
+        with self._lock:
+            names = [name for name, cached in self._sessions.items() if cached is gds]
+            if not names:
+                return
+            self.model_sessions[model_name] = names[0]
+        self._save_state()
+
+    def forget_model(self, model_name: str):
+        with self._lock:
+            self.model_sessions.pop(model_name, None)
+        self._save_state()
+
+    def sessions_for_model(self, model_name: str) -> List[Tuple[str, GraphDataScience]]:
+        """Active sessions, the one the model was trained in first."""
+        with self._lock:
+            mapped = self.model_sessions.get(model_name)
+        sessions = self.active_sessions()
+        return sorted(sessions, key=lambda session: session[0] != mapped)
+
+    def fan_out(
+        self,
+        call,
+        sessions: Optional[List[Tuple[str, GraphDataScience]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run ``call(gds)`` on sessions concurrently, by default all active ones.
+
+        Returns the results of the sessions that answered within the timeout,
+        in session order; failures and timeouts are logged and left out.
+        """
+        sessions = self.active_sessions() if sessions is None else sessions
+        if not sessions:
+            return {}
+        timeout = session_call_timeout() if timeout is None else timeout
+        pool = ThreadPoolExecutor(
+            max_workers=min(len(sessions), MAX_FAN_OUT_WORKERS),
+            thread_name_prefix="gds-agent-sessions",
+        )
+        futures = {pool.submit(call, gds): name for name, gds in sessions}
+        _, pending = wait(futures, timeout=timeout)
+        # Calls that timed out finish in the background; nobody waits for them
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        for future, name in futures.items():
+            if future in pending:
+                logger.warning(f"Session '{name}' did not answer within {timeout:g}s")
+                continue
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.warning(f"Call on session '{name}' failed: {e}")
+        return results
+
+    def rebuild_graph_mapping(self) -> int:
+        """Map every graph of the active sessions in one concurrent sweep."""
+        listings = self.fan_out(lambda gds: gds.graph.list()["graphName"].tolist())
+        with self._lock:
+            for session_name, graph_names in listings.items():
+                for graph_name in graph_names:
+                    self.graph_sessions[graph_name] = session_name
+        mapped = sum(len(graph_names) for graph_names in listings.values())
+        if listings:
+            logger.info(f"Mapped {mapped} graphs in {len(listings)} sessions")
+            self._save_state()
+        return mapped
+
+    def resume(self):
+        """Re-attach the sessions recorded by an earlier run and map their graphs."""
+        try:
+            self.attach_recorded_sessions()
+            self.rebuild_graph_mapping()
+        except Exception as e:
+            logger.warning(f"Failed to resume recorded sessions: {e}")
+
+    def resume_in_background(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.resume, name="gds-agent-resume-sessions", daemon=True
+        )
+        thread.start()
+        return thread
 
     def session_for_graph(self, graph_name: str) -> Optional[str]:
         with self._lock:
             mapped = self.graph_sessions.get(graph_name)
             if mapped and mapped in self._sessions:
                 return mapped
-            sessions = dict(self._sessions)
-        # Unmapped graph (e.g. after a restart): look for it in the active sessions
-        for name, gds in sessions.items():
-            try:
-                if bool(gds.graph.exists(graph_name)["exists"]):
-                    self.record_graph(graph_name, name)
-                    return name
-            except Exception as e:
-                logger.warning(
-                    f"Failed to check graph '{graph_name}' in session '{name}': {e}"
-                )
+            recorded = mapped in self._known_sessions
+        if recorded and self.get_session(mapped) is not None:
+            return mapped
+        sessions = self.active_sessions()
+        # Unmapped graph (e.g. after a restart): look for it in all active sessions at once
+        found = self.fan_out(
+            lambda gds: bool(gds.graph.exists(graph_name)["exists"]), sessions
+        )
+        for name, exists in found.items():
+            if exists:
+                self.record_graph(graph_name, name)
+                return name
         return None
 
+    def resize_session(
+        self, session_name: str, reproject, memory_gb: Optional[int] = None
+    ) -> dict:
+        """Move a session to a larger one, by default the next memory size.
+
+        A new Aura session is created and every graph of the session is
+        re-projected into it with ``reproject(gds, graph_name, projection)``
+        before the session name is switched over and the old session deleted.
+        If a re-projection fails, the new session is deleted and the old one
+        kept. Graphs projected without a recorded query, e.g. before the
+        state file was enabled, and trained models cannot be carried over.
+        """
+        resolved_name = ensure_mcp_session_name(session_name)
+        old_gds = self.get_session(resolved_name)
+        if old_gds is None:
+            raise ValueError(f"Session '{resolved_name}' not found")
+        with self._lock:
+            known = dict(self._known_sessions.get(resolved_name, {}))
+            graphs = {
+                graph: self.graph_projections.get(graph)
+                for graph, session in self.graph_sessions.items()
+                if session == resolved_name
+            }
+            models = sorted(
+                model
+                for model, session in self.model_sessions.items()
+                if session == resolved_name
+            )
+        current_gb = known.get("memoryGB") or default_session_memory_gb()
+        target_gb = (
+            next_tier(current_gb) if memory_gb is None else smallest_tier(memory_gb)
+        )
+        if target_gb is None:
+            largest = SESSION_MEMORY_TIERS[-1]
+            raise ValueError(f"Sessions cannot have more than {largest}GB of memory")
+        if target_gb <= current_gb:
+            raise ValueError(
+                f"Session '{resolved_name}' already has {current_gb}GB of memory; "
+                f"resize_session only moves to larger sessions"
+            )
+
+        old_aura_name = known.get("auraName", resolved_name)
+        new_aura_name = f"{resolved_name}_{target_gb}gb_{uuid.uuid4().hex[:4]}"
+        new_gds = self._create_aura_session(new_aura_name, target_gb)
+        reprojected = []
+        try:
+            for graph_name, projection in graphs.items():
+                if projection is not None:
+                    reproject(new_gds, graph_name, projection)
+                    reprojected.append(graph_name)
+        except Exception as e:
+            with suppress(Exception):
+                new_gds.close()
+            with suppress(Exception):
+                self._sessions_client.delete(session_name=new_aura_name)
+            raise ValueError(
+                f"Re-projecting graph '{graph_name}' into a {target_gb}GB session "
+                f"failed, session '{resolved_name}' was left unchanged: {e}"
+            ) from e
+
+        dropped = sorted(set(graphs) - set(reprojected))
+        with self._lock:
+            self._sessions[resolved_name] = new_gds
+            self._known_sessions[resolved_name] = {
+                "memoryGB": target_gb,
+                "auraName": new_aura_name,
+            }
+            for graph_name in dropped:
+                self.graph_sessions.pop(graph_name, None)
+            for model_name in models:
+                self.model_sessions.pop(model_name, None)
+        self._statuses.mark(new_aura_name, "ready")
+        self._save_state()
+        dispatch_cache.invalidate(old_gds)
+        with suppress(Exception):
+            old_gds.close()
+        try:
+            self._sessions_client.delete(session_name=old_aura_name)
+            self._statuses.mark(old_aura_name, "deleted")
+        except Exception as e:
+            logger.warning(f"Failed to delete resized session '{old_aura_name}': {e}")
+        logger.info(
+            f"Resized session '{resolved_name}' from {current_gb}GB to {target_gb}GB"
+        )
+        return {
+            "sessionName": resolved_name,
+            "memoryGB": target_gb,
+            "previousMemoryGB": current_gb,
+            "reprojectedGraphs": reprojected,
+            "droppedGraphs": dropped,
+            "droppedModels": models,
+        }
+
     def list_sessions(self):
         self._ensure_sessions_client()
 
+        listing = self._sessions_client.list()
+        self._statuses.store(listing)
+        with self._lock:
+            claimed_as = {
+                known["auraName"]: name
+                for name, known in self._known_sessions.items()
+                if "auraName" in known
+            }
         sessions = []
-        for s in self._sessions_client.list():
-            sessions.append(
-                {
-                    "name": s.name,
-                    "status": s.status,
-                    "memory": str(s.memory),
-                    "created_at": str(s.created_at),
-                    "expiry_date": str(s.expiry_date) if s.expiry_date else None,
-                }
-            )
+        for s in listing:
+            session = {
+                "name": s.name,
+                "status": s.status,
+                "memory": str(s.memory),
+                "created_at": str(s.created_at),
+                "expiry_date": str(s.expiry_date) if s.expiry_date else None,
+            }
+            if s.name in claimed_as:
+                session["claimedAs"] = claimed_as[s.name]
+            sessions.append(session)
         return {"sessions": sessions, "count": len(sessions)}
 
     def delete_session(self, session_name: str):
         self._ensure_sessions_client()
         resolved_name = ensure_mcp_session_name(session_name)
+        aura_name = self._aura_name(resolved_name)
 
         with self._lock:
             self._evict(resolved_name)
+        self._save_state()
 
-        logger.info(f"Deleting session: {resolved_name}")
-        deleted = self._sessions_client.delete(session_name=resolved_name)
+        logger.info(f"Deleting session: {aura_name}")
+        deleted = self._sessions_client.delete(session_name=aura_name)
+        self._statuses.mark(aura_name, "deleted")
 
         return {"session_name": resolved_name, "deleted": deleted}
 
     def close(self):
+        if self._warm_pool is not None:
+            self._warm_pool.stop()
+            self._warm_pool = None
+        # The state file is kept, so the next run can resume these sessions
         with self._lock:
             for gds in self._sessions.values():
+                dispatch_cache.invalidate(gds)
                 with suppress(Exception):
                     gds.close()
             self._sessions.clear()
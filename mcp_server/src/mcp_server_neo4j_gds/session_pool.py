@@ -0,0 +1,191 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import suppress
+from typing import Callable, Dict, List, Optional, Tuple
+
+from graphdatascience import GraphDataScience
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+WARM_POOL_ENV = "GDS_AGENT_WARM_POOL"
+POOL_SESSION_PREFIX = "mcp_pool_"
+DEFAULT_REPLENISH_INTERVAL = 60
+# Pooled sessions sit idle, so Aura expires them once their TTL has passed;
+# they are replaced a little before that
+TTL_SAFETY_FACTOR = 0.9
+
+
+def parse_pool_sizes(value: Optional[str]) -> Dict[int, int]:
+    """Parse e.g. '8:2,16:1' into {memory GB: number of warm sessions}."""
+    sizes = {}
+    for item in (value or "").split(","):
+        memory_gb, _, count = item.partition(":")
+        try:
+            memory_gb, count = int(memory_gb), int(count or 1)
+        except ValueError:
+            continue
+        if memory_gb > 0 and count > 0:
+            sizes[memory_gb] = count
+    return sizes
+
+
+class WarmSession:
+    def __init__(
+        self, name: str, memory_gb: int, gds: GraphDataScience, created: float
+    ):
+        self.name = name
+        self.memory_gb = memory_gb
+        self.gds = gds
+        self.created = created
+
+
+class WarmSessionPool:
+    """Aura sessions created ahead of time, so create_session can claim one
+    instantly instead of waiting minutes for provisioning.
+
+    A background thread keeps ``sizes[memory_gb]`` unclaimed sessions of each
+    memory size, creating replacements after claims and before idle
+    sessions reach their TTL.
+    On start, unclaimed pool sessions left behind by an earlier process,
+    e.g. one that was killed, are deleted; only one server per Aura project
+    should therefore keep a warm pool.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[str, int], GraphDataScience],
+        delete: Callable[[str], None],
+        list_names: Callable[[], List[str]],
+        sizes: Dict[int, int],
+        ttl_seconds: float,
+        interval: float = DEFAULT_REPLENISH_INTERVAL,
+        clock=time.monotonic,
+    ):
+        self._create = create
+        self._delete = delete
+        self._list = list_names
+        self.sizes = dict(sizes)
+        self._ttl_seconds = ttl_seconds
+        self._interval = interval
+        self._clock = clock
+        self._warm: Dict[int, List[WarmSession]] = {size: [] for size in sizes}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def claim(self, memory_gb: int) -> Optional[Tuple[str, GraphDataScience]]:
+        """Take a warm session of ``memory_gb``: (its Aura name, its connection)."""
+        with self._lock:
+            warm = self._warm.get(memory_gb)
+            if not warm:
+                return None
+            session = warm.pop(0)
+        logger.info(f"Claimed warm session '{session.name}' ({memory_gb}GB)")
+        self._wake.set()
+        return session.name, session.gds
+
+    def available(self) -> Dict[int, int]:
+        with self._lock:
+            return {size: len(warm) for size, warm in self._warm.items()}
+
+    def _expired(self, now: float) -> List[WarmSession]:
+        expired = []
+        with self._lock:
+            for size, warm in self._warm.items():
+                fresh = []
+                for session in warm:
+                    age = now - session.created
+                    if age > self._ttl_seconds * TTL_SAFETY_FACTOR:
+                        expired.append(session)
+                    else:
+                        fresh.append(session)
+                self._warm[size] = fresh
+        return expired
+
+    def replenish(self):
+        """Replace sessions close to their TTL and create the missing ones."""
+        for session in self._expired(self._clock()):
+            logger.info(f"Replacing warm session '{session.name}' before it expires")
+            self._discard(session)
+        for memory_gb, target in self.sizes.items():
+            while not self._stopped.is_set():
+                with self._lock:
+                    if len(self._warm[memory_gb]) >= target:
+                        break
+                name = f"{POOL_SESSION_PREFIX}{memory_gb}gb_{uuid.uuid4().hex[:8]}"
+                logger.info(f"Creating warm session '{name}' ({memory_gb}GB)")
+                try:
+                    gds = self._create(name, memory_gb)
+                except Exception as e:
+                    logger.warning(f"Failed to create warm session '{name}': {e}")
+                    break
+                session = WarmSession(name, memory_gb, gds, self._clock())
+                with self._lock:
+                    # stop() may have emptied the pool while this one was provisioned
+                    stopped = self._stopped.is_set()
+                    if not stopped:
+                        self._warm[memory_gb].append(session)
+                if stopped:
+                    self._discard(session)
+
+    def _discard(self, session: WarmSession):
+        with suppress(Exception):
+            session.gds.close()
+        try:
+            self._delete(session.name)
+        except Exception as e:
+            logger.warning(f"Failed to delete warm session '{session.name}': {e}")
+
+    def _delete_leftovers(self):
+        """Delete pool sessions left behind by a process that did not stop its pool."""
+        try:
+            names = [
+                name for name in self._list() if name.startswith(POOL_SESSION_PREFIX)
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to list leftover warm sessions: {e}")
+            return
+        for name in names:
+            logger.info(f"Deleting leftover warm session '{name}'")
+            try:
+                self._delete(name)
+            except Exception as e:
+                logger.warning(f"Failed to delete warm session '{name}': {e}")
+
+    def _run(self):
+        self._delete_leftovers()
+        while not self._stopped.is_set():
+            try:
+                self.replenish()
+            except Exception as e:
+                logger.warning(f"Warm session pool replenishment failed: {e}")
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="gds-agent-warm-pool", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Keeping warm sessions: {self.sizes}")
+
+    def stop(self):
+        """Stop replenishing and delete the sessions nobody claimed."""
+        self._stopped.set()
+        self._wake.set()
+        with self._lock:
+            unclaimed = [session for warm in self._warm.values() for session in warm]
+            for warm in self._warm.values():
+                warm.clear()
+        for session in unclaimed:
+            self._discard(session)
+
+
+def warm_pool_sizes() -> Dict[int, int]:
+    return parse_pool_sizes(os.getenv(WARM_POOL_ENV))
@@ -0,0 +1,115 @@
+import logging
+import os
+
+from graphdatascience.session import AlgorithmCategory, SessionMemory
+
+from .gds import get_node_labels, get_projectable_properties
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_SESSION_MEMORY_GB = 8
+
+OUT_OF_MEMORY_MESSAGES = (
+    "outofmemoryerror",
+    "out of memory",
+    "java heap space",
+    "not enough memory",
+    "exceeds current free memory",
+)
+
+
+def tier_gb(memory: SessionMemory) -> int:
+    return int(memory.value.value.removesuffix("GB"))
+
+
+SESSION_MEMORY_TIERS = sorted(tier_gb(memory) for memory in SessionMemory)
+
+
+def default_session_memory_gb() -> int:
+    return int(os.getenv("SESSION_MEMORY_GB") or DEFAULT_SESSION_MEMORY_GB)
+
+
+def smallest_tier(required_gb: float) -> int | None:
+    """Smallest session memory size of at least ``required_gb``."""
+    return next((gb for gb in SESSION_MEMORY_TIERS if gb >= required_gb), None)
+
+
+def next_tier(memory_gb: int) -> int | None:
+    return next((gb for gb in SESSION_MEMORY_TIERS if gb > memory_gb), None)
+
+
+def is_out_of_memory_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(text in message for text in OUT_OF_MEMORY_MESSAGES)
+
+
+def _escaped(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _count(gds, query: str) -> int:
+    return int(gds.run_cypher(query)["count"].iloc[0])
+
+
+def projection_counts(gds, node_labels=None, relationship_types=None) -> dict:
+    """Size of a planned projection of the database behind ``gds``.
+
+    Counts come from the database's count store, one query per label and
+    type; nodes carrying several of the labels are counted once per label,
+    which oversizes slightly rather than undersizing the session.
+    """
+    node_labels = list(node_labels or [])
+    relationship_types = list(relationship_types or [])
+    if node_labels:
+        node_count = sum(
+            _count(gds, f"MATCH (n:{_escaped(label)}) RETURN count(n) AS count")
+            for label in node_labels
+        )
+    else:
+        node_count = _count(gds, "MATCH (n) RETURN count(n) AS count")
+    if relationship_types:
+        relationship_count = sum(
+            _count(
+                gds, f"MATCH ()-[r:{_escaped(rel_type)}]->() RETURN count(r) AS count"
+            )
+            for rel_type in relationship_types
+        )
+    else:
+        relationship_count = _count(gds, "MATCH ()-[r]->() RETURN count(r) AS count")
+    rel_properties, node_properties = get_projectable_properties(
+        gds, node_labels, relationship_types
+    )
+    return {
+        "nodeCount": node_count,
+        "relationshipCount": relationship_count,
+        "nodeLabelCount": len(node_labels) or len(get_node_labels(gds)),
+        "nodePropertyCount": len(node_properties),
+        "relationshipPropertyCount": len(rel_properties),
+    }
+
+
+def algorithm_categories(names) -> list[AlgorithmCategory]:
+    categories = []
+    for name in names or []:
+        try:
+            categories.append(AlgorithmCategory(name))
+        except ValueError:
+            available = ", ".join(category.value for category in AlgorithmCategory)
+            raise ValueError(
+                f"Unknown algorithm category '{name}'. Available categories: {available}"
+            ) from None
+    return categories
+
+
+def recommend_memory_gb(sessions_client, counts: dict, categories=None) -> int:
+    """Smallest session memory size the Aura API estimates to fit a projection
+    of ``counts`` and runs of algorithms of ``categories`` on it."""
+    memory = sessions_client.estimate(
+        node_count=counts["nodeCount"],
+        relationship_count=counts["relationshipCount"],
+        algorithm_categories=algorithm_categories(categories),
+        node_label_count=counts["nodeLabelCount"],
+        node_property_count=counts["nodePropertyCount"],
+        relationship_property_count=counts["relationshipPropertyCount"],
+    )
+    return tier_gb(memory)
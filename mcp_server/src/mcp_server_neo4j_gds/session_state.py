@@ -0,0 +1,74 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import suppress
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+STATE_FILE_ENV = "GDS_AGENT_STATE_FILE"
+STATE_VERSION = 1
+
+
+def empty_state() -> dict:
+    return {"sessions": {}, "graphs": {}, "models": {}, "projections": {}}
+
+
+class SessionStateFile:
+    """JSON file recording the sessions this server attached, with the
+    graphs and models living in them, so a restarted server can resume.
+
+    ``sessions`` maps session names to how they were created, ``graphs`` and
+    ``models`` map names to their session and ``projections`` keeps the
+    projection query of each graph. Writes replace the file
+    atomically, so a crash never leaves a half-written state behind.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return empty_state()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.path}: {e}")
+            return empty_state()
+        if not isinstance(stored, dict) or stored.get("version") != STATE_VERSION:
+            logger.warning(f"Ignoring state file {self.path} of an unknown version")
+            return empty_state()
+        state = empty_state()
+        for key in state:
+            if isinstance(stored.get(key), dict):
+                state[key] = stored[key]
+        return state
+
+    def save(self, state: dict):
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            temp_path = None
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(
+                    prefix=".gds-agent-state-", dir=directory
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": STATE_VERSION, **state}, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to write state file {self.path}: {e}")
+                if temp_path is not None:
+                    with suppress(OSError):
+                        os.remove(temp_path)
+
+
+def session_state_file() -> SessionStateFile | None:
+    """The state file configured with GDS_AGENT_STATE_FILE, if any."""
+    path = os.getenv(STATE_FILE_ENV) or None
+    return SessionStateFile(path) if path else None
@@ -3,7 +3,7 @@ from typing import Dict, Any
 
 from .algorithm_handler import AlgorithmHandler, clean_params
 from .node_translator import (
-    translate_ids_to_identifiers,
+    NodeNamePipeline,
     translate_identifiers_to_ids,
 )
 
@@ -13,7 +13,7 @@ logger = logging.getLogger("mcp_server_neo4j_gds")
 class NodeSimilarityHandler(AlgorithmHandler):
     def node_similarity(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs,
             [
@@ -42,26 +42,18 @@ class NodeSimilarityHandler(AlgorithmHandler):
             gds_params,
         )
         logger.info(f"Node Similarity parameters: {gds_params}")
+        self.admit_memory(self.gds.nodeSimilarity.filtered, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.nodeSimilarity.filtered.mutate(G, **gds_params)
         else:
             result = self.gds.nodeSimilarity.filtered.stream(G, **gds_params)
 
             node_identifier_property = kwargs.get("nodeIdentifierProperty")
-            translate_ids_to_identifiers(
+            result = NodeNamePipeline(
                 self.gds,
                 node_identifier_property,
-                result,
-                "node1",
-                "node1Name",
-            )
-            translate_ids_to_identifiers(
-                self.gds,
-                node_identifier_property,
-                result,
-                "node2",
-                "node2Name",
-            )
+                [("node1", "node1Name"), ("node2", "node2Name")],
+            ).apply(result)
         return result
 
     def execute(self, arguments: Dict[str, Any]) -> Any:
@@ -89,7 +81,7 @@ class NodeSimilarityHandler(AlgorithmHandler):
 class KNearestNeighborsHandler(AlgorithmHandler):
     def k_nearest_neighbors(self, **kwargs):
         mode = kwargs.get("mode", "stream")
-        G = self.gds.graph.get(kwargs.get("graphName"))
+        G = self.get_graph(kwargs.get("graphName"))
         gds_params = clean_params(
             kwargs,
             [
@@ -119,26 +111,18 @@ class KNearestNeighborsHandler(AlgorithmHandler):
         )
 
         logger.info(f"K-Nearest Neighbors parameters: {kwargs}")
+        self.admit_memory(self.gds.knn.filtered, G, mode, gds_params)
         if mode == "mutate":
             result = self.gds.knn.filtered.mutate(G, **gds_params)
         else:
             result = self.gds.knn.filtered.stream(G, **gds_params)
 
             node_identifier_property = kwargs.get("nodeIdentifierProperty")
-            translate_ids_to_identifiers(
-                self.gds,
-                node_identifier_property,
-                result,
-                "node1",
-                "node1Name",
-            )
-            translate_ids_to_identifiers(
+            result = NodeNamePipeline(
                 self.gds,
                 node_identifier_property,
-                result,
-                "node2",
-                "node2Name",
-            )
+                [("node1", "node1Name"), ("node2", "node2Name")],
+            ).apply(result)
 
         return result
 
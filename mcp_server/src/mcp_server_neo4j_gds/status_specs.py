@@ -0,0 +1,11 @@
+from mcp import types
+
+status_tool_definitions = [
+    types.Tool(
+        name="server_status",
+        description="Report how busy the MCP server is: worker slots in use, tool calls running and queued "
+        "(with the peak queue depth), calls rejected, timed out or cancelled, memory reserved by running "
+        "algorithms and node name cache hits. Answers immediately, even while every worker is busy.",
+        inputSchema={"type": "object"},
+    ),
+]
@@ -0,0 +1,279 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+logger = logging.getLogger("mcp_server_neo4j_gds")
+
+DEFAULT_WORKERS = 8
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_QUEUE_TIMEOUT = 300
+WORKERS_ENV = "GDS_AGENT_WORKERS"
+QUEUE_SIZE_ENV = "GDS_AGENT_QUEUE_SIZE"
+QUEUE_TIMEOUT_ENV = "GDS_AGENT_QUEUE_TIMEOUT"
+TOOL_WEIGHTS_ENV = "GDS_AGENT_TOOL_WEIGHTS"
+DEFAULT_TOOL_TIMEOUT = 0
+TOOL_TIMEOUT_ENV = "GDS_AGENT_TOOL_TIMEOUT"
+TOOL_TIMEOUTS_ENV = "GDS_AGENT_TOOL_TIMEOUTS"
+
+# Tools whose memory and CPU use grows far beyond a single pass over the graph.
+# Each one takes this many worker slots, so only a few run at the same time.
+HEAVY_TOOL_WEIGHT = 4
+HEAVY_TOOLS = frozenset(
+    {
+        "all_pairs_shortest_paths",
+        "betweenness_centrality",
+        "node2vec",
+        "graph_sage_train",
+        "node_similarity",
+        "k_nearest_neighbors",
+        "train_node_classification_model",
+        "train_link_prediction_model",
+        "train_node_regression_model",
+    }
+)
+
+
+# (executor, event loop, weight) of the tool call running on this worker thread
+_call_slots = contextvars.ContextVar("gds_agent_call_slots", default=None)
+
+
+@contextmanager
+def released_worker_slots():
+    """Give the running call's worker slots back while the block waits, e.g.
+    for memory, and take them back, ahead of queued calls, when it ends."""
+    slots = _call_slots.get()
+    if slots is None:
+        yield
+        return
+    executor, loop, weight = slots
+    loop.call_soon_threadsafe(executor._release, weight)
+    try:
+        yield
+    finally:
+        asyncio.run_coroutine_threadsafe(executor._reacquire(weight), loop).result()
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when a tool call cannot be admitted to the worker pool."""
+
+
+class ToolTimeoutError(RuntimeError):
+    """Raised when a tool call runs past its timeout and is cancelled."""
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return max(cast(os.getenv(name, default)), 0)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def _parse_tool_values(value, env_name, cast, minimum):
+    values = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        tool, _, tool_value = entry.partition("=")
+        try:
+            values[tool.strip()] = max(cast(tool_value), minimum)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {env_name} entry '{entry}'")
+    return values
+
+
+def parse_tool_weights(value: str | None) -> dict:
+    """Parse 'tool=weight,tool=weight' into {tool: weight}."""
+    return _parse_tool_values(value, TOOL_WEIGHTS_ENV, int, 1)
+
+
+def parse_tool_timeouts(value: str | None) -> dict:
+    """Parse 'tool=seconds,tool=seconds' into {tool: seconds}."""
+    return _parse_tool_values(value, TOOL_TIMEOUTS_ENV, float, 0)
+
+
+class ToolExecutor:
+    """Worker pool with weighted admission control for tool calls.
+
+    Every tool call takes ``weight(name)`` of ``workers`` slots while it runs.
+    Calls that do not fit wait in a FIFO queue of at most ``queue_size``
+    entries for up to ``queue_timeout`` seconds; a full queue, or a timeout of
+    0, rejects the call immediately instead of piling up work on the GDS
+    instance.
+
+    A call that runs past its timeout, or whose request is cancelled, is
+    abandoned and its ``on_cancel`` callback stops the work server-side. Its
+    slots stay taken until the worker thread actually returns.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        queue_timeout: float | None = None,
+        weights: dict | None = None,
+        timeout: float | None = None,
+        timeouts: dict | None = None,
+    ):
+        if workers is None:
+            workers = _env_number(WORKERS_ENV, DEFAULT_WORKERS)
+        if queue_size is None:
+            queue_size = _env_number(QUEUE_SIZE_ENV, DEFAULT_QUEUE_SIZE)
+        if queue_timeout is None:
+            queue_timeout = _env_number(QUEUE_TIMEOUT_ENV, DEFAULT_QUEUE_TIMEOUT, float)
+        if weights is None:
+            weights = parse_tool_weights(os.getenv(TOOL_WEIGHTS_ENV))
+        if timeout is None:
+            timeout = _env_number(TOOL_TIMEOUT_ENV, DEFAULT_TOOL_TIMEOUT, float)
+        if timeouts is None:
+            timeouts = parse_tool_timeouts(os.getenv(TOOL_TIMEOUTS_ENV))
+
+        self.workers = max(workers, 1)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._weights = weights
+        self.timeout = timeout
+        self._timeouts = timeouts
+        # Calls that gave their slots back while waiting keep their thread
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers + self.queue_size, thread_name_prefix="gds-tool"
+        )
+        self._available = self.workers
+        self._waiters = deque()
+        self.running = 0
+        self.peak_queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.run_timeouts = 0
+
+    def weight(self, name: str) -> int:
+        """Worker slots a call of tool ``name`` occupies."""
+        weight = self._weights.get(name)
+        if weight is None:
+            weight = HEAVY_TOOL_WEIGHT if name in HEAVY_TOOLS else 1
+        return min(weight, self.workers)
+
+    def timeout_for(self, name: str) -> float:
+        """Seconds a call of tool ``name`` may run; 0 means no limit."""
+        return self._timeouts.get(name, self.timeout)
+
+    def _wake(self):
+        while self._waiters and self._waiters[0][0] <= self._available:
+            weight, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._available -= weight
+            waiter.set_result(None)
+
+    def _release(self, weight):
+        self._available += weight
+        self._wake()
+
+    async def _acquire(self, name, weight):
+        if not self._waiters and weight <= self._available:
+            self._available -= weight
+            return
+
+        if len(self._waiters) >= self.queue_size or self.queue_timeout == 0:
+            self.rejected += 1
+            raise ServerBusyError(
+                f"Server is busy ({self.workers - self._available} of {self.workers} "
+                f"worker slots in use, {len(self._waiters)} calls queued). "
+                f"Retry '{name}' later."
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (weight, waiter)
+        self._waiters.append(entry)
+        self.peak_queued = max(self.peak_queued, len(self._waiters))
+        logger.info(f"Queued tool '{name}' (queue depth {len(self._waiters)})")
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slots were granted just as the wait ended
+                self._release(weight)
+            else:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                self._wake()
+            if isinstance(e, TimeoutError):
+                self.timed_out += 1
+                raise ServerBusyError(
+                    f"Tool '{name}' waited {self.queue_timeout:g}s for a free worker. "
+                    "Retry later."
+                ) from e
+            raise
+
+    async def _reacquire(self, weight):
+        if weight <= self._available:
+            self._available -= weight
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        # The call was admitted before; it goes ahead of calls still queued
+        self._waiters.appendleft((weight, waiter))
+        await waiter
+
+    def _finished(self, weight, future):
+        if not future.cancelled():
+            # Mark the error of an abandoned call as retrieved
+            future.exception()
+        self.running -= 1
+        self._release(weight)
+
+    def _abandon(self, name, on_cancel):
+        if on_cancel is None:
+            return
+        logger.info(f"Stopping abandoned tool call '{name}'")
+        # on_cancel blocks on the database; keep it off the event loop
+        asyncio.get_running_loop().run_in_executor(None, on_cancel)
+
+    async def run(self, name: str, func, *args, on_cancel=None):
+        """Run ``func(*args)`` on the pool once tool ``name`` is admitted."""
+        weight = self.weight(name)
+        await self._acquire(name, weight)
+        self.running += 1
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        context.run(_call_slots.set, (self, loop, weight))
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, context.run, func, *args
+        )
+        future.add_done_callback(functools.partial(self._finished, weight))
+
+        timeout = self.timeout_for(name)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout or None)
+        except TimeoutError as e:
+            self.run_timeouts += 1
+            self._abandon(name, on_cancel)
+            raise ToolTimeoutError(
+                f"Tool '{name}' did not finish within {timeout:g}s and was cancelled."
+            ) from e
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            self._abandon(name, on_cancel)
+            raise
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "slotsInUse": self.workers - self._available,
+            "running": self.running,
+            "queued": len(self._waiters),
+            "peakQueued": self.peak_queued,
+            "maxQueued": self.queue_size,
+            "rejected": self.rejected,
+            "timedOut": self.timed_out,
+            "runTimeouts": self.run_timeouts,
+            "cancelled": self.cancelled,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -88,6 +88,11 @@ async def test_list_tools(mcp_client):
         "predict_node_regression",
         "list_models",
         "drop_model",
+        # Background jobs
+        "submit_job",
+        "job_status",
+        "job_result",
+        "fetch_page",
     ]
 
     # Check that we have the expected tools
@@ -107,14 +112,14 @@ async def test_get_node_properties_keys(mcp_client):
     properties_keys = json.loads(result_text)
 
     assert properties_keys == [
-        "zone",
-        "rail",
+        "display_name",
+        "id",
         "latitude",
+        "longitude",
         "name",
+        "rail",
         "total_lines",
-        "id",
-        "display_name",
-        "longitude",
+        "zone",
     ]
 
 
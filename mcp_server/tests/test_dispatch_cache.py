@@ -0,0 +1,46 @@
+from mcp_server_neo4j_gds.dispatch_cache import DispatchCache
+from mcp_server_neo4j_gds.registry import AlgorithmRegistry
+
+
+class FakeGraphRunner:
+    def __init__(self):
+        self.gets = []
+
+    def get(self, graph_name):
+        self.gets.append(graph_name)
+        return object()
+
+
+class FakeGds:
+    def __init__(self):
+        self.graph = FakeGraphRunner()
+
+
+def test_graph_objects_are_fetched_once_until_invalidated():
+    cache = DispatchCache()
+    gds = FakeGds()
+
+    first = cache.graph(gds, "g")
+    assert cache.graph(gds, "g") is first
+    assert gds.graph.gets == ["g"]
+
+    cache.invalidate_graph(gds, "g")
+    assert cache.graph(gds, "g") is not first
+    assert gds.graph.gets == ["g", "g"]
+
+
+def test_handlers_are_reused_per_connection_and_dropped_with_it():
+    cache = DispatchCache()
+    gds, other_gds = FakeGds(), FakeGds()
+
+    handler = cache.handler("pagerank", gds, AlgorithmRegistry.get_handler)
+    assert cache.handler("pagerank", gds, AlgorithmRegistry.get_handler) is handler
+    assert cache.handler("pagerank", other_gds, AlgorithmRegistry.get_handler).gds is (
+        other_gds
+    )
+
+    cache.graph(gds, "g")
+    cache.invalidate(gds)
+    assert cache.stats()["handlers"] == 1
+    assert cache.stats()["graphs"] == 0
+    assert cache.handler("pagerank", gds, AlgorithmRegistry.get_handler) is not handler
@@ -0,0 +1,103 @@
+import pandas as pd
+
+from mcp_server_neo4j_gds.algorithm_handler import clean_params
+from mcp_server_neo4j_gds.centrality_algorithm_handlers import PageRankHandler
+from mcp_server_neo4j_gds.job_control import tagged_job, terminate_job
+
+
+class FakeCypher:
+    def __init__(self, show_fails=False):
+        self.show_fails = show_fails
+        self.queries = []
+
+    def run_cypher(self, query, params=None):
+        self.queries.append((query.strip(), params))
+        if "SHOW TRANSACTIONS" in query:
+            if self.show_fails:
+                raise RuntimeError("Invalid input 'SHOW'")
+            return pd.DataFrame({"transactionId": ["neo4j-transaction-7"]})
+        if "dbms.listQueries" in query:
+            return pd.DataFrame({"killedQueryId": ["query-7"]})
+        return pd.DataFrame()
+
+
+def test_clean_params_tags_algorithm_runs_with_the_job_id():
+    with tagged_job("job-1") as job_id:
+        params = clean_params({"graphName": "g", "dampingFactor": 0.8}, ["graphName"])
+    assert job_id == "job-1"
+    assert params == {"dampingFactor": 0.8, "jobId": "job-1"}
+    assert "jobId" not in clean_params({"graphName": "g"}, ["graphName"])
+    with tagged_job("job-1"):
+        assert clean_params({"dampingFactor": 0.8}, []) == {
+            "dampingFactor": 0.8,
+            "jobId": "job-1",
+        }
+        assert "jobId" not in clean_params({"modelName": "m"}, [], tag_job=False)
+
+
+class FakeRunningPageRank:
+    def __init__(self, gds):
+        self.gds = gds
+
+    def mutate(self, graph, **config):
+        # Keep the call "running" so SHOW TRANSACTIONS can see its $config
+        self.gds.running.append(config)
+        return pd.Series({"nodePropertiesWritten": 3})
+
+
+class FakeGraphRunner:
+    def get(self, graph_name):
+        return graph_name
+
+
+class FakeAlgorithmGds(FakeCypher):
+    def __init__(self):
+        super().__init__()
+        self.graph = FakeGraphRunner()
+        self.pageRank = FakeRunningPageRank(self)
+        self.running = []
+
+    def run_cypher(self, query, params=None):
+        self.queries.append((query.strip(), params))
+        if "SHOW TRANSACTIONS" in query:
+            ids = [
+                f"neo4j-transaction-{i}"
+                for i, config in enumerate(self.running)
+                if config.get("jobId") == params["job_id"]
+            ]
+            return pd.DataFrame({"transactionId": ids})
+        return pd.DataFrame()
+
+
+def test_cancelled_tool_call_finds_its_tagged_procedure():
+    gds = FakeAlgorithmGds()
+    with tagged_job("job-1"):
+        PageRankHandler(gds).execute(
+            {"graphName": "g", "mode": "mutate", "mutateProperty": "rank"}
+        )
+
+    assert gds.running[0]["jobId"] == "job-1"
+    assert terminate_job(gds, "job-2") == 0
+    assert terminate_job(gds, "job-1") == 1
+    assert gds.queries[-1] == (
+        "TERMINATE TRANSACTIONS $ids",
+        {"ids": ["neo4j-transaction-0"]},
+    )
+
+
+def test_terminate_job_terminates_matching_transactions():
+    gds = FakeCypher()
+
+    assert terminate_job(gds, "job-1") == 1
+    assert gds.queries[0][1] == {"job_id": "job-1"}
+    assert gds.queries[1] == (
+        "TERMINATE TRANSACTIONS $ids",
+        {"ids": ["neo4j-transaction-7"]},
+    )
+
+
+def test_terminate_job_falls_back_to_kill_query():
+    gds = FakeCypher(show_fails=True)
+
+    assert terminate_job(gds, "job-1") == 1
+    assert "dbms.killQuery" in gds.queries[-1][0]
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from mcp_server_neo4j_gds.job_store import Job, JobStore
+from mcp_server_neo4j_gds.result_limits import full_results, limit_dataframe_rows
+
+
+def finished_job(result=None):
+    job = Job("node_similarity", {"graphName": "g"})
+    job.start()
+    job.finish(result)
+    return job
+
+
+def test_job_lifecycle_is_described():
+    job = Job("all_pairs_shortest_paths", {"graphName": "g"})
+    assert job.describe()["status"] == "queued"
+
+    job.start()
+    assert job.describe()["status"] == "running"
+    assert not job.done
+
+    job.finish(pd.DataFrame({"distance": [1.0, 2.0, 3.0]}))
+    description = job.describe()
+    assert description["status"] == "finished"
+    assert description["rowCount"] == 3
+    assert "runningSeconds" in description
+
+    failed = Job("graph_sage_train", {})
+    failed.fail(ValueError("out of memory"))
+    assert failed.describe()["error"] == "out of memory"
+
+
+def test_full_store_evicts_finished_jobs_but_never_running_ones():
+    store = JobStore(max_size=2, ttl=3600)
+    first = store.add(finished_job())
+    running = store.add(Job("node_similarity", {}))
+    running.start()
+
+    third = store.add(Job("node_similarity", {}))
+    assert [job.job_id for job in store.jobs()] == [running.job_id, third.job_id]
+    with pytest.raises(ValueError, match="Unknown job"):
+        store.get(first.job_id)
+
+    with pytest.raises(ValueError, match="taken by running jobs"):
+        store.add(Job("node_similarity", {}))
+
+
+def test_finished_jobs_expire_after_the_ttl():
+    store = JobStore(max_size=4, ttl=0.000001)
+    job = store.add(finished_job())
+    pending = store.add(Job("node_similarity", {}))
+
+    assert store.jobs() == [pending]
+    with pytest.raises(ValueError, match="kept for"):
+        store.get(job.job_id)
+
+
+def test_full_results_keeps_every_row(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MAX_RESULT_ROWS", "2")
+    df = pd.DataFrame({"score": range(5)})
+
+    assert len(limit_dataframe_rows(df)) == 2
+    with full_results():
+        assert len(limit_dataframe_rows(df)) == 5
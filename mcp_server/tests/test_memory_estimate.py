@@ -0,0 +1,148 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from mcp_server_neo4j_gds.centrality_algorithm_handlers import PageRankHandler
+from mcp_server_neo4j_gds.memory_estimate import (
+    MemoryReservations,
+    memory_admission,
+    memory_reservations,
+)
+
+
+class FakeProcedure:
+    def __init__(self, bytes_max):
+        self.bytes_max = bytes_max
+        self.estimates = []
+        self.runs = []
+
+    def __call__(self, graph, **config):
+        self.runs.append(config)
+        return pd.Series({"nodePropertiesWritten": 3})
+
+    def estimate(self, graph, **config):
+        if self.bytes_max is None:
+            raise ValueError("Unknown configuration key")
+        self.estimates.append(config)
+        return pd.Series(
+            {
+                "requiredMemory": f"[{self.bytes_max} Bytes ... {self.bytes_max} Bytes]",
+                "bytesMin": self.bytes_max,
+                "bytesMax": self.bytes_max,
+            }
+        )
+
+
+class FakePageRank:
+    def __init__(self, bytes_max):
+        self.mutate = FakeProcedure(bytes_max)
+        self.stream = FakeProcedure(bytes_max)
+
+
+class FakeGraphRunner:
+    def get(self, graph_name):
+        return graph_name
+
+
+class FakeGds:
+    def __init__(self, bytes_max, free_heap):
+        self.graph = FakeGraphRunner()
+        self.pageRank = FakePageRank(bytes_max)
+        self.free_heap = free_heap
+
+    def run_cypher(self, query, params=None):
+        assert "gds.systemMonitor()" in query
+        return pd.DataFrame({"freeHeap": [self.free_heap]})
+
+
+def run_pagerank(gds, **arguments):
+    arguments = {"graphName": "g", "mode": "mutate", **arguments}
+    with memory_admission("pagerank") as admission:
+        PageRankHandler(gds).execute(arguments)
+        return admission, memory_reservations.reserved
+
+
+def test_memory_admission_estimates_the_handlers_gds_config(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MEMORY_CHECK", "refuse")
+    gds = FakeGds(bytes_max=100, free_heap=1000)
+
+    admission, reserved = run_pagerank(
+        gds, mutateProperty="rank", sourceNodes=[5, 9], dampingFactor=0.8
+    )
+
+    assert admission.report["bytesMax"] == 100
+    assert admission.report["freeHeap"] == 1000
+    assert reserved == 100
+    assert memory_reservations.reserved == 0
+    # The estimate sees the same config as the run, source nodes included
+    assert (
+        gds.pageRank.mutate.estimates
+        == gds.pageRank.mutate.runs
+        == [{"mutateProperty": "rank", "sourceNodes": [5, 9], "dampingFactor": 0.8}]
+    )
+
+
+def test_memory_admission_refuses_estimates_above_free_heap(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MEMORY_CHECK", "refuse")
+    gds = FakeGds(bytes_max=5000, free_heap=1000)
+
+    with pytest.raises(ValueError, match=r"Not enough memory to run 'pagerank"):
+        run_pagerank(gds, mutateProperty="rank")
+    assert gds.pageRank.mutate.runs == []
+
+
+def test_failed_estimate_is_reported_as_unavailable(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MEMORY_CHECK", "refuse")
+    gds = FakeGds(bytes_max=None, free_heap=1000)
+
+    admission, reserved = run_pagerank(gds, mutateProperty="rank")
+
+    assert "Unknown configuration key" in admission.report["unavailable"]
+    assert reserved == 0
+    assert len(gds.pageRank.mutate.runs) == 1
+
+
+def test_memory_admission_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("GDS_AGENT_MEMORY_CHECK", raising=False)
+    gds = FakeGds(bytes_max=5000, free_heap=1000)
+
+    admission, _ = run_pagerank(gds, mutateProperty="rank")
+    assert admission is None
+    assert gds.pageRank.mutate.estimates == []
+
+
+def test_concurrent_reservations_share_the_free_heap():
+    reservations = MemoryReservations()
+    estimate = {"requiredMemory": "60 Bytes", "bytesMax": 60}
+    reservations.reserve("pagerank", estimate, 100, "refuse", 1)
+
+    with pytest.raises(ValueError, match="only 40 bytes"):
+        reservations.reserve("louvain", estimate, 100, "refuse", 1)
+    assert reservations.reserved == 60
+
+
+def test_queued_reservation_waits_for_running_calls():
+    reservations = MemoryReservations()
+    first = {"requiredMemory": "600 Bytes", "bytesMax": 600}
+    second = {"requiredMemory": "600 Bytes", "bytesMax": 600}
+    reservations.reserve("pagerank", first, 1000, "queue", 1)
+
+    admitted = threading.Event()
+
+    def queued():
+        reservations.reserve("louvain", second, 1000, "queue", 5)
+        admitted.set()
+
+    worker = threading.Thread(target=queued)
+    worker.start()
+    assert not admitted.wait(0.05)
+
+    reservations.release(first)
+    worker.join(5)
+    assert admitted.is_set()
+    assert reservations.reserved == 600
+
+    # An estimate above the whole free heap is refused without waiting
+    with pytest.raises(ValueError, match="Not enough memory"):
+        reservations.reserve("louvain", second, 500, "queue", 5)
@@ -0,0 +1,51 @@
+import asyncio
+
+import pandas as pd
+
+from mcp_server_neo4j_gds.progress import job_progress, report_progress
+
+
+class FakeCypher:
+    def __init__(self, rows):
+        self.rows = rows
+        self.params = None
+
+    def run_cypher(self, query, params=None):
+        self.params = params
+        return self.rows
+
+
+def test_job_progress_reads_the_root_task():
+    gds = FakeCypher(
+        pd.DataFrame(
+            {
+                "taskName": ["Node2Vec", "  |-- RandomWalk"],
+                "progress": ["37.5%", "100%"],
+                "status": ["RUNNING", "FINISHED"],
+            }
+        )
+    )
+
+    assert job_progress(gds, "job-1") == (37.5, "Node2Vec: RUNNING")
+    assert gds.params == {"job_id": "job-1"}
+    assert job_progress(FakeCypher(pd.DataFrame()), "job-1") is None
+
+
+def test_report_progress_sends_only_increasing_progress():
+    polls = iter([None, (10.0, "a"), (10.0, "a"), (5.0, "b"), (60.0, "c")])
+    sent = []
+
+    def poll():
+        return next(polls)
+
+    async def send(percent, message):
+        sent.append((percent, message))
+
+    async def scenario():
+        reporter = asyncio.create_task(report_progress(send, poll, 0.001))
+        while len(sent) < 2:
+            await asyncio.sleep(0.005)
+        reporter.cancel()
+
+    asyncio.run(scenario())
+    assert sent == [(10.0, "a"), (60.0, "c")]
@@ -0,0 +1,132 @@
+import os
+from unittest.mock import Mock
+
+import mcp.types as types
+import pandas as pd
+import pytest
+
+from mcp_server_neo4j_gds import node_translator
+from mcp_server_neo4j_gds import server as server_module
+from mcp_server_neo4j_gds.result_cursors import (
+    CURSOR_ID_ATTR,
+    Cursor,
+    CursorStore,
+    cursor_store,
+    result_cursor,
+)
+from mcp_server_neo4j_gds.result_limits import (
+    dataframe_limit_warning,
+    limit_dataframe_rows,
+)
+
+
+@pytest.fixture(autouse=True)
+def small_row_limit(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MAX_RESULT_ROWS", "3")
+    yield
+    cursor_store.invalidate()
+
+
+def test_truncated_result_is_kept_as_cursor_only_when_requested():
+    df = pd.DataFrame({"nodeId": range(10), "score": range(10)})
+
+    assert CURSOR_ID_ATTR not in limit_dataframe_rows(df).attrs
+    with result_cursor():
+        limited = limit_dataframe_rows(df)
+
+    cursor_id = limited.attrs[CURSOR_ID_ATTR]
+    assert f"cursor '{cursor_id}'" in dataframe_limit_warning(limited)
+    rows, total_rows = cursor_store.page(cursor_id, 3, 3)
+    assert total_rows == 10
+    assert rows["nodeId"].tolist() == [3, 4, 5]
+
+
+def test_name_translation_is_replayed_on_every_page(monkeypatch):
+    monkeypatch.setattr(
+        node_translator,
+        "fetch_node_property",
+        lambda gds, node_ids, prop: {node_id: f"n{node_id}" for node_id in node_ids},
+    )
+    results = pd.DataFrame({"nodeId": range(10), "score": range(10)})
+
+    with result_cursor():
+        results = node_translator.translate_ids_to_identifiers(None, "name", results)
+
+    # The caller's frame holds the first page; the cursor keeps every row
+    assert results["nodeName"].tolist() == ["n0", "n1", "n2"]
+    rows, _ = cursor_store.page(results.attrs[CURSOR_ID_ATTR], 8, 3)
+    assert rows["nodeName"].tolist() == ["n8", "n9"]
+
+
+def test_cursors_are_spilled_and_evicted_least_recently_read_first(tmp_path):
+    frame = pd.DataFrame({"score": [0.0] * 100})
+    size = Cursor.spill(frame, str(tmp_path)).nbytes
+    store = CursorStore(max_bytes=2 * size, ttl=3600, directory=str(tmp_path))
+
+    first = store.open(frame)
+    second = store.open(frame)
+    store.get(first.cursor_id)
+    store.open(frame)
+
+    store.get(first.cursor_id)
+    with pytest.raises(ValueError, match="Unknown or expired cursor"):
+        store.get(second.cursor_id)
+    assert not os.path.exists(second.path)
+    assert store.open(pd.DataFrame({"score": [0.0] * 1000})) is None
+
+
+def test_idle_cursors_expire(tmp_path):
+    store = CursorStore(max_bytes=10**9, ttl=0.000001, directory=str(tmp_path))
+    cursor = store.open(pd.DataFrame({"score": [1.0]}))
+
+    with pytest.raises(ValueError, match="kept for"):
+        store.page(cursor.cursor_id, 0, 1)
+
+
+def test_pages_can_be_filtered_and_grouped(tmp_path):
+    store = CursorStore(max_bytes=10**9, ttl=3600, directory=str(tmp_path))
+    cursor = store.open(
+        pd.DataFrame(
+            {
+                "nodeId": range(6),
+                "communityId": [7, 7, 7, 8, 8, 9],
+                "score": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            }
+        )
+    )
+
+    rows, total = store.page(
+        cursor.cursor_id, 0, 10, where={"column": "score", "min": 0.25, "max": 0.5}
+    )
+    assert (rows["nodeId"].tolist(), total) == ([2, 3, 4], 3)
+
+    groups, total = store.page(cursor.cursor_id, 0, 2, group_by="communityId")
+    assert total == 3
+    assert groups["communityId"].tolist() == [7, 8]
+    assert groups["rows"].tolist() == [3, 2]
+    assert groups["score_max"].tolist() == [0.3, 0.5]
+
+    with pytest.raises(ValueError, match="Available columns"):
+        store.page(cursor.cursor_id, 0, 1, where={"column": "name", "equals": "x"})
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_tool_reads_the_cursor_it_is_called_with(monkeypatch):
+    base_gds = Mock()
+    base_gds.run_cypher.side_effect = Exception("no session procedures")
+    monkeypatch.setattr(server_module, "create_base_gds", lambda *args: base_gds)
+    server, *_ = server_module.create_mcp_server("bolt://example", "neo4j", "pw")
+    cursor = cursor_store.open(pd.DataFrame({"nodeId": range(10)}))
+
+    response = await server.request_handlers[types.CallToolRequest](
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="fetch_page",
+                arguments={"cursor": cursor.cursor_id, "offset": 3, "size": 2},
+            ),
+        )
+    )
+
+    text = response.root.content[0].text
+    assert text.startswith("Rows 4-5 of 10"), text
@@ -1,33 +1,182 @@
+import warnings
+
+import numpy as np
 import pandas as pd
+import pytest
+
+from mcp_server_neo4j_gds.centrality_algorithm_handlers import (
+    DegreeCentralityHandler,
+    PageRankHandler,
+)
+from mcp_server_neo4j_gds.node_cache import NodePropertyCache, node_property_cache
+from mcp_server_neo4j_gds.node_translator import (
+    NodeNamePipeline,
+    filter_identifiers,
+    resolve_node_names,
+    translate_ids_to_identifiers,
+)
+from mcp_server_neo4j_gds.path_algorithm_handlers import (
+    BreadthFirstSearchHandler,
+    DijkstraSingleSourceShortestPathHandler,
+    MinimumDirectedSteinerTreeHandler,
+    _as_node_pairs,
+)
+from mcp_server_neo4j_gds.result_limits import (
+    SOURCE_ROW_COUNT_ATTR,
+    limit_dataframe_rows,
+    result_ordering,
+)
+from mcp_server_neo4j_gds.schema_cache import schema_cache
+
+
+def lookup_rows(*rows):
+    return pd.DataFrame(list(rows), columns=["name", "node_id", "matched_name"])
 
-from mcp_server_neo4j_gds.centrality_algorithm_handlers import DegreeCentralityHandler
-from mcp_server_neo4j_gds.node_translator import translate_ids_to_identifiers
-from mcp_server_neo4j_gds.path_algorithm_handlers import _as_node_pairs
-from mcp_server_neo4j_gds.result_limits import SOURCE_ROW_COUNT_ATTR
 
+class FakeCypher:
+    """Answers SHOW INDEXES from ``indexes``, node property and projection
+    fetches with ``node-<id>`` values and every other query with ``rows``."""
 
-class FakeUtil:
-    def __init__(self):
-        self.calls = []
+    def __init__(self, rows=None, indexes=()):
+        self.rows = rows if rows is not None else lookup_rows()
+        self.indexes = pd.DataFrame(
+            list(indexes), columns=["name", "type", "labelsOrTypes", "properties"]
+        )
+        self.queries = []
+        self.fetches = []
 
-    def asNodes(self, node_ids):
-        self.calls.append(node_ids)
-        return [{"name": f"node-{node_id}"} for node_id in node_ids]
+    def run_cypher(self, query, params=None):
+        if "SHOW INDEXES" in query:
+            return self.indexes
+        if "UNWIND $ids" in query:
+            self.fetches.append(params["ids"])
+            if "labels(n)" in query:
+                return pd.DataFrame(
+                    {
+                        "node_id": params["ids"],
+                        "labels": [["Node"] for _ in params["ids"]],
+                        "properties": [
+                            {"name": f"node-{node_id}"} for node_id in params["ids"]
+                        ],
+                    }
+                )
+            return pd.DataFrame(
+                {
+                    "node_id": params["ids"],
+                    "value": [f"node-{node_id}" for node_id in params["ids"]],
+                }
+            )
+        self.queries.append((query, params))
+        return self.rows
+
+
+@pytest.fixture(autouse=True)
+def empty_node_property_cache():
+    node_property_cache.invalidate()
+    yield
+    node_property_cache.invalidate()
 
 
 def test_translate_ids_to_identifiers_limits_before_lookup(monkeypatch):
     monkeypatch.setenv("GDS_AGENT_MAX_RESULT_ROWS", "2")
 
-    class FakeGds:
-        util = FakeUtil()
-
+    gds = FakeCypher()
     result = pd.DataFrame({"nodeId": [1, 2, 3]})
 
-    translate_ids_to_identifiers(FakeGds, "name", result)
+    named = translate_ids_to_identifiers(gds, "name", result)
+
+    assert gds.fetches == [[1, 2]]
+    assert named["nodeName"].tolist() == ["node-1", "node-2"]
+    assert named.attrs[SOURCE_ROW_COUNT_ATTR] == 3
+    # The caller's frame is left as it was
+    assert result.columns.tolist() == ["nodeId"]
+    assert len(result) == 3
+
+
+def test_node_name_pipeline_names_all_id_columns_with_one_lookup(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MAX_RESULT_ROWS", "2")
+
+    gds = FakeCypher()
+    result = pd.DataFrame(
+        {"node1": [1, 2, 3], "node2": [2, 4, 1], "similarity": [0.9, 0.8, 0.7]}
+    )
+
+    named = NodeNamePipeline(
+        gds, "name", [("node1", "node1Name"), ("node2", "node2Name")]
+    ).apply(result)
+
+    assert gds.fetches == [[1, 2, 4]]
+    assert named["node1Name"].tolist() == ["node-1", "node-2"]
+    assert named["node2Name"].tolist() == ["node-2", "node-4"]
+
+
+def test_node_name_pipeline_leaves_the_callers_rows_unchanged():
+    gds = FakeCypher()
+    result = pd.DataFrame({"nodeId": [1, 2], "score": [0.1, 0.3]})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        named = translate_ids_to_identifiers(gds, "name", result[result["score"] > 0])
+        translate_ids_to_identifiers(gds, "name", result)
+
+    assert named["nodeName"].tolist() == ["node-1", "node-2"]
+    assert list(result.columns) == ["nodeId", "score"]
+
+
+def test_result_ordering_selects_top_rows_before_lookup():
+    gds = FakeCypher()
+    result = pd.DataFrame({"nodeId": [1, 2, 3], "score": [0.1, 0.3, 0.2]})
+
+    with result_ordering(limit=2):
+        result = translate_ids_to_identifiers(gds, "name", result)
+
+    assert gds.fetches == [[2, 3]]
+    assert result["nodeId"].tolist() == [2, 3]
+    assert result["nodeName"].tolist() == ["node-2", "node-3"]
+    assert SOURCE_ROW_COUNT_ATTR not in result.attrs
+
+
+def test_plugin_streams_push_the_top_rows_into_cypher():
+    class FakeGraph:
+        def name(self):
+            return "g"
+
+    class FakeGraphRunner:
+        def get(self, graph_name):
+            return FakeGraph()
+
+    class FakePageRank:
+        def stream(self, graph, **kwargs):
+            return pd.DataFrame({"nodeId": [1, 2, 3], "score": [0.1, 0.3, 0.2]})
+
+    class FakeGds(FakeCypher):
+        graph = FakeGraphRunner()
+        pageRank = FakePageRank()
+
+    gds = FakeGds(pd.DataFrame({"nodeId": [2, 3], "score": [0.3, 0.2]}))
+    with result_ordering(limit=2):
+        result = PageRankHandler(gds).execute({"graphName": "g", "dampingFactor": 0.8})
+
+    query, params = gds.queries[0]
+    assert "CALL gds.pageRank.stream($graph_name, $config) YIELD nodeId, score" in query
+    assert "ORDER BY score DESC LIMIT $limit" in query
+    assert params == {"graph_name": "g", "config": {"dampingFactor": 0.8}, "limit": 2}
+    assert result["nodeId"].tolist() == [2, 3]
+
+    # A node filter needs the whole stream
+    gds = FakeGds(lookup_rows(("a", 1, "a")))
+    with result_ordering(limit=1):
+        result = PageRankHandler(gds).execute(
+            {"graphName": "g", "nodes": ["a"], "nodeIdentifierProperty": "name"}
+        )
+    assert all("gds.pageRank.stream" not in query for query, _ in gds.queries)
+    assert result["nodeId"].tolist() == [1]
+
 
-    assert FakeGds.util.calls == [[1, 2]]
-    assert result["nodeName"].tolist() == ["node-1", "node-2"]
-    assert result.attrs[SOURCE_ROW_COUNT_ATTR] == 3
+def test_result_ordering_rejects_unknown_columns():
+    with result_ordering(order_by="rank", ascending=True):
+        with pytest.raises(ValueError, match="Cannot order results by 'rank'"):
+            limit_dataframe_rows(pd.DataFrame({"nodeId": [1]}))
 
 
 def test_degree_centrality_filters_before_lookup():
@@ -39,16 +188,12 @@ def test_degree_centrality_filters_before_lookup():
         def stream(self, graph, **kwargs):
             return pd.DataFrame({"nodeId": [1, 2, 3], "score": [0.1, 0.2, 0.3]})
 
-    class FakeGds:
+    class FakeGds(FakeCypher):
         graph = FakeGraphRunner()
         degree = FakeDegreeRunner()
-        util = FakeUtil()
 
-        def run_cypher(self, query, params):
-            assert params == {"names": ["target"]}
-            return pd.DataFrame({"node_id": [3]})
-
-    result = DegreeCentralityHandler(FakeGds()).execute(
+    gds = FakeGds(lookup_rows(("target", 3, "Target")))
+    result = DegreeCentralityHandler(gds).execute(
         {
             "graphName": "g",
             "nodeIdentifierProperty": "name",
@@ -56,19 +201,306 @@ def test_degree_centrality_filters_before_lookup():
         }
     )
 
-    assert FakeGds.util.calls == [[3]]
+    assert [params for _, params in gds.queries] == [{"names": ["target"]}]
+    assert gds.fetches == [[3]]
     assert result["nodeId"].tolist() == [3]
     assert result["nodeName"].tolist() == ["node-3"]
 
 
+def test_translate_ids_to_identifiers_fetches_only_uncached_ids():
+    gds = FakeCypher()
+
+    translate_ids_to_identifiers(gds, "name", pd.DataFrame({"nodeId": [1, 2]}))
+    result = translate_ids_to_identifiers(
+        gds, "name", pd.DataFrame({"nodeId": [2, 3, 1]})
+    )
+
+    assert gds.fetches == [[1, 2], [3]]
+    assert result["nodeName"].tolist() == ["node-2", "node-3", "node-1"]
+
+    node_property_cache.invalidate()
+    translate_ids_to_identifiers(gds, "name", pd.DataFrame({"nodeId": [1]}))
+
+    assert gds.fetches[-1] == [1]
+
+
+def test_node_property_cache_evicts_least_recently_used_entries():
+    cache = NodePropertyCache(max_size=2)
+    cache.put_many("neo4j", "name", {1: "a", 2: "b"})
+    cache.get_many("neo4j", "name", [1])
+    cache.put_many("neo4j", "name", {3: "c"})
+
+    found, missing = cache.get_many("neo4j", "name", [1, 2, 3])
+
+    assert found == {1: "a", 3: "c"}
+    assert missing == [2]
+    assert cache.stats() == {
+        "size": 2,
+        "maxSize": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_node_property_cache_logs_its_counters_on_invalidation(caplog):
+    cache = NodePropertyCache(max_size=2)
+    cache.put_many("neo4j", "name", {1: "a"})
+    cache.get_many("neo4j", "name", [1, 2])
+
+    with caplog.at_level("INFO", logger="mcp_server_neo4j_gds"):
+        cache.invalidate("neo4j")
+
+    assert "1 hits, 1 misses (50% hit rate), 0 evictions" in caplog.text
+
+
 def test_path_node_pairs_use_single_batch_lookup():
-    class FakeGds:
-        util = FakeUtil()
+    gds = FakeCypher()
+
+    result = _as_node_pairs(gds, [(1, 2), (3, 4)], "name")
+
+    assert gds.fetches == [[1, 2, 3, 4]]
+    assert result == [("node-1", "node-2"), ("node-3", "node-4")]
+
+
+def test_path_node_pairs_without_identifier_fetch_projection(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_NODE_PROJECTION", "name")
+    gds = FakeCypher()
+
+    result = _as_node_pairs(gds, [(1, 2), (2, 1)])
+
+    assert gds.fetches == [[1, 2]]
+    assert result[0] == (
+        {"labels": ["Node"], "name": "node-1"},
+        {"labels": ["Node"], "name": "node-2"},
+    )
+
+
+def test_resolve_node_names_uses_single_lookup_and_reports_unmatched():
+    gds = FakeCypher(
+        lookup_rows(
+            ("bayswater", 16, "Bayswater"),
+            ("Paddington", 203, "Paddington Station"),
+            ("Paddington", 167, "Paddington"),
+        )
+    )
+    resolution = resolve_node_names(
+        gds, ["bayswater", "Paddington", "Nowhere", "bayswater"], "name"
+    )
+
+    assert [params for _, params in gds.queries] == [
+        {"names": ["bayswater", "Paddington", "Nowhere"]}
+    ]
+    assert resolution.node_id("bayswater") == 16
+    assert resolution.node_id("Paddington") == 167
+    assert resolution.matched_name("Paddington") == "Paddington"
+    assert resolution.node_ids == [16, 167, 16]
+    assert resolution.unmatched_names == ["Nowhere"]
+    assert resolution.plan == "label-less node scan"
+
+
+def test_resolve_node_names_prefers_index_seek_over_scan():
+    gds = FakeCypher(
+        lookup_rows(("Bayswater", 16, "Bayswater")),
+        indexes=[
+            ("station_name", "RANGE", ["Station"], ["name"]),
+            ("station_zone", "RANGE", ["Station"], ["zone"]),
+        ],
+    )
+    resolution = resolve_node_names(gds, ["Bayswater"], "name")
+
+    assert len(gds.queries) == 1
+    assert "MATCH (n:`Station`) WHERE n.name = name" in gds.queries[0][0]
+    assert resolution.node_id("Bayswater") == 16
+    assert resolution.plan == "index seek on :Station(name)"
+
+
+def test_resolve_node_names_falls_back_for_names_missed_by_indexes():
+    gds = FakeCypher(
+        indexes=[("names", "FULLTEXT", ["Station", "Line"], ["name", "alias"])]
+    )
+    resolution = resolve_node_names(
+        gds, ['Earl"s Court'], "name", substring_fallback=False
+    )
+
+    fulltext_params = gds.queries[0][1]
+    assert fulltext_params["index_name"] == "names"
+    assert fulltext_params["lookups"] == [
+        {"name": 'Earl"s Court', "query": 'name:"Earl\\"s Court"'}
+    ]
+    assert "value = needle" in gds.queries[1][0]
+    assert resolution.unmatched_names == ['Earl"s Court']
+    assert resolution.plan == "full-text index 'names' -> label-less node scan"
+
+
+def test_full_text_hits_without_an_exact_match_still_reach_the_scan():
+    class FullTextThenScan(FakeCypher):
+        def run_cypher(self, query, params=None):
+            rows = super().run_cypher(query, params)
+            if "SHOW INDEXES" in query:
+                return rows
+            if "fulltext" in query:
+                return lookup_rows(("Court", 9, "Earls Court"))
+            return lookup_rows(("Court", 4, "court"))
+
+    gds = FullTextThenScan(indexes=[("names", "FULLTEXT", ["Station"], ["name"])])
+    resolution = resolve_node_names(gds, ["Court"], "name")
+
+    assert gds.queries[0][1]["limit"] > 0
+    assert "LIMIT $limit" in gds.queries[0][0]
+    assert resolution.node_id("Court") == 4
+    assert resolution.plan == "full-text index 'names' -> label-less node scan"
+
+
+class SeekThenScan(FakeCypher):
+    """Same name on an indexed :Station and, differently cased, an unindexed :Line."""
+
+    node_labels = [["Station"], ["Line"]]
+
+    def run_cypher(self, query, params=None):
+        rows = super().run_cypher(query, params)
+        if "SHOW INDEXES" in query:
+            return rows
+        if "nodeTypeProperties" in query:
+            return pd.DataFrame(
+                {"nodeLabels": self.node_labels, "propertyName": ["name"] * 2}
+            )
+        if "relTypeProperties" in query:
+            return pd.DataFrame(columns=["relType", "propertyName"])
+        if "MATCH (n:`Station`)" in query or "fulltext" in query:
+            return lookup_rows(("Bayswater", 16, "Bayswater"))
+        return lookup_rows(
+            ("Bayswater", 16, "Bayswater"), ("Bayswater", 40, "BAYSWATER")
+        )
+
+
+def test_all_match_lookups_scan_beyond_partial_indexes():
+    gds = SeekThenScan(indexes=[("station_name", "RANGE", ["Station"], ["name"])])
+    results = pd.DataFrame({"nodeId": [16, 40, 7], "score": [0.3, 0.2, 0.1]})
+
+    filtered = filter_identifiers(gds, "name", ["Bayswater"], results)
+
+    assert filtered["nodeId"].tolist() == [16, 40]
+    # Callers that need one node stop at the exact index hit
+    resolution = resolve_node_names(gds, ["Bayswater"], "name")
+    assert resolution.plan == "index seek on :Station(name)"
+
+
+def test_full_text_index_covering_every_label_ends_all_match_lookups():
+    gds = SeekThenScan(indexes=[("names", "FULLTEXT", ["Station", "Line"], ["name"])])
+    resolution = resolve_node_names(gds, ["Bayswater"], "name", all_matches=True)
+    assert resolution.plan == "full-text index 'names'"
+
+    gds = SeekThenScan(indexes=[("names", "FULLTEXT", ["Station"], ["name"])])
+    resolution = resolve_node_names(gds, ["Bayswater"], "name", all_matches=True)
+    assert resolution.all_node_ids == [16, 40]
+    assert resolution.plan == "full-text index 'names' -> label-less node scan"
+
+
+def test_index_catalog_follows_the_schema_cache():
+    gds = FakeCypher()
+    indexed = FakeCypher(indexes=[("station_name", "RANGE", ["Station"], ["name"])])
+    resolve_node_names(gds, ["Bayswater"], "name")
+    gds.indexes = indexed.indexes
+
+    resolve_node_names(gds, ["Bayswater"], "name")
+    assert "MATCH (n)" in gds.queries[-1][0]
+
+    schema_cache.invalidate()
+    resolve_node_names(gds, ["Bayswater"], "name")
+    # Nothing matches in the fake: the seek runs, then the scan
+    assert "MATCH (n:`Station`)" in gds.queries[-2][0]
+
+
+def test_steiner_tree_resolves_all_targets_in_one_query():
+    gds = FakeCypher(
+        lookup_rows(
+            ("Green Park", 1, "Green Park"),
+            ("Knightsbridge", 2, "Knightsbridge"),
+        )
+    )
+    result = MinimumDirectedSteinerTreeHandler(gds).execute(
+        {
+            "graphName": "g",
+            "sourceNode": "Green Park",
+            "targetNodes": ["Knightsbridge", "Atlantis"],
+            "nodeIdentifierProperty": "name",
+        }
+    )
+
+    assert len(gds.queries) == 1
+    assert result == {
+        "found": False,
+        "message": "The following target nodes were not found: Atlantis",
+    }
+
+
+def test_single_source_paths_resolve_all_nodes_in_one_batch():
+    class FakeGraphRunner:
+        def get(self, graph_name):
+            return graph_name
+
+    class FakeDijkstraRunner:
+        def stream(self, graph, **kwargs):
+            return pd.DataFrame(
+                {
+                    "targetNode": [1, 3],
+                    "totalCost": [0.0, 2.0],
+                    "nodeIds": [np.array([1]), np.array([1, 2, 3])],
+                    "costs": [np.array([0.0]), np.array([0.0, 1.0, 2.0])],
+                    "path": [None, None],
+                }
+            )
+
+    class FakeAllShortestPaths:
+        dijkstra = FakeDijkstraRunner()
+
+    class FakeGds(FakeCypher):
+        graph = FakeGraphRunner()
+        allShortestPaths = FakeAllShortestPaths()
+
+    gds = FakeGds(lookup_rows(("Source", 1, "Source")))
+    result = DijkstraSingleSourceShortestPathHandler(gds).execute(
+        {"graphName": "g", "sourceNode": "Source", "nodeIdentifierProperty": "name"}
+    )
+
+    assert gds.fetches == [[1, 2, 3]]
+    assert result["sourceNodeName"] == "Source"
+    assert result["results"][1] == {
+        "targetNode": 3,
+        "targetNodeName": "node-3",
+        "totalCost": 2.0,
+        "nodeIds": [1, 2, 3],
+        "nodeNames": ["node-1", "node-2", "node-3"],
+        "costs": [0.0, 1.0, 2.0],
+        "path": None,
+    }
+    assert type(result["results"][1]["nodeIds"][0]) is int
+
+
+def test_traversal_with_equal_length_paths_keeps_lists_per_row():
+    class FakeGraphRunner:
+        def get(self, graph_name):
+            return graph_name
+
+    class FakeBfsRunner:
+        def stream(self, graph, **kwargs):
+            return pd.DataFrame({"sourceNode": [1], "nodeIds": [[1, 2]]})
+
+    class FakeGds(FakeCypher):
+        graph = FakeGraphRunner()
+        bfs = FakeBfsRunner()
 
-    result = _as_node_pairs(FakeGds, [(1, 2), (3, 4)])
+    gds = FakeGds(lookup_rows(("Source", 1, "Source")))
+    result = BreadthFirstSearchHandler(gds).execute(
+        {"graphName": "g", "sourceNode": "Source", "nodeIdentifierProperty": "name"}
+    )
 
-    assert FakeGds.util.calls == [[1, 2, 3, 4]]
-    assert result == [
-        ({"name": "node-1"}, {"name": "node-2"}),
-        ({"name": "node-3"}, {"name": "node-4"}),
+    assert result["traversals"] == [
+        {
+            "sourceNode": 1,
+            "nodeIds": [1, 2],
+            "nodeNames": ["node-1", "node-2"],
+            "visitedNodes": 2,
+        }
     ]
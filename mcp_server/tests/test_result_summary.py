@@ -0,0 +1,88 @@
+import pandas as pd
+
+from mcp_server_neo4j_gds.community_algorithm_handlers import (
+    WeaklyConnectedComponentsHandler,
+)
+from mcp_server_neo4j_gds.result_summary import _local_size_histogram
+
+
+class FakeGraph:
+    def name(self):
+        return "g"
+
+
+class FakeGraphRunner:
+    def get(self, graph_name):
+        return FakeGraph()
+
+
+class FakeWccRunner:
+    def stats(self, graph, **kwargs):
+        raise AssertionError("summary mode must run the algorithm only once")
+
+    def stream(self, graph, **kwargs):
+        raise AssertionError("summary mode must not stream per-node rows")
+
+
+class FakeGds:
+    graph = FakeGraphRunner()
+
+    def __init__(self):
+        self.wcc = FakeWccRunner()
+        self.queries = []
+
+    def run_cypher(self, query, params=None):
+        self.queries.append((query, params))
+        return pd.DataFrame(
+            {
+                "bucket": [2, 0],
+                "communities": [1, 2],
+                "largest": [
+                    [{"communityId": 7, "size": 5}],
+                    [{"communityId": 1, "size": 1}, {"communityId": 2, "size": 1}],
+                ],
+                "nodes": [5, 2],
+                "minSize": [5, 1],
+                "maxSize": [5, 1],
+            }
+        )
+
+
+def test_wcc_summary_groups_sizes_in_database():
+    gds = FakeGds()
+
+    result = WeaklyConnectedComponentsHandler(gds).execute(
+        {"graphName": "g", "mode": "summary", "minComponentSize": 1}
+    )
+
+    [(query, params)] = gds.queries
+    assert "gds.wcc.stream($graph_name, $config) YIELD componentId" in query
+    assert params["config"] == {"minComponentSize": 1}
+    assert result == {
+        "componentCount": 3,
+        "nodeCount": 7,
+        "componentDistribution": {"min": 1, "max": 5, "mean": 7 / 3},
+        "sizeHistogram": [
+            {"minSize": 1, "maxSize": 1, "communities": 2},
+            {"minSize": 4, "maxSize": 7, "communities": 1},
+        ],
+        "largestCommunities": [
+            {"communityId": 7, "size": 5},
+            {"communityId": 1, "size": 1},
+            {"communityId": 2, "size": 1},
+        ],
+    }
+
+
+def test_local_size_histogram_buckets_powers_of_two_exactly():
+    sizes = pd.Series([1, 2, 3, 4, 8, 8], index=[10, 11, 12, 13, 14, 15])
+
+    histogram, largest = _local_size_histogram(sizes, 2)
+
+    assert histogram == [
+        {"minSize": 1, "maxSize": 1, "communities": 1},
+        {"minSize": 2, "maxSize": 3, "communities": 2},
+        {"minSize": 4, "maxSize": 7, "communities": 1},
+        {"minSize": 8, "maxSize": 15, "communities": 2},
+    ]
+    assert largest == [{"communityId": 14, "size": 8}, {"communityId": 15, "size": 8}]
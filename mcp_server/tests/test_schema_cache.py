@@ -0,0 +1,149 @@
+import asyncio
+
+import pandas as pd
+
+from mcp_server_neo4j_gds.gds import (
+    get_node_labels,
+    get_node_properties_keys,
+    get_projectable_properties,
+    get_schema_tool_result_async,
+)
+from mcp_server_neo4j_gds.schema_cache import GraphSchema, SchemaCache, schema_cache
+
+
+def node_type_rows(*rows):
+    return pd.DataFrame(
+        list(rows), columns=["nodeLabels", "propertyName", "propertyTypes"]
+    )
+
+
+def rel_type_rows(*rows):
+    return pd.DataFrame(
+        list(rows),
+        columns=[
+            "relType",
+            "sourceNodeLabels",
+            "targetNodeLabels",
+            "propertyName",
+            "propertyTypes",
+        ],
+    )
+
+
+NODE_TYPES = node_type_rows(
+    (["Foo"], "propInt", ["Long"]),
+    (["Foo"], "propIntDouble", ["Long", "Double"]),
+    (["Foo"], "propListInt", ["LongArray"]),
+    (["Foo"], "propListDoubleListInt", ["DoubleArray", "LongArray"]),
+    (["Foo"], "propListDoubleButInvalid", ["DoubleArray", "Long"]),
+    (["Foo"], "propString", ["String"]),
+    (["Bar", "SpareBar"], None, None),
+    (["Ignored"], "prop2", ["LongArray"]),
+)
+
+REL_TYPES = rel_type_rows(
+    (":`REL1`", ["Foo"], ["Foo"], "relprop1", ["Double"]),
+    (":`REL2`", ["Foo"], ["Bar"], "relprop1", ["Double"]),
+    (":`REL3`", ["Bar"], ["Ignored"], "relprop2", ["Double"]),
+    (":`REL3`", ["Bar"], ["Ignored"], "name", ["String"]),
+)
+
+
+class FakeSchemaGds:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.queries = []
+
+    def run_cypher(self, query, params=None):
+        self.queries.append(query)
+        if self.fail and "db.schema" in query:
+            raise RuntimeError("procedure not available")
+        if "nodeTypeProperties" in query:
+            return NODE_TYPES
+        if "relTypeProperties" in query:
+            return REL_TYPES
+        if "db.labels()" in query:
+            return pd.DataFrame({"label": ["Bar", "Foo"]})
+        if "COLLECT(label)" in query:
+            return pd.DataFrame({"labels": [["Foo", "Bar"]]})
+        return pd.DataFrame({"properties_keys": [[]]})
+
+
+def test_graph_schema_types_properties_like_value_validation():
+    schema = GraphSchema(NODE_TYPES, REL_TYPES)
+
+    assert schema.projectable_node_properties(["Foo", "Bar"]) == {
+        "propInt": "INTEGER",
+        "propIntDouble": "FLOAT",
+        "propListInt": "INTEGER_LIST",
+        "propListDoubleListInt": "FLOAT_LIST",
+    }
+    assert schema.projectable_relationship_properties(
+        ["REL1", "REL2"], ["Foo", "Bar"]
+    ) == {"relprop1": "toFloat(r.relprop1)"}
+    assert schema.projectable_relationship_properties(node_labels=["Foo"]) == {
+        "relprop1": "toFloat(r.relprop1)"
+    }
+    assert schema.node_labels() == ["Foo", "Bar", "SpareBar", "Ignored"]
+    assert schema.relationship_types() == ["REL1", "REL2", "REL3"]
+
+
+def test_schema_cache_loads_once_per_database_until_refresh():
+    cache = SchemaCache(ttl=60)
+    gds = FakeSchemaGds()
+
+    cache.get(gds)
+    cache.get(gds)
+    assert len(gds.queries) == 2
+
+    cache.get(gds, refresh=True)
+    assert len(gds.queries) == 4
+
+
+def test_projectable_properties_fall_back_to_scans_without_schema_procedures():
+    schema_cache.invalidate()
+    gds = FakeSchemaGds(fail=True)
+
+    assert get_projectable_properties(gds, ["Foo"], []) == ({}, {})
+    assert any("keys(properties(n))" in query for query in gds.queries)
+
+
+def test_schema_tools_read_the_catalog_once_and_scan_only_when_exact():
+    schema_cache.invalidate()
+    gds = FakeSchemaGds()
+
+    assert get_node_labels(gds) == ["Bar", "Foo"]
+    assert get_node_labels(gds) == ["Bar", "Foo"]
+    assert get_node_properties_keys(gds, ["Bar"]) == []
+    assert get_node_properties_keys(gds, ["Foo"])[:2] == ["propInt", "propIntDouble"]
+    assert len(gds.queries) == 3
+
+    assert get_node_labels(gds, exact=True) == ["Bar", "Foo"]
+    assert "MATCH (n)" in gds.queries[-1]
+
+
+class FakeAsyncCypher:
+    def __init__(self, gds):
+        self.gds = gds
+
+    async def run_cypher(self, query, params=None):
+        return self.gds.run_cypher(query, params)
+
+
+def test_async_schema_tools_share_the_cache_with_sync_callers():
+    schema_cache.invalidate()
+    gds = FakeSchemaGds()
+    cypher = FakeAsyncCypher(FakeSchemaGds())
+
+    async def scenario():
+        labels = await get_schema_tool_result_async(gds, cypher, "get_node_labels")
+        keys = await get_schema_tool_result_async(
+            gds, cypher, "get_relationship_properties_keys"
+        )
+        return labels, keys
+
+    assert asyncio.run(scenario()) == (["Bar", "Foo"], ["name", "relprop1", "relprop2"])
+    assert len(cypher.gds.queries) == 3
+    # Entries are keyed by the sync connection, so its callers hit the cache
+    assert get_node_labels(gds) == ["Bar", "Foo"]
+    assert gds.queries == []
@@ -1,3 +1,7 @@
+import json
+from unittest.mock import Mock
+
+import mcp.types as types
 import pytest
 
 from mcp_server_neo4j_gds import env_value
@@ -21,3 +25,26 @@ def test_empty_aura_credentials_rejected(monkeypatch):
 
     with pytest.raises(ValueError, match="Missing Aura API credentials"):
         SessionManager()._ensure_sessions_client()
+
+
+@pytest.mark.asyncio
+async def test_server_status_reports_the_tool_queue(monkeypatch):
+    base_gds = Mock()
+    base_gds.run_cypher.side_effect = Exception("no session procedures")
+    monkeypatch.setattr(server_module, "create_base_gds", lambda *args: base_gds)
+    server, *_, tool_executor = server_module.create_mcp_server(
+        "bolt://example", "neo4j", "pw"
+    )
+
+    response = await server.request_handlers[types.CallToolRequest](
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="server_status", arguments={}),
+        )
+    )
+
+    status = json.loads(response.root.content[0].text)
+    assert status["toolExecutor"] == tool_executor.stats()
+    assert status["toolExecutor"]["queued"] == 0
+    assert "hits" in status["nodeCache"]
+    tool_executor.shutdown()
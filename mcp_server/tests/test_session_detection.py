@@ -1,9 +1,15 @@
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
+import pandas as pd
 import pytest
+from neo4j.exceptions import ServiceUnavailable
 from src.mcp_server_neo4j_gds import server as server_module
 from src.mcp_server_neo4j_gds import session_manager as session_manager_module
 from src.mcp_server_neo4j_gds.session_manager import (
     SessionManager,
+    SessionStatusCache,
     GdsMode,
     ensure_mcp_session_name,
 )
@@ -252,6 +258,46 @@ def test_session_for_graph_scans_sessions_for_unmapped_graphs():
     assert manager.graph_sessions["unmapped"] == "mcp_analytics"
 
 
+def test_fan_out_queries_sessions_concurrently_and_skips_slow_ones():
+    release = threading.Event()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def call(gds):
+        if gds == "slow":
+            release.wait(5)
+        elif gds == "broken":
+            raise RuntimeError("boom")
+        else:
+            # Both fast sessions must be running at the same time
+            barrier.wait()
+        return gds
+
+    manager = SessionManager()
+    sessions = [
+        ("a", "fast-a"),
+        ("slow", "slow"),
+        ("broken", "broken"),
+        ("b", "fast-b"),
+    ]
+    try:
+        results = manager.fan_out(call, sessions, timeout=0.5)
+    finally:
+        release.set()
+
+    assert results == {"a": "fast-a", "b": "fast-b"}
+
+
+def test_rebuild_graph_mapping_lists_every_session():
+    manager = SessionManager()
+    for name, graphs in [("mcp_a", ["g1", "g2"]), ("mcp_b", ["g3"])]:
+        session_gds = Mock()
+        session_gds.graph.list.return_value = pd.DataFrame({"graphName": graphs})
+        manager._sessions[name] = session_gds
+
+    assert manager.rebuild_graph_mapping() == 3
+    assert manager.graph_sessions == {"g1": "mcp_a", "g2": "mcp_a", "g3": "mcp_b"}
+
+
 def test_session_for_graph_returns_none_when_graph_not_found():
     manager = SessionManager()
     session_gds = Mock()
@@ -288,6 +334,66 @@ def test_delete_session_purges_session_and_graph_routing():
     session_gds.close.assert_called_once()
 
 
+class CountingSessions:
+    def __init__(self, *statuses):
+        self.statuses = dict(statuses)
+        self.listings = 0
+
+    def list(self):
+        self.listings += 1
+        return [
+            SimpleNamespace(name=name, status=status)
+            for name, status in self.statuses.items()
+        ]
+
+
+def test_session_lookups_reuse_one_listing_within_the_ttl():
+    now = [0.0]
+    sessions = CountingSessions(("mcp_analytics", "Ready"), ("mcp_old", "Failed"))
+    statuses = SessionStatusCache(sessions.list, ttl=30, clock=lambda: now[0])
+
+    assert statuses.exists("mcp_analytics")
+    assert not statuses.exists("mcp_old")
+    assert not statuses.exists("mcp_missing")
+    assert sessions.listings == 1
+
+    # A stale listing still answers while it is refreshed in the background
+    now[0] = 31.0
+    sessions.statuses["mcp_analytics"] = "Deleting"
+    assert statuses.exists("mcp_analytics")
+    for _ in range(100):
+        if sessions.listings == 2 and not statuses._refreshing:
+            break
+        time.sleep(0.01)
+    assert sessions.listings == 2
+
+    statuses.invalidate()
+    assert not statuses.exists("mcp_analytics")
+    assert sessions.listings == 3
+
+
+def test_dead_session_errors_force_a_fresh_listing():
+    sessions = CountingSessions(("mcp_analytics", "Ready"))
+    manager = SessionManager()
+    manager._sessions_client = sessions
+    cached = Mock()
+    manager._sessions["mcp_analytics"] = cached
+
+    assert manager.get_session("analytics") is cached
+    assert manager.get_session("analytics") is cached
+    assert sessions.listings == 1
+
+    manager.report_error(cached, RuntimeError("Invalid graph name"))
+    assert manager.get_session("analytics") is cached
+    assert sessions.listings == 1
+
+    del sessions.statuses["mcp_analytics"]
+    manager.report_error(cached, ServiceUnavailable("Connection refused"))
+    assert manager.get_session("analytics") is None
+    assert sessions.listings == 2
+    cached.close.assert_called_once()
+
+
 def test_create_base_gds_uses_driver_connection_for_versionless_aura(monkeypatch):
     class FakeGraphDataScience:
         def __init__(self, *args, **kwargs):
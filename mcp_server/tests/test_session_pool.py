@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from mcp_server_neo4j_gds.session_manager import SessionManager
+from mcp_server_neo4j_gds.session_pool import WarmSessionPool, parse_pool_sizes
+from mcp_server_neo4j_gds.session_state import SessionStateFile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeGdsSessions:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    def list(self):
+        return [
+            SimpleNamespace(
+                name=name,
+                status="Ready",
+                memory=memory,
+                created_at=None,
+                expiry_date=None,
+            )
+            for name, memory in self.created
+            if name not in self.deleted
+        ]
+
+    def get_or_create(self, **kwargs):
+        self.created.append((kwargs["session_name"], kwargs["memory"]))
+        return Mock()
+
+    def delete(self, session_name):
+        self.deleted.append(session_name)
+        return True
+
+
+def test_pool_sizes_are_parsed_leniently():
+    assert parse_pool_sizes("8:2, 16 ,x:1,32:0") == {8: 2, 16: 1}
+    assert parse_pool_sizes(None) == {}
+
+
+def test_pool_refills_after_claims_and_replaces_sessions_before_they_expire():
+    clock = FakeClock()
+    created, deleted = [], []
+
+    def create(name, memory_gb):
+        created.append(name)
+        return Mock()
+
+    pool = WarmSessionPool(
+        create, deleted.append, list, {8: 2}, ttl_seconds=100, clock=clock
+    )
+    pool.replenish()
+    assert pool.available() == {8: 2}
+
+    name, _ = pool.claim(8)
+    assert name == created[0] and name.startswith("mcp_pool_8gb_")
+    assert pool.claim(16) is None
+    pool.replenish()
+    assert (pool.available(), len(created)) == ({8: 2}, 3)
+
+    clock.now = 95
+    pool.replenish()
+    assert deleted == created[1:3]
+    assert pool.available() == {8: 2}
+
+    pool.stop()
+    assert deleted == created[1:]
+    assert pool.available() == {8: 0}
+
+
+def test_create_session_claims_a_warm_session_under_the_requested_name():
+    sessions = FakeGdsSessions()
+    manager = SessionManager()
+    manager._sessions_client = sessions
+    manager.set_connection("bolt://example", ("neo4j", "pw"))
+    manager._warm_pool = WarmSessionPool(
+        manager._create_aura_session,
+        lambda name: sessions.delete(session_name=name),
+        manager._unclaimed_session_names,
+        {8: 1},
+        ttl_seconds=3600,
+    )
+    manager._warm_pool.replenish()
+    pooled_name, pooled_memory = sessions.created[0]
+
+    session_gds = manager.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="analytics", memory_gb=8
+    )
+
+    assert len(sessions.created) == 1
+    assert manager.get_session("analytics") is session_gds
+    assert manager.list_sessions()["sessions"][0]["claimedAs"] == "mcp_analytics"
+    # Other sizes are still created on demand
+    manager.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="big", memory_gb=16
+    )
+    assert sessions.created[-1][0] == "mcp_big"
+
+    # A claimed pool session is no leftover for the next pool
+    assert pooled_name not in manager._unclaimed_session_names()
+
+    assert manager.delete_session("analytics")["deleted"]
+    assert sessions.deleted == [pooled_name]
+
+
+def test_sessions_provisioned_while_stopping_and_leftovers_are_deleted():
+    deleted = []
+    pool = None
+
+    def create(name, memory_gb):
+        # The server shuts down while the session is being provisioned
+        pool.stop()
+        return Mock()
+
+    pool = WarmSessionPool(
+        create,
+        deleted.append,
+        lambda: ["mcp_pool_8gb_old", "mcp_analytics"],
+        {8: 1},
+        ttl_seconds=3600,
+    )
+    pool.replenish()
+    assert len(deleted) == 1 and deleted[0].startswith("mcp_pool_8gb_")
+    assert pool.available() == {8: 0}
+
+    pool._delete_leftovers()
+    assert deleted[1:] == ["mcp_pool_8gb_old"]
+
+
+def test_claims_survive_restarts_and_the_pool_needs_a_state_file(tmp_path):
+    sessions = FakeGdsSessions()
+    state_file = SessionStateFile(str(tmp_path / "state.json"))
+    first_run = SessionManager(state_file=state_file)
+    first_run._sessions_client = sessions
+    first_run.set_connection("bolt://example", ("neo4j", "pw"))
+    first_run._warm_pool = WarmSessionPool(
+        first_run._create_aura_session,
+        lambda name: sessions.delete(session_name=name),
+        first_run._unclaimed_session_names,
+        {8: 1},
+        ttl_seconds=3600,
+    )
+    first_run._warm_pool.replenish()
+    pooled_name = sessions.created[0][0]
+    first_run.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="analytics", memory_gb=8
+    )
+
+    second_run = SessionManager(state_file=state_file)
+    second_run._sessions_client = sessions
+    assert pooled_name not in second_run._unclaimed_session_names()
+
+    without_state = SessionManager()
+    without_state.set_connection("bolt://example", ("neo4j", "pw"))
+    without_state.start_warm_pool({8: 1})
+    assert without_state._warm_pool is None
@@ -0,0 +1,131 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+from graphdatascience.session import SessionMemory
+
+from mcp_server_neo4j_gds import session_sizing
+from mcp_server_neo4j_gds.session_manager import SessionManager
+from mcp_server_neo4j_gds.session_sizing import (
+    next_tier,
+    projection_counts,
+    recommend_memory_gb,
+    smallest_tier,
+)
+
+
+class FakeGdsSessions:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    def list(self):
+        return [
+            SimpleNamespace(name=name, status="Ready")
+            for name, _ in self.created
+            if name not in self.deleted
+        ]
+
+    def get_or_create(self, **kwargs):
+        self.created.append((kwargs["session_name"], kwargs["memory"]))
+        return Mock()
+
+    def delete(self, session_name):
+        self.deleted.append(session_name)
+        return True
+
+
+def test_memory_sizes_round_up_to_session_tiers():
+    assert smallest_tier(5) == 8
+    assert smallest_tier(8) == 8
+    assert next_tier(8) == 16
+    assert next_tier(512) is None
+
+
+def test_projection_is_sized_from_counts_and_projectable_properties(monkeypatch):
+    counts = {":`Person`": 100, ":`Movie`": 20, "[r:`ACTED_IN`]": 300}
+    gds = Mock()
+    gds.run_cypher.side_effect = lambda query: pd.DataFrame(
+        {"count": [next(n for key, n in counts.items() if key in query)]}
+    )
+    monkeypatch.setattr(
+        session_sizing,
+        "get_projectable_properties",
+        lambda gds, labels, types: ({"roles": "toFloat(r.roles)"}, {"born": "INTEGER"}),
+    )
+
+    planned = projection_counts(gds, ["Person", "Movie"], ["ACTED_IN"])
+    assert planned == {
+        "nodeCount": 120,
+        "relationshipCount": 300,
+        "nodeLabelCount": 2,
+        "nodePropertyCount": 1,
+        "relationshipPropertyCount": 1,
+    }
+
+    sessions = Mock()
+    sessions.estimate.return_value = SessionMemory.m_16GB
+    assert recommend_memory_gb(sessions, planned, ["centrality"]) == 16
+    assert sessions.estimate.call_args.kwargs["node_count"] == 120
+    with pytest.raises(ValueError, match="Unknown algorithm category"):
+        recommend_memory_gb(sessions, planned, ["ranking"])
+
+
+@pytest.fixture
+def manager():
+    manager = SessionManager()
+    manager._sessions_client = FakeGdsSessions()
+    manager.set_connection("bolt://example", ("neo4j", "pw"))
+    return manager
+
+
+def test_resize_reprojects_graphs_into_a_larger_session(manager):
+    old_gds = manager.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="analytics", memory_gb=8
+    )
+    projection = {"cypherQuery": "MATCH ...", "undirectedRelationshipTypes": None}
+    manager.record_graph("g", "mcp_analytics", projection=projection)
+    manager.record_graph("unrecorded", "mcp_analytics")
+    manager.record_model("model", old_gds)
+    reprojected = []
+
+    assert "resize_session" in manager.resize_hint(
+        old_gds, Exception("Java heap space")
+    )
+    result = manager.resize_session(
+        "analytics", lambda gds, graph, p: reprojected.append((gds, graph, p))
+    )
+
+    new_gds = manager.get_session("analytics")
+    assert new_gds is not old_gds
+    assert reprojected == [(new_gds, "g", projection)]
+    assert result["memoryGB"] == 16
+    assert (result["droppedGraphs"], result["droppedModels"]) == (
+        ["unrecorded"],
+        ["model"],
+    )
+    assert manager.graph_sessions == {"g": "mcp_analytics"}
+    assert manager._sessions_client.deleted == ["mcp_analytics"]
+    new_name, new_memory = manager._sessions_client.created[-1]
+    assert new_name.startswith("mcp_analytics_16gb_") and "16GB" in str(new_memory)
+
+
+def test_failed_resize_keeps_the_old_session(manager):
+    old_gds = manager.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="analytics", memory_gb=8
+    )
+    manager.record_graph("g", "mcp_analytics", projection={"cypherQuery": "MATCH ..."})
+
+    def reproject(gds, graph, projection):
+        raise RuntimeError("Java heap space")
+
+    with pytest.raises(ValueError, match="left unchanged"):
+        manager.resize_session("analytics", reproject, memory_gb=20)
+
+    new_name = manager._sessions_client.created[-1][0]
+    assert new_name.startswith("mcp_analytics_24gb_")
+    assert manager._sessions_client.deleted == [new_name]
+    assert manager.get_session("analytics") is old_gds
+    with pytest.raises(ValueError, match="only moves to larger"):
+        manager.resize_session("analytics", reproject, memory_gb=4)
@@ -0,0 +1,100 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pandas as pd
+
+from mcp_server_neo4j_gds.session_manager import SessionManager
+from mcp_server_neo4j_gds.session_state import SessionStateFile, empty_state
+
+
+class FakeGdsSessions:
+    def __init__(self, *alive):
+        self.alive = list(alive)
+        self.attached = []
+
+    def list(self):
+        return [SimpleNamespace(name=name, status="Ready") for name in self.alive]
+
+    def get_or_create(self, **kwargs):
+        self.attached.append((kwargs["session_name"], kwargs["memory"]))
+        return Mock()
+
+
+def test_state_file_round_trips_and_ignores_unreadable_files(tmp_path):
+    path = tmp_path / "state" / "gds-agent.json"
+    state_file = SessionStateFile(str(path))
+
+    assert state_file.load() == empty_state()
+    state = {"sessions": {"mcp_a": {"memoryGB": 8}}, "graphs": {"g": "mcp_a"}}
+    state_file.save({**state, "models": {}})
+    assert state_file.load() == {**state, "models": {}, "projections": {}}
+    assert [p.name for p in path.parent.iterdir()] == ["gds-agent.json"]
+
+    path.write_text("{not json")
+    assert state_file.load()["sessions"] == {}
+
+
+def test_restarted_manager_resumes_graphs_and_reattaches_sessions(tmp_path):
+    state_file = SessionStateFile(str(tmp_path / "state.json"))
+    sessions = FakeGdsSessions()
+    first_run = SessionManager(state_file=state_file)
+    first_run._sessions_client = sessions
+    session_gds = first_run.create_or_get_session(
+        "bolt://example", ("neo4j", "pw"), session_name="analytics", memory_gb=16
+    )
+    sessions.alive.append("mcp_analytics")
+    first_run.record_graph("g", "mcp_analytics")
+    first_run.record_model("model", session_gds)
+    first_run.close()
+
+    stored = json.loads((tmp_path / "state.json").read_text())
+    assert stored["graphs"] == {"g": "mcp_analytics"}
+    assert stored["models"] == {"model": "mcp_analytics"}
+
+    second_run = SessionManager(state_file=state_file)
+    second_run._sessions_client = sessions
+    second_run.set_connection("bolt://example", ("neo4j", "pw"))
+
+    assert second_run.active_sessions() == []
+    assert second_run.session_for_graph("g") == "mcp_analytics"
+    assert [name for name, _ in second_run.active_sessions()] == ["mcp_analytics"]
+    assert sessions.attached[-1][0] == "mcp_analytics"
+    assert "16GB" in str(sessions.attached[-1][1])
+
+
+def test_sessions_gone_from_aura_are_dropped_from_the_state(tmp_path):
+    state_file = SessionStateFile(str(tmp_path / "state.json"))
+    state_file.save(
+        {
+            "sessions": {"mcp_gone": {"memoryGB": 8}},
+            "graphs": {"g": "mcp_gone"},
+            "models": {"m": "mcp_gone"},
+        }
+    )
+    manager = SessionManager(state_file=state_file)
+    manager._sessions_client = FakeGdsSessions()
+    manager.set_connection("bolt://example", ("neo4j", "pw"))
+
+    assert manager.get_session("mcp_gone") is None
+    assert manager.session_for_graph("g") is None
+    assert state_file.load() == empty_state()
+
+
+def test_resume_attaches_recorded_sessions_and_maps_their_graphs(tmp_path):
+    state_file = SessionStateFile(str(tmp_path / "state.json"))
+    state_file.save({**empty_state(), "sessions": {"mcp_a": {"memoryGB": 8}}})
+
+    class ListingSessions(FakeGdsSessions):
+        def get_or_create(self, **kwargs):
+            gds = super().get_or_create(**kwargs)
+            gds.graph.list.return_value = pd.DataFrame({"graphName": ["g1", "g2"]})
+            return gds
+
+    manager = SessionManager(state_file=state_file)
+    manager._sessions_client = ListingSessions("mcp_a")
+    manager.set_connection("bolt://example", ("neo4j", "pw"))
+    manager.resume_in_background().join()
+
+    assert [name for name, _ in manager.active_sessions()] == ["mcp_a"]
+    assert manager.graph_sessions == {"g1": "mcp_a", "g2": "mcp_a"}
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+
+import pytest
+
+from mcp_server_neo4j_gds.tool_executor import (
+    ServerBusyError,
+    ToolExecutor,
+    ToolTimeoutError,
+    parse_tool_timeouts,
+    parse_tool_weights,
+    released_worker_slots,
+)
+
+
+def blocking_call(started, release):
+    started.set()
+    release.wait(5)
+    return "done"
+
+
+def test_heavy_tools_take_more_slots_and_weights_are_configurable():
+    executor = ToolExecutor(
+        workers=8, queue_size=1, queue_timeout=1, weights={"fast_rp": 20}
+    )
+
+    assert executor.weight("pagerank") == 1
+    assert executor.weight("all_pairs_shortest_paths") == 4
+    assert executor.weight("fast_rp") == 8
+    assert parse_tool_weights("node2vec=2, bad, pagerank=x") == {"node2vec": 2}
+
+
+def test_full_pool_queues_then_rejects_calls():
+    async def scenario():
+        executor = ToolExecutor(workers=1, queue_size=1, queue_timeout=5)
+        started, release = threading.Event(), threading.Event()
+
+        running = asyncio.create_task(
+            executor.run("pagerank", blocking_call, started, release)
+        )
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.create_task(executor.run("pagerank", lambda: "queued"))
+        await asyncio.sleep(0)
+        assert executor.stats()["queued"] == 1
+
+        with pytest.raises(ServerBusyError, match="Server is busy"):
+            await executor.run("pagerank", lambda: "rejected")
+
+        release.set()
+        assert await running == "done"
+        assert await queued == "queued"
+        stats = executor.stats()
+        assert stats["slotsInUse"] == 0
+        assert stats["rejected"] == 1
+        assert stats["peakQueued"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_queued_call_times_out_and_frees_its_place():
+    async def scenario():
+        executor = ToolExecutor(workers=1, queue_size=4, queue_timeout=0.05)
+        started, release = threading.Event(), threading.Event()
+
+        running = asyncio.create_task(
+            executor.run("pagerank", blocking_call, started, release)
+        )
+        await asyncio.to_thread(started.wait, 5)
+        with pytest.raises(ServerBusyError, match="waited"):
+            await executor.run("louvain", lambda: None)
+        assert executor.stats()["queued"] == 0
+
+        release.set()
+        await running
+        assert await executor.run("louvain", lambda: "ok") == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_call_is_stopped_and_keeps_its_slots_until_it_returns():
+    async def scenario():
+        executor = ToolExecutor(
+            workers=1, queue_size=1, queue_timeout=5, timeouts={"louvain": 0.05}
+        )
+        started, release = threading.Event(), threading.Event()
+        stopped = threading.Event()
+
+        with pytest.raises(ToolTimeoutError, match="did not finish within 0.05s"):
+            await executor.run(
+                "louvain", blocking_call, started, release, on_cancel=stopped.set
+            )
+        assert await asyncio.to_thread(stopped.wait, 5)
+        assert executor.stats()["slotsInUse"] == 1
+
+        release.set()
+        assert await executor.run("pagerank", lambda: "ok") == "ok"
+        assert executor.stats()["runTimeouts"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_request_stops_the_running_call():
+    async def scenario():
+        executor = ToolExecutor(workers=2, queue_size=1, queue_timeout=5)
+        started, release = threading.Event(), threading.Event()
+        stopped = threading.Event()
+
+        call = asyncio.create_task(
+            executor.run(
+                "pagerank", blocking_call, started, release, on_cancel=stopped.set
+            )
+        )
+        await asyncio.to_thread(started.wait, 5)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert await asyncio.to_thread(stopped.wait, 5)
+        release.set()
+        assert executor.stats()["cancelled"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_call_waiting_with_released_slots_lets_queued_calls_run():
+    async def scenario():
+        executor = ToolExecutor(workers=1, queue_size=1, queue_timeout=5)
+        started, release = threading.Event(), threading.Event()
+
+        def waiting_for_memory():
+            with released_worker_slots():
+                started.set()
+                release.wait(5)
+            return "admitted"
+
+        waiting = asyncio.create_task(executor.run("pagerank", waiting_for_memory))
+        await asyncio.to_thread(started.wait, 5)
+        assert await executor.run("louvain", lambda: "ran") == "ran"
+
+        release.set()
+        assert await waiting == "admitted"
+        assert executor._available == 1
+
+    asyncio.run(scenario())
+
+
+def test_tool_timeouts_fall_back_to_the_global_timeout():
+    executor = ToolExecutor(
+        workers=1, timeout=60, timeouts=parse_tool_timeouts("node2vec=600")
+    )
+
+    assert executor.timeout_for("node2vec") == 600
+    assert executor.timeout_for("pagerank") == 60
@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 import pandas as pd
 from anyio import BrokenResourceError
@@ -7,6 +10,24 @@ from starlette.testclient import TestClient
 from mcp_server_neo4j_gds import server as server_module
 
 
+class FakeToolExecutor:
+    shut_down = False
+
+    def stats(self):
+        return {"running": 0}
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+class AsyncClosable:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
 def test_normalize_transport_accepts_http_aliases():
     assert server_module.normalize_transport("stdio") == "stdio"
     assert server_module.normalize_transport("http") == "streamable-http"
@@ -73,6 +94,44 @@ def test_serialize_result_truncates_large_text(monkeypatch):
     assert "[truncated 10 characters]" in result
 
 
+def test_serialize_result_encodes_csv_json_and_markdown():
+    frame = pd.DataFrame({"nodeId": [1, 2], "nodeName": ["a|b", None]})
+
+    assert server_module.serialize_result(frame, "csv") == "nodeId,nodeName\n1,a|b\n2,"
+    assert json.loads(server_module.serialize_result(frame, "json")) == {
+        "rowCount": 2,
+        "columns": {"nodeId": [1, 2], "nodeName": ["a|b", None]},
+    }
+    assert server_module.serialize_result(frame, "markdown").splitlines() == [
+        "| nodeId | nodeName |",
+        "| --- | --- |",
+        "| 1 | a\\|b |",
+        "| 2 |  |",
+    ]
+
+
+def test_serialize_result_stops_encoding_at_character_limit(monkeypatch):
+    monkeypatch.setenv("GDS_AGENT_MAX_RESULT_CHARS", "40")
+    monkeypatch.setenv("GDS_AGENT_OUTPUT_FORMAT", "csv")
+    frame = pd.DataFrame({"embedding": [[0.5] * 3] * 10})
+
+    result = server_module.serialize_result(frame)
+
+    assert result.splitlines() == [
+        "embedding",
+        '"[0.5, 0.5, 0.5]"',
+        "[truncated to 1 of 10 rows to stay within 40 characters]",
+    ]
+    data = json.loads(server_module.serialize_result(frame, "json"))
+    assert data["rowCount"] < 10
+    assert "truncated to" in data["warning"]
+
+
+def test_serialize_result_rejects_unknown_output_format():
+    with pytest.raises(ValueError, match="Unsupported output format 'xml'"):
+        server_module.serialize_result(pd.DataFrame({"a": [1]}), "xml")
+
+
 @pytest.mark.asyncio
 async def test_main_dispatches_http_transport_and_closes_resources(monkeypatch):
     fake_server = Server("test", version="1")
@@ -87,10 +146,18 @@ async def test_main_dispatches_http_transport_and_closes_resources(monkeypatch):
 
     fake_session_manager = Closable()
     fake_base_gds = Closable()
+    fake_async_cypher = AsyncClosable()
+    fake_tool_executor = FakeToolExecutor()
 
     def fake_create_mcp_server(db_url, username, password, database):
         calls["create"] = (db_url, username, password, database)
-        return fake_server, fake_session_manager, fake_base_gds
+        return (
+            fake_server,
+            fake_session_manager,
+            fake_base_gds,
+            fake_async_cypher,
+            fake_tool_executor,
+        )
 
     async def fake_run_streamable_http_server(server, host, port, path):
         calls["http"] = (server, host, port, path)
@@ -119,6 +186,8 @@ async def test_main_dispatches_http_transport_and_closes_resources(monkeypatch):
     assert "stdio" not in calls
     assert fake_session_manager.closed
     assert fake_base_gds.closed
+    assert fake_async_cypher.closed
+    assert fake_tool_executor.shut_down
 
 
 @pytest.mark.asyncio
@@ -131,7 +200,7 @@ async def test_main_treats_stdio_broken_resource_as_disconnect(monkeypatch):
             calls["closed"] = calls.get("closed", 0) + 1
 
     def fake_create_mcp_server(db_url, username, password, database):
-        return fake_server, Closable(), Closable()
+        return fake_server, Closable(), Closable(), AsyncClosable(), FakeToolExecutor()
 
     async def fake_run_stdio_server(server):
         raise ExceptionGroup("stdio failed", [BrokenResourceError()])
@@ -154,7 +223,7 @@ async def test_main_defaults_to_stdio_transport(monkeypatch):
             calls["closed"] = calls.get("closed", 0) + 1
 
     def fake_create_mcp_server(db_url, username, password, database):
-        return fake_server, Closable(), Closable()
+        return fake_server, Closable(), Closable(), AsyncClosable(), FakeToolExecutor()
 
     async def fake_run_streamable_http_server(server, host, port, path):
         calls["http"] = (server, host, port, path)
@@ -173,3 +242,23 @@ async def test_main_defaults_to_stdio_transport(monkeypatch):
     assert calls["stdio"] is fake_server
     assert "http" not in calls
     assert calls["closed"] == 2
+
+
+def test_async_driver_is_replaced_and_closed_when_the_event_loop_changes(monkeypatch):
+    drivers = []
+
+    def fake_driver(url, auth):
+        drivers.append(AsyncClosable())
+        return drivers[-1]
+
+    monkeypatch.setattr(server_module.AsyncGraphDatabase, "driver", fake_driver)
+    connection = server_module.AsyncNeo4jDriverConnection(
+        "bolt://example", "neo4j", "pw"
+    )
+
+    first = asyncio.run(connection._get_driver())
+    second = asyncio.run(connection._get_driver())
+
+    assert first is not second and first.closed and not second.closed
+    asyncio.run(connection.close())
+    assert second.closed